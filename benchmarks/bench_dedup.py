@@ -0,0 +1,53 @@
+"""Micro-benchmarks for Deduplicator.
+
+Compares looking up message IDs in a bounded ``deque``, which scans all
+remembered IDs, against ``Deduplicator``, for a stream of IDs where every
+tenth ID is a duplicate.
+
+Run with ``python benchmarks/bench_dedup.py``.
+"""
+
+from collections import deque
+import timeit
+
+from aiontfy import Deduplicator
+
+NUMBER = 5
+IDS = [f"id{i if i % 10 else i - 5}" for i in range(20_000)]
+
+
+def scan(size: int) -> int:
+    """Deduplicate with a bounded deque."""
+    recent: deque[str] = deque(maxlen=size)
+    hits = 0
+    for key in IDS:
+        if key in recent:
+            hits += 1
+            continue
+        recent.append(key)
+    return hits
+
+
+def ring(size: int) -> int:
+    """Deduplicate with a Deduplicator."""
+    dedup = Deduplicator(size)
+    for key in IDS:
+        dedup.seen(key)
+    return dedup.hits
+
+
+def main() -> None:
+    """Run benchmarks."""
+    for size in (100, 1000, 10_000):
+        assert scan(size) == ring(size)  # noqa: S101
+        deque_time = timeit.timeit(lambda: scan(size), number=NUMBER)  # noqa: B023
+        dedup_time = timeit.timeit(lambda: ring(size), number=NUMBER)  # noqa: B023
+        print(
+            f"size {size:>6}: deque {deque_time / NUMBER / len(IDS) * 1e9:8.1f} ns, "
+            f"Deduplicator {dedup_time / NUMBER / len(IDS) * 1e9:6.1f} ns per ID "
+            f"({deque_time / dedup_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
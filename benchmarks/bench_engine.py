@@ -0,0 +1,109 @@
+"""Benchmark the multi-process publish engine against a single event loop.
+
+Starts several local HTTP server processes answering like ntfy on one port
+and publishes messages from one event loop and from engines with a growing
+number of worker processes. Also reports the rate at which the calling
+process can pickle messages and unpickle results, the upper bound of the
+engine's throughput no matter how many cores are available.
+
+Run with ``python benchmarks/bench_engine.py``.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import pickle
+import socket
+import time
+
+from aiohttp import web
+
+from aiontfy import Message, Notification, Ntfy, PublishEngine
+
+MESSAGES = 20000
+CONCURRENCY = 50
+SERVER_PROCESSES = max(1, (os.cpu_count() or 2) // 2)
+
+RESPONSE = """{"id": "h6Y2hKA5sy0U", "time": 1743184726, "event": "message", "topic": "bench", "message": "Hello"}"""
+
+
+async def handle_publish(request: web.Request) -> web.Response:
+    """Answer a publish request."""
+    await request.read()
+    return web.Response(text=RESPONSE, content_type="application/json")
+
+
+def serve(port: int) -> None:
+    """Run a server process sharing the port with the other server processes."""
+    app = web.Application()
+    app.router.add_post("/", handle_publish)
+    web.run_app(app, host="127.0.0.1", port=port, reuse_port=True, print=None)
+
+
+def free_port() -> int:
+    """Return a free TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def single_loop(url: str, messages: list[Message]) -> float:
+    """Publish from one event loop and return messages per second."""
+    async with Ntfy(url) as ntfy:
+        start = time.perf_counter()
+        await ntfy.publish_many(messages, max_concurrency=CONCURRENCY)
+        return len(messages) / (time.perf_counter() - start)
+
+
+def parent_bound(messages: list[Message]) -> float:
+    """Return messages per second the calling process can pass to workers."""
+    chunk = messages[:500]
+    results = pickle.dumps([Notification.from_json(RESPONSE)] * len(chunk))
+    start = time.perf_counter()
+    for _ in range(len(messages) // len(chunk)):
+        pickle.dumps(chunk)
+        pickle.loads(results)  # noqa: S301
+    return len(messages) / (time.perf_counter() - start)
+
+
+async def engine(url: str, messages: list[Message], processes: int) -> float:
+    """Publish from an engine and return messages per second."""
+    async with PublishEngine(
+        url, processes=processes, max_concurrency=CONCURRENCY
+    ) as publish_engine:
+        await publish_engine.publish_many(messages[:processes])
+        start = time.perf_counter()
+        await publish_engine.publish_many(messages)
+        return len(messages) / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    """Run benchmark."""
+    port = free_port()
+    servers = [
+        multiprocessing.Process(target=serve, args=(port,), daemon=True)
+        for _ in range(SERVER_PROCESSES)
+    ]
+    for server in servers:
+        server.start()
+    await asyncio.sleep(1)
+
+    url = f"http://127.0.0.1:{port}"
+    messages = [
+        Message(topic="bench", message=str(i), title="Title", tags=["tag"])
+        for i in range(MESSAGES)
+    ]
+    try:
+        print(f"cpu count:    {os.cpu_count():8d}")
+        print(f"parent bound: {parent_bound(messages):8.0f} msg/s")
+        print(f"single loop:  {await single_loop(url, messages):8.0f} msg/s")
+        for processes in (1, 2, 4):
+            throughput = await engine(url, messages, processes)
+            print(f"{processes} processes: {throughput:8.0f} msg/s")
+    finally:
+        for server in servers:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
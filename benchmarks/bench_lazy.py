@@ -0,0 +1,89 @@
+"""Micro-benchmarks for LazyNotification.
+
+Compares decoding a received notification with ``Notification.from_json``
+against wrapping it with ``LazyNotification.from_json``, when only a few
+fields are read and when all fields are read.
+
+Run with ``python benchmarks/bench_lazy.py``.
+"""
+
+import timeit
+
+import orjson
+
+from aiontfy import LazyNotification, Notification
+
+NUMBER = 20_000
+
+DATA = orjson.dumps(
+    {
+        "id": "h6Y2hKA5sy0U",
+        "time": 1743184726,
+        "expires": 1743227926,
+        "event": "message",
+        "topic": "alerts",
+        "message": "Front door opened",
+        "title": "Door",
+        "tags": ["door", "warning"],
+        "priority": 4,
+        "click": "https://example.com/click",
+        "icon": "https://example.com/icon.png",
+        "actions": [
+            {"action": "view", "label": "Open", "url": "https://example.com/"},
+            {"action": "broadcast", "label": "Take picture", "clear": True},
+        ],
+        "attachment": {
+            "name": "image.jpg",
+            "url": "https://example.com/file/image.jpg",
+            "type": "image/jpeg",
+            "size": 1024,
+            "expires": 1743227926,
+        },
+        "sequence_id": "Mc3otamDNcpJ",
+    }
+)
+FIELDS = [
+    "id",
+    "time",
+    "expires",
+    "event",
+    "topic",
+    "message",
+    "title",
+    "tags",
+    "priority",
+    "click",
+    "icon",
+    "actions",
+    "attachment",
+    "sequence_id",
+]
+
+
+def read_few(cls: type[Notification | LazyNotification]) -> None:
+    """Decode a notification and read topic and message."""
+    notification = cls.from_json(DATA)
+    _ = notification.topic, notification.message
+
+
+def read_all(cls: type[Notification | LazyNotification]) -> None:
+    """Decode a notification and read all fields."""
+    notification = cls.from_json(DATA)
+    for name in FIELDS:
+        getattr(notification, name)
+
+
+def main() -> None:
+    """Run benchmarks."""
+    for func in (read_few, read_all):
+        eager = timeit.timeit(lambda: func(Notification), number=NUMBER)  # noqa: B023
+        lazy = timeit.timeit(lambda: func(LazyNotification), number=NUMBER)  # noqa: B023
+        print(
+            f"{func.__name__}: Notification {eager / NUMBER * 1e6:6.2f} µs, "
+            f"LazyNotification {lazy / NUMBER * 1e6:6.2f} µs "
+            f"({eager / lazy:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
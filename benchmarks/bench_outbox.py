@@ -0,0 +1,69 @@
+"""Benchmark publish throughput with and without the durable outbox.
+
+Starts a local HTTP server answering like ntfy and publishes messages
+concurrently, once directly and once through a SQLite outbox. Group commit
+lets concurrent publishes share one fsync.
+
+Run with ``python benchmarks/bench_outbox.py``.
+"""
+
+import asyncio
+from pathlib import Path
+import tempfile
+import time
+
+from aiohttp import web
+
+from aiontfy import Message, Ntfy, Outbox
+
+MESSAGES = 2000
+CONCURRENCY = 100
+LATENCY = 0.001
+
+RESPONSE = """{"id": "h6Y2hKA5sy0U", "time": 1743184726, "event": "message", "topic": "bench", "message": "Hello"}"""
+
+
+async def handle_publish(request: web.Request) -> web.Response:
+    """Answer a publish request after simulating server latency."""
+    await request.read()
+    await asyncio.sleep(LATENCY)
+    return web.Response(text=RESPONSE, content_type="application/json")
+
+
+async def run(url: str, outbox: Outbox | None) -> float:
+    """Publish messages and return the throughput in messages per second."""
+    messages = [Message(topic="bench", message=str(i)) for i in range(MESSAGES)]
+
+    async with Ntfy(url, outbox=outbox) as ntfy:
+        start = time.perf_counter()
+        await ntfy.publish_many(messages, max_concurrency=CONCURRENCY)
+        return MESSAGES / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    """Run benchmark."""
+    app = web.Application()
+    app.router.add_post("/", handle_publish)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+    try:
+        throughput = await run(url, None)
+        print(f"direct: {throughput:8.0f} msg/s")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            async with Outbox(Path(tmp) / "outbox.db") as outbox:
+                throughput = await run(url, outbox)
+                print(
+                    f"outbox: {throughput:8.0f} msg/s "
+                    f"({outbox.commits} commits for {MESSAGES} messages)"
+                )
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
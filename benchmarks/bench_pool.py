@@ -0,0 +1,60 @@
+"""Benchmark publish throughput at different connection pool sizes.
+
+Starts a local HTTP server answering like ntfy with a small delay and
+publishes messages concurrently through clients with different pool limits.
+
+Run with ``python benchmarks/bench_pool.py``.
+"""
+
+import asyncio
+import time
+
+from aiohttp import web
+
+from aiontfy import Message, Ntfy
+
+MESSAGES = 2000
+CONCURRENCY = 200
+LATENCY = 0.005
+POOL_SIZES = [1, 10, 50, 100, 200]
+
+RESPONSE = """{"id": "h6Y2hKA5sy0U", "time": 1743184726, "event": "message", "topic": "bench", "message": "Hello"}"""
+
+
+async def handle_publish(request: web.Request) -> web.Response:
+    """Answer a publish request after simulating server latency."""
+    await request.read()
+    await asyncio.sleep(LATENCY)
+    return web.Response(text=RESPONSE, content_type="application/json")
+
+
+async def run(url: str, pool_limit: int) -> float:
+    """Publish messages and return the throughput in messages per second."""
+    messages = [Message(topic="bench", message=str(i)) for i in range(MESSAGES)]
+
+    async with Ntfy(url, pool_limit=pool_limit, pool_limit_per_host=pool_limit) as ntfy:
+        start = time.perf_counter()
+        await ntfy.publish_many(messages, max_concurrency=CONCURRENCY)
+        return MESSAGES / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    """Run benchmark."""
+    app = web.Application()
+    app.router.add_post("/", handle_publish)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    try:
+        for pool_limit in POOL_SIZES:
+            throughput = await run(f"http://127.0.0.1:{port}", pool_limit)
+            print(f"pool_limit={pool_limit:4}: {throughput:8.0f} msg/s")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+"""Benchmark the per-call overhead of SyncNtfy against asyncio.run.
+
+Starts a local HTTP server answering like ntfy in a background thread and
+publishes messages from synchronous code, once with a new event loop and
+client per message and once through a persistent SyncNtfy client.
+
+Run with ``python benchmarks/bench_sync.py``.
+"""
+
+import asyncio
+import threading
+import time
+
+from aiohttp import web
+
+from aiontfy import Message, Ntfy, SyncNtfy
+
+MESSAGES = 500
+
+RESPONSE = """{"id": "h6Y2hKA5sy0U", "time": 1743184726, "event": "message", "topic": "bench", "message": "Hello"}"""
+
+
+async def handle_publish(request: web.Request) -> web.Response:
+    """Answer a publish request."""
+    await request.read()
+    return web.Response(text=RESPONSE, content_type="application/json")
+
+
+def start_server() -> str:
+    """Start the server on a background loop and return its URL."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
+    async def start() -> str:
+        app = web.Application()
+        app.router.add_post("/", handle_publish)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        return f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+    return asyncio.run_coroutine_threadsafe(start(), loop).result()
+
+
+async def publish_once(url: str, message: Message) -> None:
+    """Publish a single message with a new client."""
+    async with Ntfy(url) as ntfy:
+        await ntfy.publish(message)
+
+
+def main() -> None:
+    """Run benchmark."""
+    url = start_server()
+    message = Message(topic="bench", message="Hello")
+
+    start = time.perf_counter()
+    for _ in range(MESSAGES):
+        asyncio.run(publish_once(url, message))
+    per_call = (time.perf_counter() - start) / MESSAGES
+    print(f"asyncio.run per call: {per_call * 1e6:8.0f} µs")
+
+    with SyncNtfy(url) as ntfy:
+        start = time.perf_counter()
+        for _ in range(MESSAGES):
+            ntfy.publish(message)
+        per_call = (time.perf_counter() - start) / MESSAGES
+    print(f"SyncNtfy per call:    {per_call * 1e6:8.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark MessageTemplate against serializing a Message per publish.
+
+Run with ``python benchmarks/bench_template.py``.
+"""
+
+import json
+import timeit
+
+from yarl import URL
+
+from aiontfy import Message, MessageTemplate, ViewAction
+
+NUMBER = 100_000
+
+FIXED = {
+    "topic": "alerts",
+    "priority": 4,
+    "click": URL("https://example.com/"),
+    "icon": URL("https://example.com/icon.png"),
+    "actions": [ViewAction(label="Open", url=URL("https://example.com/dashboard"))],
+    "markdown": True,
+}
+
+
+def message_to_dict() -> None:
+    """Build a message and encode it like `Ntfy.publish` does."""
+    json.dumps(
+        Message(**FIXED, message="Disk full", title="host1", tags=["warning"]).to_dict()
+    )
+
+
+template = MessageTemplate(Message(**FIXED))
+
+
+def template_render() -> None:
+    """Render a message from a precompiled template."""
+    template.render(message="Disk full", title="host1", tags=["warning"])
+
+
+def main() -> None:
+    """Run benchmark."""
+    baseline = min(timeit.repeat(message_to_dict, number=NUMBER, repeat=5))
+    rendered = min(timeit.repeat(template_render, number=NUMBER, repeat=5))
+
+    print(f"Message.to_dict + json.dumps: {baseline / NUMBER * 1e6:8.2f} µs/msg")
+    print(f"MessageTemplate.render:       {rendered / NUMBER * 1e6:8.2f} µs/msg")
+    print(f"Speedup:                      {baseline / rendered:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Micro-benchmarks for Message.to_x_headers.
+
+Compares the previous serialization via ``to_dict()`` with the cached
+serialization, for messages with many actions and headers.
+
+Run with ``python benchmarks/bench_x_headers.py``.
+"""
+
+import timeit
+
+from yarl import URL
+
+from aiontfy import BroadcastAction, HttpAction, Message, ViewAction
+from aiontfy.types import X_HEADERS
+
+NUMBER = 20_000
+
+ACTIONS = [
+    ViewAction(label="Open", url=URL("https://example.com/"), clear=True),
+    HttpAction(
+        label="Close door",
+        url=URL("https://api.example.com/close"),
+        headers={"Authorization": "Bearer x", "X-Request": "1"},
+        body='{"door": "front"}',
+    ),
+    BroadcastAction(label="Take picture", extras={"cmd": "pic", "camera": "front"}),
+]
+
+
+def make_message() -> Message:
+    """Build a message with many actions and headers."""
+    return Message(
+        topic="alerts",
+        message="Front door opened\nat 12:00",
+        title="Door",
+        tags=["door", "warning"],
+        priority=4,
+        actions=ACTIONS,
+        click=URL("https://example.com/click"),
+        icon=URL("https://example.com/icon.png"),
+        filename="snapshot.jpg",
+        sequence_id="door-front",
+    )
+
+
+def to_x_headers_uncached(message: Message) -> dict[str, str]:
+    """Serialize X- headers like before caching was added."""
+    result = {}
+    for key, value in message.to_dict().items():
+        if value is None or value == [] or key not in X_HEADERS:
+            continue
+        if key == "actions":
+            actions = []
+            for action in value:
+                params = []
+                for action_key, action_value in action.items():
+                    if action_value is None:
+                        continue
+                    if isinstance(action_value, bool):
+                        params.append(f"{action_key}={int(action_value)}")
+                    elif isinstance(action_value, dict):
+                        params.extend(
+                            f"{action_key}.{subkey}={subvalue!r}"
+                            for subkey, subvalue in action_value.items()
+                        )
+                    else:
+                        params.append(f"{action_key}={str(action_value)!r}")
+                actions.append(", ".join(params))
+            result[X_HEADERS[key]] = "; ".join(actions)
+        elif isinstance(value, list):
+            result[X_HEADERS[key]] = ",".join(value)
+        elif isinstance(value, bool):
+            result[X_HEADERS[key]] = str(int(value))
+        else:
+            result[X_HEADERS[key]] = (
+                str(value)
+                .replace("\\", "\\\\")
+                .replace("\r", "\\r")
+                .replace("\n", "\\n")
+            )
+    return result
+
+
+def main() -> None:
+    """Run benchmarks."""
+    message = make_message()
+    assert to_x_headers_uncached(message) == message.to_x_headers()  # noqa: S101
+
+    benchmarks = {
+        "to_dict based (before)": lambda: to_x_headers_uncached(message),
+        "new message, shared actions": lambda: make_message().to_x_headers(),
+        "cached, same message": message.to_x_headers,
+    }
+    for name, func in benchmarks.items():
+        elapsed = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:28} {elapsed / NUMBER * 1e6:8.2f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,19 @@
 """Async ntfy client library."""
 
+from .coalesce import Coalescer
 from .const import __version__
+from .dedup import Deduplicator
+from .dispatch import Dispatcher
+from .engine import PublishEngine
 from .ntfy import Ntfy
+from .outbox import Outbox
+from .pool import HashRing, NtfyPool
+from .ratelimit import RateLimiter
+from .retry import CircuitBreaker, CircuitState, RetryPolicy
+from .scheduler import ScheduledPublish, Scheduler
+from .subscription import SubscriptionManager
+from .sync import SyncNtfy
+from .template import MessageTemplate
 from .types import (
     Account,
     AccountBilling,
@@ -10,19 +22,23 @@ from .types import (
     AccountTier,
     AccountTokenResponse,
     Attachment,
+    AttachmentData,
     BroadcastAction,
     CopyAction,
     DeleteAfter,
     Event,
     Everyone,
     HttpAction,
+    LazyNotification,
     Message,
     Notification,
     Priority,
+    QueueFullPolicy,
     Reservation,
     Response,
     Sound,
     Stats,
+    Transport,
     Version,
     ViewAction,
 )
@@ -35,20 +51,40 @@ __all__ = [
     "AccountTier",
     "AccountTokenResponse",
     "Attachment",
+    "AttachmentData",
     "BroadcastAction",
+    "CircuitBreaker",
+    "CircuitState",
+    "Coalescer",
     "CopyAction",
+    "Deduplicator",
     "DeleteAfter",
+    "Dispatcher",
     "Event",
     "Everyone",
+    "HashRing",
     "HttpAction",
+    "LazyNotification",
     "Message",
+    "MessageTemplate",
     "Notification",
     "Ntfy",
+    "NtfyPool",
+    "Outbox",
     "Priority",
+    "PublishEngine",
+    "QueueFullPolicy",
+    "RateLimiter",
     "Reservation",
     "Response",
+    "RetryPolicy",
+    "ScheduledPublish",
+    "Scheduler",
     "Sound",
     "Stats",
+    "SubscriptionManager",
+    "SyncNtfy",
+    "Transport",
     "Version",
     "ViewAction",
     "__version__",
@@ -0,0 +1,165 @@
+"""Publish deduplication and coalescing for aiontfy."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .types import Message
+
+
+@dataclass(kw_only=True)
+class _Pending[T]:
+    """Duplicates collected in the window opened by a published message."""
+
+    future: asyncio.Future[T]
+    handle: asyncio.TimerHandle
+    message: Message | None = None
+    count: int = 0
+    waiters: int = 0
+
+
+class Coalescer[T]:
+    """Collapse identical messages published within a time window.
+
+    Messages are identical if they have the same topic and `sequence_id`, or
+    the same topic and content if they have no `sequence_id`. A message is
+    published immediately and opens a window; identical messages arriving
+    until the window closes are collapsed into one request sent when it
+    closes, which opens the next window. Publishers of collapsed messages
+    receive the same result, usually the `Notification`. For messages with a
+    `sequence_id`, the latest message within the window is published. The
+    window closes early once `max_count` messages were collapsed.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[Message], Awaitable[T]],
+        window: float,
+        *,
+        count_duplicates: bool = False,
+        max_count: int | None = None,
+    ) -> None:
+        """Initialize coalescer.
+
+        Parameters
+        ----------
+        publish : Callable[[Message], Awaitable[T]]
+            Coroutine function publishing the collapsed message, e.g.
+            `Ntfy.publish`.
+        window : float
+            Seconds identical messages are collected before publishing.
+        count_duplicates : bool, optional
+            Append the number of collapsed messages to the message body, e.g.
+            "Disk full (3x)". Defaults to False.
+        max_count : int, optional
+            Publish as soon as this many identical messages were collected,
+            without waiting for the window to close. Defaults to None for no
+            limit.
+
+        Raises
+        ------
+        ValueError
+            If `max_count` is less than 1.
+        """
+        if max_count is not None and max_count < 1:
+            msg = "max_count must be at least 1"
+            raise ValueError(msg)
+
+        self._publish = publish
+        self._window = window
+        self._count_duplicates = count_duplicates
+        self._max_count = max_count
+        self._pending: dict[Hashable, _Pending[T]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.published = 0
+        self.collapsed = 0
+
+    @staticmethod
+    def key(message: Message) -> Hashable:
+        """Return the key identifying identical messages."""
+        if message.sequence_id is not None:
+            return (message.topic, message.sequence_id)
+        return (message.topic, message.to_json())
+
+    async def publish(self, message: Message) -> T:
+        """Publish a message, collapsing it with identical messages.
+
+        Parameters
+        ----------
+        message : Message
+            The message to be published.
+
+        Returns
+        -------
+        T
+            The result of publishing the message, or the collapsed message.
+        """
+        key = self.key(message)
+
+        if (pending := self._pending.get(key)) is None:
+            self._open(key)
+            self.published += 1
+            return await self._publish(message)
+
+        pending.message = message
+        pending.count += 1
+        self.collapsed += 1
+        if self._max_count is not None and pending.count >= self._max_count:
+            self._flush(key)
+
+        pending.waiters += 1
+        try:
+            return await asyncio.shield(pending.future)
+        finally:
+            pending.waiters -= 1
+
+    async def close(self) -> None:
+        """Publish all collapsed messages immediately and wait for them."""
+        for key in list(self._pending):
+            self._flush(key, reopen=False)
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _open(self, key: Hashable) -> None:
+        """Open the window collecting identical messages."""
+        loop = asyncio.get_running_loop()
+        self._pending[key] = _Pending(
+            future=loop.create_future(),
+            handle=loop.call_later(self._window, self._flush, key),
+        )
+
+    def _flush(self, key: Hashable, *, reopen: bool = True) -> None:
+        """Close a window and start publishing its collapsed message, if any."""
+        pending = self._pending.pop(key)
+        pending.handle.cancel()
+        if pending.message is None:
+            return
+
+        if reopen:
+            self._open(key)
+        task = asyncio.create_task(self._send(pending, pending.message))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, pending: _Pending[T], message: Message) -> None:
+        """Publish the collapsed message and resolve all publishers."""
+        if self._count_duplicates and pending.count > 1:
+            message = replace(
+                message, message=f"{message.message or ''} ({pending.count}x)".lstrip()
+            )
+
+        self.published += 1
+        try:
+            pending.future.set_result(await self._publish(message))
+        except asyncio.CancelledError:
+            pending.future.cancel()
+            raise
+        except Exception as e:  # noqa: BLE001
+            pending.future.set_exception(e)
+            if not pending.waiters:
+                # all publishers were cancelled, mark the exception as retrieved
+                pending.future.exception()
@@ -4,3 +4,36 @@ __version__ = "0.8.5"
 
 MIN_PRIORITY = 1
 MAX_PRIORITY = 5
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_QUEUE_WORKERS = 4
+DEFAULT_PRIORITY_WEIGHTS = {1: 1, 2: 2, 3: 4, 4: 8, 5: 16}
+DEFAULT_STREAM_BUFFER_SIZE = 100
+DEFAULT_DEDUP_SIZE = 1000
+DEFAULT_TOPICS_PER_CONNECTION = 50
+DEFAULT_MAX_URL_LENGTH = 2000
+DEFAULT_SUBSCRIPTION_BATCH_DELAY = 0.5
+DEFAULT_STREAM_CONNECT_TIMEOUT = 30.0
+DEFAULT_STREAM_READ_TIMEOUT = 90.0
+
+SECONDS_PER_DAY = 86400
+
+DEFAULT_RATE_LIMIT_RATE = 0.2
+DEFAULT_RATE_LIMIT_BURST = 60
+DEFAULT_RATE_LIMIT_BACKOFF = 0.5
+
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_RETRY_MAX_BACKOFF = 10.0
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RESET_TIMEOUT = 30.0
+
+DEFAULT_POOL_LIMIT = 100
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+DEFAULT_DNS_CACHE_TTL = 10
+
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+
+DEFAULT_HASH_REPLICAS = 160
+
+DEFAULT_ENGINE_CHUNK_SIZE = 500
@@ -0,0 +1,97 @@
+"""Bounded message ID deduplication for aiontfy."""
+
+from collections import deque
+from time import monotonic
+
+from .const import DEFAULT_DEDUP_SIZE
+
+
+class Deduplicator:
+    """Detect notifications that were already received.
+
+    Remembers the most recent `size` message IDs in a ring buffer indexed by a
+    set, so memory is bounded and lookups take constant time. The oldest ID is
+    forgotten once the limit is reached, or after `ttl` seconds if set. A
+    deduplicator can be shared between subscriptions, e.g. to receive each
+    message only once from redundant servers.
+
+    Attributes
+    ----------
+    hits : int
+        Number of duplicates detected.
+    misses : int
+        Number of new IDs.
+    """
+
+    def __init__(
+        self, size: int = DEFAULT_DEDUP_SIZE, *, ttl: float | None = None
+    ) -> None:
+        """Initialize deduplicator.
+
+        Parameters
+        ----------
+        size : int, optional
+            Maximum number of remembered IDs, defaults to 1000.
+        ttl : float or None, optional
+            Seconds an ID is remembered, defaults to None for no expiry.
+        """
+        if size < 1:
+            msg = "size must be at least 1"
+            raise ValueError(msg)
+
+        self.size = size
+        self.ttl = ttl
+        self._ring: deque[tuple[float, str]] = deque()
+        self._seen: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of remembered IDs."""
+        return len(self._seen)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of checked IDs that were duplicates."""
+        checked = self.hits + self.misses
+        return self.hits / checked if checked else 0.0
+
+    def seen(self, key: str) -> bool:
+        """Check if an ID was seen before and remember it.
+
+        Parameters
+        ----------
+        key : str
+            The message ID.
+
+        Returns
+        -------
+        bool
+            True if the ID is a duplicate.
+        """
+        now = monotonic()
+        if self.ttl is not None:
+            self._expire(now - self.ttl)
+
+        if key in self._seen:
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        if len(self._ring) >= self.size:
+            self._seen.discard(self._ring.popleft()[1])
+        self._ring.append((now, key))
+        self._seen.add(key)
+        return False
+
+    def clear(self) -> None:
+        """Forget all IDs and reset the statistics."""
+        self._ring.clear()
+        self._seen.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _expire(self, cutoff: float) -> None:
+        """Forget IDs remembered before the cutoff."""
+        while self._ring and self._ring[0][0] <= cutoff:
+            self._seen.discard(self._ring.popleft()[1])
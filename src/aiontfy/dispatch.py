@@ -0,0 +1,174 @@
+"""Concurrent dispatch of notifications to callbacks for aiontfy."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import inspect
+import logging
+from typing import TYPE_CHECKING, Any
+
+from .const import DEFAULT_MAX_CONCURRENCY
+
+if TYPE_CHECKING:
+    from .types import LazyNotification, Notification
+
+_LOGGER = logging.getLogger(__name__)
+
+Callback = Callable[[Any], Awaitable[None] | None]
+ErrorHandler = Callable[[Exception, Any], None]
+
+
+class Dispatcher:
+    """Dispatch received notifications to a sync or async callback.
+
+    Callbacks returning an awaitable, e.g. coroutine functions, are awaited in
+    tasks, at most `max_concurrency` at a time; once the limit is reached,
+    `dispatch` waits for a running callback to finish, which stops reading
+    from the websocket. Exceptions raised by the callback
+    are passed to the error handler and do not end the subscription.
+
+    Attributes
+    ----------
+    dispatched : int
+        Number of notifications passed to the callback.
+    failed : int
+        Number of callbacks that raised an exception.
+    """
+
+    def __init__(
+        self,
+        callback: Callback,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = False,
+        on_error: ErrorHandler | None = None,
+    ) -> None:
+        """Initialize dispatcher.
+
+        Parameters
+        ----------
+        callback : Callable[[Notification], Awaitable[None] | None]
+            Function or coroutine function called for every notification.
+        max_concurrency : int, optional
+            Maximum number of coroutine callbacks running at once, defaults to 10.
+        ordered : bool, optional
+            Run the callbacks of notifications of the same topic one after
+            another in the order they were received. Defaults to False.
+        on_error : Callable[[Exception, Notification], None], optional
+            Called with the exception and the notification if the callback
+            raises. Defaults to logging the exception.
+        """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+
+        self._callback = callback
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._ordered = ordered
+        self._on_error = on_error or self._log_error
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._last: dict[str, asyncio.Task[None]] = {}
+        self.dispatched = 0
+        self.failed = 0
+
+    async def dispatch(self, notification: Notification | LazyNotification) -> None:
+        """Pass a notification to the callback.
+
+        Parameters
+        ----------
+        notification : Notification or LazyNotification
+            The received notification.
+        """
+        self.dispatched += 1
+        result = None
+        previous = None
+        if self._ordered:
+            previous = self._last.get(notification.topic)
+        elif not inspect.isawaitable(result := self._invoke(notification)):
+            return
+
+        try:
+            await self._semaphore.acquire()
+        except asyncio.CancelledError:
+            if inspect.iscoroutine(result):
+                result.close()
+            raise
+        task = asyncio.create_task(self._run(notification, previous, result))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if self._ordered:
+            self._last[notification.topic] = task
+            task.add_done_callback(lambda _: self._forget(notification.topic, task))
+
+    async def join(self) -> None:
+        """Wait for all running callbacks to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def cancel(self) -> None:
+        """Cancel all running callbacks."""
+        for task in self._tasks:
+            task.cancel()
+
+    async def _run(
+        self,
+        notification: Notification | LazyNotification,
+        previous: asyncio.Task[None] | None,
+        result: Awaitable[None] | None,
+    ) -> None:
+        """Await the callback, after the previous callback of the topic finished.
+
+        Ordered callbacks are called here; `result` is the awaitable returned
+        by an unordered callback that was already called.
+        """
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])
+            if result is None:
+                result = self._invoke(notification)
+            if inspect.isawaitable(result):
+                await result
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # noqa: BLE001
+            self._error(e, notification)
+        finally:
+            self._semaphore.release()
+
+    def _invoke(
+        self, notification: Notification | LazyNotification
+    ) -> Awaitable[None] | None:
+        """Call the callback and report exceptions raised by sync callbacks."""
+        try:
+            return self._callback(notification)
+        except Exception as e:  # noqa: BLE001
+            self._error(e, notification)
+            return None
+
+    def _forget(self, topic: str, task: asyncio.Task[None]) -> None:
+        """Remove the last task of a topic once it is done."""
+        if self._last.get(topic) is task:
+            del self._last[topic]
+
+    def _error(
+        self, error: Exception, notification: Notification | LazyNotification
+    ) -> None:
+        """Report an exception raised by the callback."""
+        self.failed += 1
+        try:
+            self._on_error(error, notification)
+        except Exception:
+            _LOGGER.exception("Error in subscription error handler")
+
+    @staticmethod
+    def _log_error(
+        error: Exception, notification: Notification | LazyNotification
+    ) -> None:
+        """Log an exception raised by the callback."""
+        _LOGGER.error(
+            "Error handling notification %s: %s",
+            notification.id,
+            error,
+            exc_info=error,
+        )
@@ -1,5 +1,7 @@
 """Exceptions for aiontfy."""
 
+from typing import Self
+
 
 class NtfyException(Exception):  # noqa: N818
     """Base ntfy exception."""
@@ -33,6 +35,10 @@ class NtfyHTTPError(NtfyException):
 
         super().__init__(self.error)
 
+    def __reduce__(self) -> tuple[type[Self], tuple[int, int, str, str | None]]:
+        """Support pickling, e.g. to pass errors between processes."""
+        return (type(self), (self.code, self.http, self.error, self.link))
+
 
 class NtfyConnectionError(NtfyException):
     """Connection error."""
@@ -46,6 +52,14 @@ class NtfyUnknownError(NtfyException):
     """Unexpected HTTP errors."""
 
 
+class NtfyQueueFullError(NtfyException):
+    """Publish queue is full."""
+
+
+class NtfyCircuitOpenError(NtfyException):
+    """Circuit breaker is open, server is considered unhealthy."""
+
+
 class NtfyBadRequestError(NtfyHTTPError):
     """400 Bad Request."""
 
@@ -1,18 +1,45 @@
 """Helpers for the aiontfy package."""
 
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cache
+from mmap import mmap
+from os import PathLike
+from pathlib import Path
 import platform
+from ssl import SSLContext
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    __version__ as aiohttp_version,
+)
+from aiohttp.client import DEFAULT_TIMEOUT
 
-from aiohttp import __version__ as aiohttp_version
+from .const import (
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_POOL_LIMIT,
+    __version__,
+)
 
-from .const import __version__
+if TYPE_CHECKING:
+    from .types import AttachmentData
 
 
+@cache
 def get_user_agent() -> str:
     """Generate User-Agent string.
 
     The User-Agent string contains details about the operating system,
     its version, architecture, the aiontfy version, aiohttp version,
-    and Python version.
+    and Python version. It is computed once and cached.
 
     Returns
     -------
@@ -37,3 +64,153 @@ def get_user_agent() -> str:
         f"aiohttp/{aiohttp_version} Python/{platform.python_version()} "
         " +https://github.com/tr4nt0r/aiontfy)"
     )
+
+
+def create_session(  # noqa: PLR0913
+    *,
+    pool_limit: int = DEFAULT_POOL_LIMIT,
+    pool_limit_per_host: int = 0,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    dns_cache_ttl: int | None = DEFAULT_DNS_CACHE_TTL,
+    ssl: SSLContext | bool = True,
+    timeout: ClientTimeout | None = None,
+) -> ClientSession:
+    """Create a ClientSession with a configured connection pool.
+
+    Parameters
+    ----------
+    pool_limit : int, optional
+        Maximum number of simultaneous connections, 0 means unlimited.
+        Defaults to 100.
+    pool_limit_per_host : int, optional
+        Maximum number of simultaneous connections to the same host, 0 means
+        unlimited. Defaults to 0.
+    keepalive_timeout : float, optional
+        Seconds an idle connection is kept open for reuse, defaults to 15.
+    dns_cache_ttl : int or None, optional
+        Seconds resolved host names are cached, None caches them forever.
+        Defaults to 10.
+    ssl : SSLContext or bool, optional
+        A preconfigured SSL context reused for all connections, or False to
+        skip certificate verification. Defaults to True.
+    timeout : ClientTimeout, optional
+        Default timeout for requests, defaults to the aiohttp default timeout.
+
+    Returns
+    -------
+    ClientSession
+        A new aiohttp ClientSession sending the aiontfy User-Agent.
+    """
+    return ClientSession(
+        connector=TCPConnector(
+            limit=pool_limit,
+            limit_per_host=pool_limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=dns_cache_ttl,
+            ssl=ssl,
+        ),
+        headers={"User-Agent": get_user_agent()},
+        timeout=timeout if timeout is not None else DEFAULT_TIMEOUT,
+    )
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into lines as the chunks arrive.
+
+    Only the incomplete last line is kept in memory, so arbitrarily long
+    newline-delimited JSON responses can be consumed with constant memory. Each
+    chunk is searched for line breaks only once, so long lines arriving in
+    many chunks are split in linear time.
+
+    Parameters
+    ----------
+    chunks : AsyncIterable[bytes]
+        Chunks of the byte stream, e.g. `ClientResponse.content.iter_any()`.
+
+    Yields
+    ------
+    bytes
+        The non-empty lines without line terminators.
+    """
+    buffer = bytearray()
+    scanned = 0
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", scanned)) != -1:
+            if line := buffer[start:end].strip():
+                yield bytes(line)
+            start = scanned = end + 1
+        del buffer[:start]
+        scanned = len(buffer)
+    if line := buffer.strip():
+        yield bytes(line)
+
+
+def shard_topics(
+    topics: list[str], *, max_topics: int, max_length: int
+) -> list[list[str]]:
+    """Split topics into groups that fit into one subscription URL.
+
+    Parameters
+    ----------
+    topics : list[str]
+        The topic names.
+    max_topics : int
+        Maximum number of topics per group.
+    max_length : int
+        Maximum length of the comma-separated, URL-encoded topics of a group.
+        A topic longer than this forms a group of its own.
+
+    Returns
+    -------
+    list[list[str]]
+        The groups of topics, in the order of `topics`.
+    """
+    shards: list[list[str]] = []
+    length = 0
+    for topic in topics:
+        size = len(quote(topic, safe=""))
+        if (
+            not shards
+            or len(shards[-1]) >= max_topics
+            or length + 1 + size > max_length
+        ):
+            shards.append([topic])
+            length = size
+        else:
+            shards[-1].append(topic)
+            length += 1 + size
+    return shards
+
+
+@asynccontextmanager
+async def attachment_body(attachment: AttachmentData) -> AsyncIterator[object]:
+    """Prepare an attachment to be streamed as request body.
+
+    File paths, given as `str` or path-like object, are opened and streamed
+    from disk, memory-mapped files are sent as zero-copy memoryview. Bytes,
+    file objects and async iterables are passed through unchanged and streamed
+    by aiohttp.
+
+    Parameters
+    ----------
+    attachment : AttachmentData
+        The attachment contents or the source to read them from.
+
+    Yields
+    ------
+    object
+        Request body to be passed as `data` to aiohttp.
+    """
+    if isinstance(attachment, str | PathLike):
+        file = await asyncio.to_thread(Path(attachment).open, "rb")
+        try:
+            yield file
+        finally:
+            file.close()
+    elif isinstance(attachment, mmap):
+        with memoryview(attachment) as view:
+            yield view
+    else:
+        yield attachment
@@ -1,37 +1,110 @@
 """Async ntfy client library."""
 
-from collections.abc import Callable
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
 from datetime import datetime
+from functools import partial
 from http import HTTPStatus
-from typing import Any, Self
-
-from aiohttp import BasicAuth, ClientError, ClientSession, WSMsgType
+import logging
+from os import PathLike
+from pathlib import Path
+from ssl import SSLContext
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, Literal, Self, overload
+
+from aiohttp import BasicAuth, ClientError, ClientSession, ClientTimeout, WSMsgType
+import orjson
 from yarl import URL
 
-from .exceptions import NtfyConnectionError, NtfyTimeoutError, raise_http_error
-from .helpers import get_user_agent
+from .coalesce import Coalescer
+from .const import (
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_HEALTH_CHECK_INTERVAL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_URL_LENGTH,
+    DEFAULT_POOL_LIMIT,
+    DEFAULT_PRIORITY_WEIGHTS,
+    DEFAULT_QUEUE_WORKERS,
+    DEFAULT_STREAM_BUFFER_SIZE,
+    DEFAULT_STREAM_CONNECT_TIMEOUT,
+    DEFAULT_STREAM_READ_TIMEOUT,
+    DEFAULT_TOPICS_PER_CONNECTION,
+)
+from .dedup import Deduplicator
+from .dispatch import Dispatcher
+from .exceptions import (
+    NtfyConnectionError,
+    NtfyException,
+    NtfyHTTPError,
+    NtfyQueueFullError,
+    NtfyTimeoutError,
+    NtfyTooManyRequestsError,
+    raise_http_error,
+)
+from .helpers import attachment_body, create_session, iter_lines, shard_topics
+from .queue import PublishQueue
+from .retry import REPLAYABLE_BODIES, TRANSIENT_ERRORS, CircuitBreaker, RetryPolicy
+from .scheduler import ScheduledPublish, Scheduler
 from .types import (
     Account,
     AccountTokenResponse,
+    AttachmentData,
+    Event,
     Everyone,
+    LazyNotification,
     Message,
     Notification,
+    QueueFullPolicy,
     Response,
     Stats,
+    Transport,
     Version,
 )
 
+if TYPE_CHECKING:
+    from .outbox import Outbox
+    from .ratelimit import RateLimiter
+    from .template import MessageTemplate
+
+_LOGGER = logging.getLogger(__name__)
+
 
 class Ntfy:
     """Ntfy client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         url: str,
         session: ClientSession | None = None,
         username: str | None = None,
         password: str | None = None,
         token: str | None = None,
+        *,
+        queue_maxsize: int = 0,
+        queue_workers: int = DEFAULT_QUEUE_WORKERS,
+        queue_policy: QueueFullPolicy = QueueFullPolicy.BLOCK,
+        queue_weights: Mapping[int, int] = DEFAULT_PRIORITY_WEIGHTS,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        coalesce_window: float | None = None,
+        coalesce_count: bool = False,
+        coalesce_max_count: int | None = None,
+        pool_limit: int = DEFAULT_POOL_LIMIT,
+        pool_limit_per_host: int = 0,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int | None = DEFAULT_DNS_CACHE_TTL,
+        ssl: SSLContext | bool = True,
+        timeout: ClientTimeout | None = None,
+        fallback_urls: list[str] | None = None,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        outbox: Outbox | None = None,
+        schedule_max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        topics_per_connection: int = DEFAULT_TOPICS_PER_CONNECTION,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
     ) -> None:
         """Initialize Ntfy client.
 
@@ -41,9 +114,121 @@ class Ntfy:
             The base URL for the Ntfy service.
         session : ClientSession, optional
             An existing aiohttp ClientSession. If not provided, a new session will be created.
+        queue_maxsize : int, optional
+            Maximum number of messages in the background publish queue, 0 means
+            unbounded. Defaults to 0.
+        queue_workers : int, optional
+            Number of worker tasks draining the background publish queue, defaults to 4.
+        queue_policy : QueueFullPolicy, optional
+            Behavior of `enqueue` when the publish queue is full, defaults to
+            `QueueFullPolicy.BLOCK`. `QueueFullPolicy.SHED` drops queued messages
+            of the lowest priority first to make room for more urgent ones.
+        queue_weights : Mapping[int, int], optional
+            Share of the queue workers each message priority gets while messages
+            of several priorities are queued, defaults to doubling per priority
+            from 1 for `Priority.MIN` to 16 for `Priority.MAX`.
+        rate_limiter : RateLimiter, optional
+            Client-side rate limiter applied to all requests. It is seeded with the
+            account limits whenever `account` is called.
+        retry_policy : RetryPolicy, optional
+            Policy for retrying requests that failed with a transient error.
+        circuit_breaker : CircuitBreaker, optional
+            Circuit breaker failing requests fast while the server is unhealthy.
+        coalesce_window : float, optional
+            If set, identical messages (same topic and `sequence_id`, or same topic
+            and content) published within this many seconds after a message was
+            sent are collapsed into a single request, sent when the window
+            closes. The first message is sent immediately. Messages with
+            attachments are never collapsed.
+        coalesce_count : bool, optional
+            Append the number of collapsed messages to the message body, defaults
+            to False.
+        coalesce_max_count : int, optional
+            Publish collapsed messages as soon as this many identical messages
+            were collected instead of waiting for the window to close. Defaults
+            to None for no limit.
+        pool_limit : int, optional
+            Maximum number of simultaneous connections, 0 means unlimited.
+            Defaults to 100.
+        pool_limit_per_host : int, optional
+            Maximum number of simultaneous connections to the same host, 0 means
+            unlimited. Defaults to 0.
+        keepalive_timeout : float, optional
+            Seconds an idle connection is kept open for reuse, defaults to 15.
+        dns_cache_ttl : int or None, optional
+            Seconds resolved host names are cached, None caches them forever.
+            Defaults to 10.
+        ssl : SSLContext or bool, optional
+            A preconfigured SSL context reused for all connections, or False to
+            skip certificate verification. Defaults to True.
+        timeout : ClientTimeout, optional
+            Default timeout for requests, defaults to the aiohttp default timeout.
+        fallback_urls : list[str], optional
+            Base URLs of redundant ntfy servers, in order of preference. When a
+            request to the active server fails with a connection error, timeout or
+            500 Internal Server Error, it is sent to the next server, which becomes
+            the active server. A short `sock_connect` in `timeout` makes failover
+            faster.
+        health_check_interval : float, optional
+            Seconds between health checks of the primary server while a fallback
+            server is active, defaults to 30. Requests return to the primary server
+            once it is healthy again.
+        outbox : Outbox, optional
+            Durable outbox messages are written to before they are published.
+            Messages are removed once the server accepted or rejected them, and
+            messages left over from a crash or a transient error are published
+            again by `replay`, which is called when entering the client's async
+            context. Messages with attachments are not stored.
+        schedule_max_concurrency : int, optional
+            Maximum number of scheduled publishes running at the same time,
+            defaults to 10.
+        topics_per_connection : int, optional
+            Maximum number of topics subscribed over one websocket connection.
+            Subscriptions to more topics are split across several connections,
+            whose notifications are merged. Defaults to 50.
+        max_url_length : int, optional
+            Maximum length of subscription and access check URLs, excluding
+            query parameters. Topics exceeding it are split across several
+            connections or requests. Defaults to 2000.
+
+        Notes
+        -----
+        The connection pool options and `timeout` only apply to the session
+        created by the client; they are ignored if `session` is provided.
         """
         self.url = URL(url)
+        self._urls = [self.url, *(URL(u) for u in fallback_urls or [])]
+        self._health_check_interval = health_check_interval
+        self._health_check: asyncio.Task[None] | None = None
         self._headers = None
+        self._close_session = False
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._outbox = outbox
+        self._topics_per_connection = topics_per_connection
+        self._max_url_length = max_url_length
+        self._coalescer = (
+            Coalescer(
+                self._publish,
+                coalesce_window,
+                count_duplicates=coalesce_count,
+                max_count=coalesce_max_count,
+            )
+            if coalesce_window is not None
+            else None
+        )
+        self._scheduler = Scheduler(
+            partial(self.publish, parse=False),
+            max_concurrency=schedule_max_concurrency,
+        )
+        self._publish_queue = PublishQueue(
+            partial(self.publish, parse=False),
+            maxsize=queue_maxsize,
+            workers=queue_workers,
+            policy=queue_policy,
+            weights=queue_weights,
+        )
 
         if username is not None and password is not None:
             self._headers = {
@@ -55,10 +240,24 @@ class Ntfy:
         if session is not None:
             self._session = session
         else:
-            self._session = ClientSession(headers={"User-Agent": get_user_agent()})
+            self._session = create_session(
+                pool_limit=pool_limit,
+                pool_limit_per_host=pool_limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                dns_cache_ttl=dns_cache_ttl,
+                ssl=ssl,
+                timeout=timeout,
+            )
             self._close_session = True
 
-    async def _request(self, method: str, url: URL, **kwargs: Any) -> str:  # noqa: ANN401
+    async def _request(
+        self,
+        method: str,
+        url: URL,
+        *,
+        publish: bool = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> str:
         """Handle API request.
 
         Parameters
@@ -67,6 +266,9 @@ class Ntfy:
             HTTP method (e.g., 'GET', 'POST').
         url : URL
             The URL to send the request to.
+        publish : bool, optional
+            Whether the request publishes a message and counts against the
+            message quota, defaults to False.
         **kwargs : dict
             Additional arguments to pass to the request.
 
@@ -81,11 +283,133 @@ class Ntfy:
             If a timeout occurs during the request.
         NtfyConnectionError
             If a client error occurs during the request.
+        NtfyCircuitOpenError
+            If the circuit breaker is open.
         """
 
         if self._headers:
             kwargs.setdefault("headers", {}).update(self._headers)
 
+        policy = self._retry_policy
+        if policy is None or not policy.is_retryable(method, kwargs.get("data")):
+            return await self._attempt(method, url, publish=publish, **kwargs)
+
+        deadline = None if policy.deadline is None else monotonic() + policy.deadline
+        attempt = 1
+        while True:
+            try:
+                async with asyncio.timeout(
+                    None if deadline is None else deadline - monotonic()
+                ):
+                    return await self._attempt(method, url, publish=publish, **kwargs)
+            except TimeoutError as e:
+                raise NtfyTimeoutError from e
+            except policy.retry_on:
+                delay = policy.delay(attempt)
+                if attempt >= policy.max_attempts or (
+                    deadline is not None and monotonic() + delay >= deadline
+                ):
+                    raise
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _attempt(
+        self,
+        method: str,
+        url: URL,
+        *,
+        publish: bool = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> str:
+        """Send a single request attempt.
+
+        Applies the circuit breaker and the rate limiter.
+        """
+
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.before_request()
+
+        try:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(message=publish)
+            text = await self._send_failover(method, url, **kwargs)
+        except NtfyException as e:
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.record_failure(e)
+            if self._rate_limiter is not None and isinstance(
+                e, NtfyTooManyRequestsError
+            ):
+                self._rate_limiter.rate_limited(e)
+            raise
+        except BaseException:
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.record_cancelled()
+            raise
+
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success()
+        if self._rate_limiter is not None:
+            self._rate_limiter.success()
+        return text
+
+    async def _send_failover(self, method: str, url: URL, **kwargs: Any) -> str:  # noqa: ANN401
+        """Send a request, failing over to the next server on transient errors."""
+
+        if len(self._urls) == 1 or not (
+            kwargs.get("data") is None or isinstance(kwargs["data"], REPLAYABLE_BODIES)
+        ):
+            return await self._send(method, url, **kwargs)
+
+        for _ in self._urls:
+            base = self.url
+            try:
+                return await self._send(method, self._rebase(url, base), **kwargs)
+            except TRANSIENT_ERRORS as e:
+                error = e
+                if self.url is base:
+                    self._failover()
+        raise error
+
+    def _rebase(self, url: URL, base: URL) -> URL:
+        """Move a URL of one of the servers to another base URL."""
+
+        for server in self._urls:
+            prefix = server.raw_path.rstrip("/")
+            if url.origin() == server.origin() and url.raw_path.startswith(prefix):
+                return base.with_path(
+                    base.raw_path.rstrip("/") + url.raw_path[len(prefix) :],
+                    encoded=True,
+                ).with_query(url.query)
+        return url
+
+    def _failover(self) -> None:
+        """Make the next server the active server."""
+
+        self.url = self._urls[(self._urls.index(self.url) + 1) % len(self._urls)]
+
+        if self.url is not self._urls[0] and (
+            self._health_check is None or self._health_check.done()
+        ):
+            self._health_check = asyncio.create_task(self._check_primary())
+
+    async def _check_primary(self) -> None:
+        """Return to the primary server once it is healthy again."""
+
+        primary = self._urls[0]
+        while self.url is not primary:
+            await asyncio.sleep(self._health_check_interval)
+            try:
+                health = orjson.loads(await self._send("GET", primary / "v1/health"))
+            except NtfyException:
+                continue
+            except orjson.JSONDecodeError:
+                continue
+            if health == {"healthy": True}:
+                self.url = primary
+
+    async def _send(self, method: str, url: URL, **kwargs: Any) -> str:  # noqa: ANN401
+        """Send a request and raise the matching exception for error responses."""
+
         try:
             async with self._session.request(method, url, **kwargs) as r:
                 if r.status >= HTTPStatus.BAD_REQUEST:
@@ -96,20 +420,53 @@ class Ntfy:
         except ClientError as e:
             raise NtfyConnectionError from e
 
+    @overload
     async def publish(
-        self, message: Message, attachment: bytes | None = None
-    ) -> Notification:
+        self,
+        message: Message,
+        attachment: AttachmentData | None = None,
+        *,
+        parse: Literal[True] = True,
+    ) -> Notification: ...
+
+    @overload
+    async def publish(
+        self,
+        message: Message,
+        attachment: AttachmentData | None = None,
+        *,
+        parse: Literal[False],
+    ) -> None: ...
+
+    async def publish(
+        self,
+        message: Message,
+        attachment: AttachmentData | None = None,
+        *,
+        parse: bool = True,
+    ) -> Notification | None:
         """Publish a message to an ntfy topic.
 
         Parameters
         ----------
         message : Message
             The message to be published, containing details such as topic, title, and content.
+        attachment : AttachmentData, optional
+            An attachment to upload with the message. File paths (`str` or
+            path-like objects), file objects, memory-mapped files and async
+            iterables of bytes are streamed without loading the whole attachment
+            into memory. When a file path is given,
+            its name is used as filename unless `message.filename` is set.
+        parse : bool, optional
+            Parse the response into a `Notification`, defaults to True. If False,
+            the response is read but not parsed and None is returned, which saves
+            the cost of building the `Notification` for fire-and-forget publishes.
 
         Returns
         -------
-        Notification
-            A `Notification` object representing the response from the ntfy service.
+        Notification or None
+            A `Notification` object representing the response from the ntfy
+            service, or None if `parse` is False.
 
         Raises
         ------
@@ -119,21 +476,370 @@ class Ntfy:
             If a client error occurs during the request.
         """
 
+        if self._outbox is None or attachment is not None:
+            response = await self._deliver(message, attachment)
+        else:
+            response = await self._publish_durable(
+                self._outbox,
+                await self._outbox.add(message),
+                partial(self._deliver, message),
+            )
+
+        return Notification.from_json(response) if parse else None
+
+    async def _publish_durable(
+        self, outbox: Outbox, message_id: int, send: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Publish a message stored in the outbox and remove it when settled.
+
+        The message stays in the outbox if it could not be delivered, i.e. on
+        connection errors, timeouts, 429 and 5xx responses or cancellation, and
+        is released to be published again by the next `replay`.
+        """
+
+        settled = False
+        try:
+            response = await send()
+            settled = True
+        except NtfyHTTPError as e:
+            settled = e.http < HTTPStatus.INTERNAL_SERVER_ERROR and not isinstance(
+                e, NtfyTooManyRequestsError
+            )
+            raise
+        finally:
+            if settled:
+                outbox.done(message_id)
+            else:
+                outbox.release(message_id)
+        return response
+
+    async def replay(
+        self, *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[Notification | NtfyException]:
+        """Publish the messages left in the outbox.
+
+        Replays the messages left by a previous run, and those that failed with
+        a transient error since. Messages that are currently being published
+        are skipped, so replay is safe to call at any time, e.g. periodically
+        to retry failed messages without restarting. It is called when entering
+        the client's async context.
+
+        Parameters
+        ----------
+        max_concurrency : int, optional
+            Maximum number of publish requests in flight at the same time,
+            defaults to 10.
+
+        Returns
+        -------
+        list[Notification | NtfyException]
+            The `Notification` for each replayed message, or the exception raised
+            while publishing it, oldest message first. Messages that failed with
+            a transient error stay in the outbox.
+        """
+
+        if (outbox := self._outbox) is None:
+            return []
+
+        pending = iter(await outbox.claim())
+        results: dict[int, Notification | NtfyException] = {}
+
+        async def worker() -> None:
+            for message_id, message in pending:
+                try:
+                    results[message_id] = Notification.from_json(
+                        await self._publish_durable(
+                            outbox, message_id, partial(self._deliver, message)
+                        )
+                    )
+                except NtfyException as e:
+                    results[message_id] = e
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+        finally:
+            for message_id, _ in pending:
+                outbox.release(message_id)
+        return [results[message_id] for message_id in sorted(results)]
+
+    async def _deliver(
+        self, message: Message, attachment: AttachmentData | None = None
+    ) -> str:
+        """Publish a message, collapsing it with identical messages if enabled."""
+
+        if self._coalescer is not None and attachment is None:
+            return await self._coalescer.publish(message)
+
+        return await self._publish(message, attachment)
+
+    async def _publish(
+        self, message: Message, attachment: AttachmentData | None = None
+    ) -> str:
+        """Publish a message without coalescing and return the raw response."""
+
         if attachment is not None:
-            return Notification.from_json(
-                await self._request(
+            headers = message.to_x_headers()
+            if isinstance(attachment, str | PathLike):
+                headers.setdefault("X-Filename", Path(attachment).name)
+            async with attachment_body(attachment) as data:
+                return await self._request(
                     "PUT",
                     self.url / message.topic,
-                    headers=message.to_x_headers(),
-                    data=attachment,
+                    publish=True,
+                    headers=headers,
+                    data=data,
                 )
+
+        return await self._request(
+            "POST", self.url, publish=True, json=message.to_dict()
+        )
+
+    async def publish_template(
+        self,
+        template: MessageTemplate,
+        *,
+        message: str | None = None,
+        title: str | None = None,
+        tags: list[str] | None = None,
+    ) -> Notification:
+        """Publish a message rendered from a precompiled template.
+
+        The rendered message is written to the outbox if one is configured, but
+        it is never coalesced, because collapsing identical messages requires
+        building a `Message`.
+
+        Parameters
+        ----------
+        template : MessageTemplate
+            The template providing the topic and the fixed fields of the message.
+        message : str, optional
+            Message body, defaults to the message body of the template.
+        title : str, optional
+            Message title, defaults to the title of the template.
+        tags : list[str], optional
+            List of tags, defaults to the tags of the template.
+
+        Returns
+        -------
+        Notification
+            A `Notification` object representing the response from the ntfy service.
+
+        Raises
+        ------
+        NtfyTimeoutError
+            If a timeout occurs during the request.
+        NtfyConnectionError
+            If a client error occurs during the request.
+        """
+
+        payload = template.render(message=message, title=title, tags=tags)
+        if self._outbox is None:
+            response = await self._send_json(payload)
+        else:
+            response = await self._publish_durable(
+                self._outbox,
+                await self._outbox.add(payload),
+                partial(self._send_json, payload),
             )
 
-        return Notification.from_json(
-            await self._request("POST", self.url, json=message.to_dict())
+        return Notification.from_json(response)
+
+    async def _send_json(self, payload: bytes) -> str:
+        """Publish an already JSON encoded message and return the raw response."""
+
+        return await self._request(
+            "POST",
+            self.url,
+            publish=True,
+            data=payload,
+            headers={"Content-Type": "application/json"},
+        )
+
+    async def publish_many(
+        self,
+        messages: Iterable[Message],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[Notification | NtfyException]:
+        """Publish many messages concurrently.
+
+        Parameters
+        ----------
+        messages : Iterable[Message]
+            The messages to be published.
+        max_concurrency : int, optional
+            Maximum number of publish requests in flight at the same time,
+            defaults to 10.
+
+        Returns
+        -------
+        list[Notification | NtfyException]
+            The `Notification` for each message, or the exception raised while
+            publishing it, in the same order as `messages`.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is less than 1.
+        """
+
+        messages = list(messages)
+        results = {
+            index: result
+            async for index, result in self.publish_as_completed(
+                messages, max_concurrency=max_concurrency
+            )
+        }
+
+        return [results[index] for index in range(len(messages))]
+
+    async def publish_as_completed(
+        self,
+        messages: Iterable[Message],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AsyncIterator[tuple[int, Notification | NtfyException]]:
+        """Publish many messages concurrently and yield results as they finish.
+
+        Parameters
+        ----------
+        messages : Iterable[Message]
+            The messages to be published. The iterable is consumed lazily.
+        max_concurrency : int, optional
+            Maximum number of publish requests in flight at the same time,
+            defaults to 10.
+
+        Yields
+        ------
+        tuple[int, Notification | NtfyException]
+            The index of the message in `messages` and the `Notification`, or
+            the exception raised while publishing it.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is less than 1.
+        """
+
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+
+        pending = enumerate(messages)
+        queue: asyncio.Queue[tuple[int, Notification | NtfyException] | None] = (
+            asyncio.Queue()
         )
 
-    async def clear(self, topic: str, sequence_id: str) -> Notification:
+        async def worker() -> None:
+            try:
+                for index, message in pending:
+                    try:
+                        result: Notification | NtfyException = await self.publish(
+                            message
+                        )
+                    except NtfyException as e:
+                        result = e
+                    queue.put_nowait((index, result))
+            finally:
+                queue.put_nowait(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                if (item := await queue.get()) is None:
+                    running -= 1
+                    continue
+                yield item
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def enqueue(
+        self, message: Message, attachment: AttachmentData | None = None
+    ) -> bool:
+        """Queue a message to be published in the background.
+
+        Parameters
+        ----------
+        message : Message
+            The message to be published.
+        attachment : AttachmentData, optional
+            An attachment to upload with the message.
+
+        Returns
+        -------
+        bool
+            True if the message was queued, False if it was dropped because the
+            queue is full and the queue policy is `QueueFullPolicy.DROP`.
+
+        Raises
+        ------
+        NtfyQueueFullError
+            If the queue is full and the queue policy is `QueueFullPolicy.RAISE`.
+        """
+
+        return await self._publish_queue.put(message, attachment)
+
+    async def flush(self) -> None:
+        """Wait until all queued messages have been published."""
+
+        await self._publish_queue.join()
+
+    def schedule(
+        self,
+        message: Message,
+        *,
+        delay: float = 0.0,
+        interval: float | None = None,
+        jitter: float = 0.0,
+    ) -> ScheduledPublish:
+        """Schedule a one-off or recurring publish.
+
+        All schedules of the client share a single timer, so large numbers of
+        recurring notifications like heartbeats do not need a task each.
+
+        Parameters
+        ----------
+        message : Message
+            The message to be published.
+        delay : float, optional
+            Seconds until the first run, defaults to 0.
+        interval : float, optional
+            Seconds between runs of a recurring publish. If not set, the message
+            is published once.
+        jitter : float, optional
+            Maximum random delay in seconds added to every run, defaults to 0.
+
+        Returns
+        -------
+        ScheduledPublish
+            Handle to cancel or reschedule the publish.
+
+        Raises
+        ------
+        ValueError
+            If `interval` is not positive or `jitter` is negative.
+        """
+
+        return self._scheduler.schedule(
+            message, delay=delay, interval=interval, jitter=jitter
+        )
+
+    @overload
+    async def clear(
+        self, topic: str, sequence_id: str, *, parse: Literal[True] = True
+    ) -> Notification: ...
+
+    @overload
+    async def clear(
+        self, topic: str, sequence_id: str, *, parse: Literal[False]
+    ) -> None: ...
+
+    async def clear(
+        self, topic: str, sequence_id: str, *, parse: bool = True
+    ) -> Notification | None:
         """Clear a notification.
 
         Clearing a notification means marking it as read and dismissing it from the notification drawer.
@@ -144,6 +850,9 @@ class Ntfy:
             The topic from which to clear a notification.
         sequence_id: str
             The sequence-ID to identify the notification to be cleared.
+        parse : bool, optional
+            Parse the response into a `Notification`, defaults to True. If False,
+            None is returned.
 
         Raises
         ------
@@ -154,10 +863,23 @@ class Ntfy:
         """
 
         url = self.url / topic / sequence_id / "clear"
+        response = await self._request("PUT", url, publish=True)
+
+        return Notification.from_json(response) if parse else None
 
-        return Notification.from_json(await self._request("PUT", url))
+    @overload
+    async def delete(
+        self, topic: str, sequence_id: str, *, parse: Literal[True] = True
+    ) -> Notification: ...
 
-    async def delete(self, topic: str, sequence_id: str) -> Notification:
+    @overload
+    async def delete(
+        self, topic: str, sequence_id: str, *, parse: Literal[False]
+    ) -> None: ...
+
+    async def delete(
+        self, topic: str, sequence_id: str, *, parse: bool = True
+    ) -> Notification | None:
         """Delete a notification.
 
         Deleting a notification means removing it from the notification drawer and from the client's database.
@@ -168,6 +890,9 @@ class Ntfy:
             The topic from which to delete a notification.
         sequence_id: str
             The sequence-ID to identify the notification to be deleted.
+        parse : bool, optional
+            Parse the response into a `Notification`, defaults to True. If False,
+            None is returned.
 
         Raises
         ------
@@ -178,17 +903,73 @@ class Ntfy:
         """
 
         url = self.url / topic / sequence_id
+        response = await self._request("DELETE", url, publish=True)
+
+        return Notification.from_json(response) if parse else None
 
-        return Notification.from_json(await self._request("DELETE", url))
+    @overload
+    async def subscribe(
+        self,
+        topics: list[str],
+        callback: Callable[[Notification], Awaitable[None] | None],
+        title: str | None = None,
+        message: str | None = None,
+        tags: list[str] | None = None,
+        priority: list[int] | None = None,
+        *,
+        lazy: Literal[False] = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = False,
+        on_error: Callable[[Exception, Notification], None] | None = None,
+        reconnect: RetryPolicy | None = None,
+        transport: Transport = Transport.WEBSOCKET,
+        dedup: Deduplicator | None = None,
+        since: str | None = None,
+        check: bool = True,
+    ) -> None: ...
+
+    @overload
+    async def subscribe(
+        self,
+        topics: list[str],
+        callback: Callable[[LazyNotification], Awaitable[None] | None],
+        title: str | None = None,
+        message: str | None = None,
+        tags: list[str] | None = None,
+        priority: list[int] | None = None,
+        *,
+        lazy: Literal[True],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = False,
+        on_error: Callable[[Exception, LazyNotification], None] | None = None,
+        reconnect: RetryPolicy | None = None,
+        transport: Transport = Transport.WEBSOCKET,
+        dedup: Deduplicator | None = None,
+        since: str | None = None,
+        check: bool = True,
+    ) -> None: ...
 
     async def subscribe(  # noqa: PLR0913
         self,
         topics: list[str],
-        callback: Callable[[Notification], None],
+        callback: Callable[[Notification], Awaitable[None] | None]
+        | Callable[[LazyNotification], Awaitable[None] | None],
         title: str | None = None,
         message: str | None = None,
         tags: list[str] | None = None,
         priority: list[int] | None = None,
+        *,
+        lazy: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = False,
+        on_error: Callable[[Exception, Notification], None]
+        | Callable[[Exception, LazyNotification], None]
+        | None = None,
+        reconnect: RetryPolicy | None = None,
+        transport: Transport = Transport.WEBSOCKET,
+        dedup: Deduplicator | None = None,
+        since: str | None = None,
+        check: bool = True,
     ) -> None:
         """Subscribe to one or more ntfy topics.
 
@@ -196,9 +977,10 @@ class Ntfy:
         ----------
         topics : list[str]
             A list of topic names to subscribe to.
-        callback : Callable[[Notification], None]
+        callback : Callable[[Notification], Awaitable[None] | None]
             A callback function that will be called when a new notification is received.
             The callback function should accept a single argument of type `Notification`.
+            Coroutine functions are run as tasks without blocking the subscription.
         title : str, optional
             Filter: Only return messages that match this exact message string, defaults to None.
         message : str, optional
@@ -207,6 +989,44 @@ class Ntfy:
             Filter: Only return messages that match all listed tags, defaults to None
         priority : int, optional
             Filter: Only return messages that match any priority listed, defaults to None.
+        lazy : bool, optional
+            Pass `LazyNotification` objects to the callback, which decode their
+            fields on first access. Defaults to False.
+        max_concurrency : int, optional
+            Maximum number of coroutine callbacks running at once. Once reached,
+            reading from the websocket waits for a callback to finish. Defaults
+            to 10.
+        ordered : bool, optional
+            Handle notifications of the same topic one after another in the
+            order they were received. Defaults to False.
+        on_error : Callable[[Exception, Notification], None], optional
+            Called with the exception and the notification if the callback
+            raises, instead of ending the subscription. Defaults to logging the
+            exception.
+        reconnect : RetryPolicy, optional
+            Reconnect with backoff when the websocket is closed or fails,
+            resuming after the last received message so that messages sent in
+            the meantime are not lost. Duplicates received around the
+            reconnect are skipped. The error is raised after `max_attempts`
+            consecutive failed connection attempts. Defaults to None, which
+            ends the subscription when the websocket is closed.
+        transport : Transport, optional
+            Receive notifications over a websocket (`Transport.WEBSOCKET`) or
+            a streamed HTTP response of newline-delimited JSON
+            (`Transport.HTTP`), e.g. if websockets are blocked. Defaults to
+            `Transport.WEBSOCKET`.
+        dedup : Deduplicator, optional
+            Skip notifications whose ID was already received, e.g. when
+            subscribing to the same topics on redundant servers. Pass the same
+            instance to several subscriptions to deduplicate across them.
+            Defaults to None.
+        since : str, optional
+            Also receive cached messages published after this message ID, Unix
+            timestamp or duration like "10m". Defaults to None, which only
+            receives new messages.
+        check : bool, optional
+            Check access to the topics with `can_subscribe` before connecting.
+            Defaults to True.
 
         Raises
         ------
@@ -217,13 +1037,196 @@ class Ntfy:
 
         """
 
+        if check:
+            await self.can_subscribe(topics)
+
+        dispatcher = Dispatcher(
+            callback,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            on_error=on_error,
+        )
+        try:
+            params = self._filters(title, message, tags, priority)
+            if since is not None:
+                params["since"] = since
+            async for notification in self._listen(
+                topics,
+                params,
+                lazy=lazy,
+                reconnect=reconnect,
+                transport=transport,
+                dedup=dedup,
+            ):
+                await dispatcher.dispatch(notification)
+            await dispatcher.join()
+        finally:
+            dispatcher.cancel()
+
+    @overload
+    def stream(
+        self,
+        topics: list[str],
+        title: str | None = None,
+        message: str | None = None,
+        tags: list[str] | None = None,
+        priority: list[int] | None = None,
+        *,
+        lazy: Literal[False] = False,
+        buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        overflow: QueueFullPolicy = QueueFullPolicy.BLOCK,
+        reconnect: RetryPolicy | None = None,
+        transport: Transport = Transport.WEBSOCKET,
+        dedup: Deduplicator | None = None,
+    ) -> AsyncIterator[Notification]: ...
+
+    @overload
+    def stream(
+        self,
+        topics: list[str],
+        title: str | None = None,
+        message: str | None = None,
+        tags: list[str] | None = None,
+        priority: list[int] | None = None,
+        *,
+        lazy: Literal[True],
+        buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        overflow: QueueFullPolicy = QueueFullPolicy.BLOCK,
+        reconnect: RetryPolicy | None = None,
+        transport: Transport = Transport.WEBSOCKET,
+        dedup: Deduplicator | None = None,
+    ) -> AsyncIterator[LazyNotification]: ...
+
+    async def stream(  # noqa: PLR0913
+        self,
+        topics: list[str],
+        title: str | None = None,
+        message: str | None = None,
+        tags: list[str] | None = None,
+        priority: list[int] | None = None,
+        *,
+        lazy: bool = False,
+        buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        overflow: QueueFullPolicy = QueueFullPolicy.BLOCK,
+        reconnect: RetryPolicy | None = None,
+        transport: Transport = Transport.WEBSOCKET,
+        dedup: Deduplicator | None = None,
+    ) -> AsyncIterator[Notification | LazyNotification]:
+        """Subscribe to one or more ntfy topics and iterate over notifications.
+
+        Notifications are read from the websocket by a background task into a
+        bounded buffer, so the consumer can process them at its own pace.
+
+        Parameters
+        ----------
+        topics : list[str]
+            A list of topic names to subscribe to.
+        title, message, tags, priority : optional
+            Filters, see `subscribe`.
+        lazy : bool, optional
+            Yield `LazyNotification` objects, which decode their fields on first
+            access. Defaults to False.
+        buffer_size : int, optional
+            Maximum number of buffered notifications, defaults to 100.
+        overflow : QueueFullPolicy, optional
+            Behavior when the buffer is full. `QueueFullPolicy.BLOCK` stops
+            reading from the websocket until the consumer catches up,
+            `QueueFullPolicy.DROP` drops the newest and `QueueFullPolicy.SHED`
+            the oldest notification, and `QueueFullPolicy.RAISE` ends the stream
+            with `NtfyQueueFullError` once the buffered notifications have been
+            consumed. Defaults to `QueueFullPolicy.BLOCK`.
+        reconnect : RetryPolicy, optional
+            Reconnect with backoff when the websocket is closed or fails,
+            resuming after the last received message so that messages sent in
+            the meantime are not lost. Duplicates received around the
+            reconnect are skipped. The error is raised after `max_attempts`
+            consecutive failed connection attempts. Defaults to None, which
+            ends the subscription when the websocket is closed.
+        transport : Transport, optional
+            Receive notifications over a websocket (`Transport.WEBSOCKET`) or
+            a streamed HTTP response of newline-delimited JSON
+            (`Transport.HTTP`), e.g. if websockets are blocked. Defaults to
+            `Transport.WEBSOCKET`.
+        dedup : Deduplicator, optional
+            Skip notifications whose ID was already received, e.g. when
+            subscribing to the same topics on redundant servers. Pass the same
+            instance to several subscriptions to deduplicate across them.
+            Defaults to None.
+
+        Yields
+        ------
+        Notification or LazyNotification
+            The received notifications.
+
+        Raises
+        ------
+        NtfyTimeoutError
+            If a timeout occurs during the subscription.
+        NtfyConnectionError
+            If a client error occurs during the subscription.
+        NtfyQueueFullError
+            If the buffer overflowed and `overflow` is `QueueFullPolicy.RAISE`.
+        """
+
+        if buffer_size < 1:
+            msg = "buffer_size must be at least 1"
+            raise ValueError(msg)
+
         await self.can_subscribe(topics)
 
-        url = (
-            self.url.with_scheme("wss" if self.url.scheme == "https" else "ws")
-            / ",".join(topics)
-            / "ws"
+        buffer: asyncio.Queue[Notification | LazyNotification | Exception | None] = (
+            asyncio.Queue(buffer_size)
         )
+
+        async def read() -> None:
+            dropped = 0
+            try:
+                async for notification in self._listen(
+                    topics,
+                    self._filters(title, message, tags, priority),
+                    lazy=lazy,
+                    reconnect=reconnect,
+                    transport=transport,
+                    dedup=dedup,
+                ):
+                    if overflow is QueueFullPolicy.BLOCK:
+                        await buffer.put(notification)
+                        continue
+                    try:
+                        buffer.put_nowait(notification)
+                    except asyncio.QueueFull as e:
+                        if overflow is QueueFullPolicy.RAISE:
+                            raise NtfyQueueFullError from e
+                        if overflow is QueueFullPolicy.SHED:
+                            buffer.get_nowait()
+                            buffer.put_nowait(notification)
+                        dropped += 1
+                        _LOGGER.debug(
+                            "Stream buffer full, dropped %s notifications", dropped
+                        )
+            except Exception as e:  # noqa: BLE001
+                await buffer.put(e)
+            else:
+                await buffer.put(None)
+
+        reader = asyncio.create_task(read())
+        try:
+            while (item := await buffer.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            reader.cancel()
+
+    @staticmethod
+    def _filters(
+        title: str | None = None,
+        message: str | None = None,
+        tags: list[str] | None = None,
+        priority: list[int] | None = None,
+    ) -> dict[str, str]:
+        """Build the query parameters of the subscription filters."""
+
         params = {}
         if title is not None:
             params["title"] = title
@@ -233,6 +1236,147 @@ class Ntfy:
             params["tags"] = ",".join(tags)
         if priority is not None:
             params["priority"] = ",".join(str(x) for x in priority)
+        return params
+
+    def _shard(self, topics: list[str], suffix: str) -> list[list[str]]:
+        """Split topics into groups fitting into one URL ending with `suffix`."""
+
+        return shard_topics(
+            topics,
+            max_topics=self._topics_per_connection,
+            max_length=self._max_url_length - len(str(self.url / suffix)) - 1,
+        )
+
+    async def _listen(  # noqa: PLR0913
+        self,
+        topics: list[str],
+        params: dict[str, str],
+        *,
+        lazy: bool = False,
+        reconnect: RetryPolicy | None = None,
+        transport: Transport = Transport.WEBSOCKET,
+        dedup: Deduplicator | None = None,
+    ) -> AsyncIterator[Notification | LazyNotification]:
+        """Yield the notifications of a subscription, sharded if necessary."""
+
+        if len(shards := self._shard(topics, transport)) == 1:
+            async for notification in self._resume(
+                topics, params, lazy=lazy, reconnect=reconnect, transport=transport
+            ):
+                if not self._duplicate(notification, dedup):
+                    yield notification
+            return
+
+        merged: asyncio.Queue[Notification | LazyNotification | Exception | None] = (
+            asyncio.Queue(DEFAULT_STREAM_BUFFER_SIZE)
+        )
+
+        async def read(shard: list[str]) -> None:
+            try:
+                async for notification in self._resume(
+                    shard, params, lazy=lazy, reconnect=reconnect, transport=transport
+                ):
+                    await merged.put(notification)
+            except Exception as e:  # noqa: BLE001
+                await merged.put(e)
+            else:
+                await merged.put(None)
+
+        readers = [asyncio.create_task(read(shard)) for shard in shards]
+        try:
+            remaining = len(readers)
+            while remaining:
+                if (item := await merged.get()) is None:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                elif not self._duplicate(item, dedup):
+                    yield item
+        finally:
+            for reader in readers:
+                reader.cancel()
+
+    @staticmethod
+    def _duplicate(
+        notification: Notification | LazyNotification, dedup: Deduplicator | None
+    ) -> bool:
+        """Check if a notification was already received."""
+
+        return (
+            dedup is not None
+            and notification.event not in (Event.OPEN, Event.KEEPALIVE)
+            and dedup.seen(notification.id)
+        )
+
+    async def _resume(
+        self,
+        topics: list[str],
+        params: dict[str, str],
+        *,
+        lazy: bool = False,
+        reconnect: RetryPolicy | None = None,
+        transport: Transport = Transport.WEBSOCKET,
+    ) -> AsyncIterator[Notification | LazyNotification]:
+        """Yield the notifications of a connection, reconnecting if enabled."""
+
+        if reconnect is None:
+            async for notification in self._connect(
+                topics, params, lazy=lazy, transport=transport
+            ):
+                yield notification
+            return
+
+        recent = Deduplicator()
+        since = str(int(time()))
+        resume = False
+        attempt = 0
+        while True:
+            try:
+                async for notification in self._connect(
+                    topics,
+                    {**params, "since": since} if resume else params,
+                    lazy=lazy,
+                    transport=transport,
+                ):
+                    attempt = 0
+                    if notification.event is Event.MESSAGE:
+                        if recent.seen(notification.id):
+                            continue
+                        since = notification.id
+                    yield notification
+            except reconnect.retry_on as e:
+                attempt += 1
+                if attempt >= reconnect.max_attempts:
+                    raise
+                _LOGGER.debug("Subscription to %s failed: %r", topics, e)
+            else:
+                attempt += 1
+                _LOGGER.debug("Subscription to %s closed", topics)
+
+            resume = True
+            await asyncio.sleep(reconnect.delay(attempt))
+
+    async def _connect(
+        self,
+        topics: list[str],
+        params: dict[str, str],
+        *,
+        lazy: bool = False,
+        transport: Transport = Transport.WEBSOCKET,
+    ) -> AsyncIterator[Notification | LazyNotification]:
+        """Open a subscription and yield the received notifications."""
+
+        if transport is Transport.HTTP:
+            async for notification in self._read_json(topics, params, lazy=lazy):
+                yield notification
+            return
+
+        url = (
+            self.url.with_scheme("wss" if self.url.scheme == "https" else "ws")
+            / ",".join(topics)
+            / "ws"
+        )
+        parse = LazyNotification.from_json if lazy else Notification.from_json
 
         try:
             async with self._session.ws_connect(
@@ -240,7 +1384,7 @@ class Ntfy:
             ) as ws:
                 async for msg in ws:
                     if msg.type == WSMsgType.TEXT:
-                        callback(Notification.from_json(msg.data))
+                        yield parse(msg.data)
                     elif msg.type in (
                         WSMsgType.CLOSE,
                         WSMsgType.CLOSING,
@@ -254,6 +1398,123 @@ class Ntfy:
         except ClientError as e:
             raise NtfyConnectionError from e
 
+    async def _read_json(
+        self, topics: list[str], params: dict[str, str], *, lazy: bool = False
+    ) -> AsyncIterator[Notification | LazyNotification]:
+        """Request newline-delimited JSON and yield notifications as they arrive.
+
+        The stream has no total timeout; reads time out if not even one of the
+        server's keepalive messages, sent every 45 seconds, arrives in time.
+        """
+
+        parse = LazyNotification.from_json if lazy else Notification.from_json
+        timeout = self._session.timeout
+
+        try:
+            async with self._session.request(
+                "GET",
+                self.url / ",".join(topics) / "json",
+                params=params,
+                headers=self._headers,
+                timeout=ClientTimeout(
+                    connect=timeout.connect,
+                    sock_connect=timeout.sock_connect or DEFAULT_STREAM_CONNECT_TIMEOUT,
+                    sock_read=max(timeout.sock_read or 0, DEFAULT_STREAM_READ_TIMEOUT),
+                    ceil_threshold=timeout.ceil_threshold,
+                ),
+            ) as r:
+                if r.status >= HTTPStatus.BAD_REQUEST:
+                    raise_http_error(**(await r.json()))
+                async for line in iter_lines(r.content.iter_any()):
+                    yield parse(line)
+        except TimeoutError as e:
+            raise NtfyTimeoutError from e
+        except ClientError as e:
+            raise NtfyConnectionError from e
+
+    @overload
+    def poll(
+        self,
+        topics: list[str],
+        since: str | int | datetime | None = None,
+        title: str | None = None,
+        message: str | None = None,
+        tags: list[str] | None = None,
+        priority: list[int] | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> AsyncIterator[Notification]: ...
+
+    @overload
+    def poll(
+        self,
+        topics: list[str],
+        since: str | int | datetime | None = None,
+        title: str | None = None,
+        message: str | None = None,
+        tags: list[str] | None = None,
+        priority: list[int] | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> AsyncIterator[LazyNotification]: ...
+
+    async def poll(  # noqa: PLR0913
+        self,
+        topics: list[str],
+        since: str | int | datetime | None = None,
+        title: str | None = None,
+        message: str | None = None,
+        tags: list[str] | None = None,
+        priority: list[int] | None = None,
+        *,
+        lazy: bool = False,
+    ) -> AsyncIterator[Notification | LazyNotification]:
+        """Fetch cached messages of one or more ntfy topics.
+
+        The response is parsed line by line while it is received, so large
+        message histories are iterated without loading them into memory.
+
+        Parameters
+        ----------
+        topics : list[str]
+            A list of topic names to fetch messages from.
+        since : str, int or datetime, optional
+            Only return messages after a message ID, a Unix timestamp or
+            datetime, or a duration like "10m". "all" and "latest" return all
+            messages or only the most recent one. Defaults to all messages.
+        title, message, tags, priority : optional
+            Filters, see `subscribe`.
+        lazy : bool, optional
+            Yield `LazyNotification` objects, which decode their fields on first
+            access. Defaults to False.
+
+        Yields
+        ------
+        Notification or LazyNotification
+            The cached messages.
+
+        Raises
+        ------
+        NtfyForbiddenAccessError
+            If the client is not authorized to read the given topics.
+        NtfyTimeoutError
+            If a timeout occurs during the request.
+        NtfyConnectionError
+            If a client error occurs during the request.
+        """
+
+        params = {**self._filters(title, message, tags, priority), "poll": "1"}
+        if since is not None:
+            params["since"] = (
+                str(int(since.timestamp()))
+                if isinstance(since, datetime)
+                else str(since)
+            )
+
+        for shard in self._shard(topics, Transport.HTTP):
+            async for notification in self._read_json(shard, params, lazy=lazy):
+                yield notification
+
     async def can_subscribe(self, topics: list[str]) -> bool:
         """Check if the client can subscribe to a topic.
 
@@ -273,7 +1534,12 @@ class Ntfy:
             If the client is not authorized to subscribe to the given topics.
         """
 
-        await self._request("GET", self.url / ",".join(topics) / "auth")
+        await asyncio.gather(
+            *(
+                self._request("GET", self.url / ",".join(shard) / "auth")
+                for shard in self._shard(topics, "auth")
+            )
+        )
 
         return True
 
@@ -303,7 +1569,11 @@ class Ntfy:
         NtfyUnauthorizedAuthenticationError
             If the client is not authorized to access the account information.
         """
-        return Account.from_json(await self._request("GET", self.url / "v1/account"))
+        account = Account.from_json(await self._request("GET", self.url / "v1/account"))
+        if self._rate_limiter is not None:
+            self._rate_limiter.update_from_account(account)
+
+        return account
 
     async def generate_token(
         self,
@@ -387,7 +1657,7 @@ class Ntfy:
         NtfyUnauthorizedAuthenticationError
             If the client is not authenticated or the reservation does not exist.
         """
-        kwargs = {}
+        kwargs: dict[str, Any] = {}
 
         if delete_messages:
             kwargs["headers"] = {"X-Delete-Messages": "true"}
@@ -414,25 +1684,31 @@ class Ntfy:
     async def close(self) -> None:
         """Close session.
 
-        Closes the aiohttp ClientSession if it is not already closed.
+        Publishes all queued messages and closes the aiohttp ClientSession if it
+        is not already closed.
         """
+        await self._shutdown()
         if not self._session.closed:
             await self._session.close()
 
     async def __aenter__(self) -> Self:
         """Async enter.
 
+        Publishes the messages left in the outbox by a previous run.
+
         Returns
         -------
         Self
             The Ntfy client instance.
         """
+        await self.replay()
         return self
 
     async def __aexit__(self, *exc_info: object) -> None:
         """Async exit.
 
-        Closes the aiohttp ClientSession if it was created by this instance.
+        Publishes all queued messages and closes the aiohttp ClientSession if it
+        was created by this instance.
 
         Parameters
         ----------
@@ -441,3 +1717,18 @@ class Ntfy:
         """
         if self._close_session:
             await self.close()
+        else:
+            await self._shutdown()
+
+    async def _shutdown(self) -> None:
+        """Publish queued and pending messages and stop background tasks."""
+        await self._scheduler.close()
+        await self._publish_queue.close()
+        if self._coalescer is not None:
+            await self._coalescer.close()
+        if self._health_check is not None:
+            self._health_check.cancel()
+            await asyncio.gather(self._health_check, return_exceptions=True)
+            self._health_check = None
+        if self._outbox is not None:
+            await self._outbox.flush()
@@ -0,0 +1,240 @@
+"""Durable on-disk outbox for aiontfy."""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike
+import sqlite3
+from typing import Any, Self
+
+from .types import Message
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    message BLOB NOT NULL
+)
+"""
+
+
+class Outbox:
+    """Crash-safe outbox persisting messages in a SQLite database.
+
+    Messages are written to the outbox before they are published and removed
+    once the server accepted them, so messages that were queued or in flight
+    when the process died can be published again on the next start.
+
+    Writes are group-committed: all messages added while a commit is running
+    are written together in the next transaction, so a burst of messages costs
+    one fsync instead of one per message. Removals are not waited for and are
+    committed with the next batch; if the process dies before, the message is
+    published again (at-least-once delivery).
+
+    Messages added by this instance are in flight until they are marked
+    `done` or `release`d, and are not returned by `claim`, so that a replay
+    does not publish a message a second time while it is still being sent.
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        """Initialize outbox.
+
+        Parameters
+        ----------
+        path : str or PathLike[str]
+            Path of the SQLite database file, created if it does not exist.
+        """
+        self.path = path
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="aiontfy-outbox")
+        self._connection: sqlite3.Connection | None = None
+        self._inserts: list[tuple[bytes, asyncio.Future[int]]] = []
+        self._deletes: list[int] = []
+        self._in_flight: set[int] = set()
+        self._commit: asyncio.Task[None] | None = None
+        self.commits = 0
+
+    async def add(self, message: Message | bytes) -> int:
+        """Durably store a message.
+
+        Parameters
+        ----------
+        message : Message or bytes
+            The message to be published, or its JSON encoding, e.g. rendered
+            by a `MessageTemplate`.
+
+        Returns
+        -------
+        int
+            The outbox id of the message, to be passed to `done`.
+        """
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        data = message if isinstance(message, bytes) else message.to_jsonb()
+        self._inserts.append((data, future))
+        self._schedule()
+        return await future
+
+    def done(self, message_id: int) -> None:
+        """Remove a message that was published.
+
+        The message stays in flight until the removal is committed.
+
+        Parameters
+        ----------
+        message_id : int
+            The outbox id returned by `add` or `claim`.
+        """
+        self._deletes.append(message_id)
+        self._schedule()
+
+    def release(self, message_id: int) -> None:
+        """Keep a message that could not be published for a later `claim`.
+
+        Parameters
+        ----------
+        message_id : int
+            The outbox id returned by `add` or `claim`.
+        """
+        self._in_flight.discard(message_id)
+
+    async def pending(self) -> list[tuple[int, Message]]:
+        """Return the stored messages that were not published yet.
+
+        Returns
+        -------
+        list[tuple[int, Message]]
+            The outbox id and message of all stored messages, oldest first.
+        """
+        await self.flush()
+        rows = await self._run(self._select)
+        return [(message_id, Message.from_json(data)) for message_id, data in rows]
+
+    async def claim(self) -> list[tuple[int, Message]]:
+        """Return the stored messages that are not in flight and mark them.
+
+        Each claimed message must be passed to `done` or `release`.
+
+        Returns
+        -------
+        list[tuple[int, Message]]
+            The outbox id and message of the claimed messages, oldest first.
+        """
+        claimed = [
+            (message_id, message)
+            for message_id, message in await self.pending()
+            if message_id not in self._in_flight
+        ]
+        self._in_flight.update(message_id for message_id, _ in claimed)
+        return claimed
+
+    async def flush(self) -> None:
+        """Wait until all pending writes are committed."""
+        while self._commit is not None:
+            await asyncio.shield(self._commit)
+
+    async def close(self) -> None:
+        """Commit pending writes and close the database."""
+        await self.flush()
+        if self._connection is not None:
+            await self._run(self._connection.close)
+            self._connection = None
+        self._executor.shutdown()
+
+    async def __aenter__(self) -> Self:
+        """Async enter.
+
+        Returns
+        -------
+        Self
+            The outbox instance.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Async exit.
+
+        Commits pending writes and closes the database.
+
+        Parameters
+        ----------
+        *exc_info : object
+            Exception information.
+        """
+        await self.close()
+
+    def _schedule(self) -> None:
+        """Start a commit unless one is already running."""
+        if self._commit is None:
+            self._commit = asyncio.create_task(self._commit_batches())
+
+    async def _commit_batches(self) -> None:
+        """Commit batches of writes until no writes are pending."""
+        try:
+            while self._inserts or self._deletes:
+                inserts, self._inserts = self._inserts, []
+                deletes, self._deletes = self._deletes, []
+                try:
+                    ids = await self._run(
+                        self._write, [data for data, _ in inserts], deletes
+                    )
+                except (sqlite3.Error, OSError) as e:
+                    for _, future in inserts:
+                        if not future.done():
+                            future.set_exception(e)
+                    # retry the removals with the next batch
+                    self._deletes = deletes + self._deletes
+                    if not self._inserts:
+                        break
+                    continue
+                self.commits += 1
+                self._in_flight.update(ids)
+                self._in_flight.difference_update(deletes)
+                for message_id, (_, future) in zip(ids, inserts, strict=True):
+                    if not future.done():
+                        future.set_result(message_id)
+        finally:
+            self._commit = None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """Run a database operation on the outbox thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the database connection, opening it on first use."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self.path, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=FULL")
+            self._connection.execute(_SCHEMA)
+        return self._connection
+
+    def _write(self, inserts: list[bytes], deletes: list[int]) -> list[int]:
+        """Insert and delete messages in a single transaction."""
+        connection = self._connect()
+        connection.execute("BEGIN")
+        try:
+            ids = [
+                connection.execute(
+                    "INSERT INTO outbox (message) VALUES (?)", (data,)
+                ).lastrowid
+                or 0
+                for data in inserts
+            ]
+            connection.executemany(
+                "DELETE FROM outbox WHERE id = ?", [(i,) for i in deletes]
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return ids
+
+    def _select(self) -> list[tuple[int, bytes]]:
+        """Read all stored messages."""
+        return (
+            self._connect()
+            .execute("SELECT id, message FROM outbox ORDER BY id")
+            .fetchall()
+        )
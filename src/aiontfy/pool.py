@@ -0,0 +1,331 @@
+"""Topic-sharded client pool for aiontfy."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect, insort
+from collections.abc import Awaitable, Callable, Iterable
+from hashlib import blake2b
+from ssl import SSLContext
+from typing import TYPE_CHECKING, Any, Self
+
+from .const import (
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_HASH_REPLICAS,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_POOL_LIMIT,
+)
+from .helpers import create_session
+from .ntfy import Ntfy
+from .types import AttachmentData, Message, Notification, Transport
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession, ClientTimeout
+
+    from .dedup import Deduplicator
+    from .retry import RetryPolicy
+
+
+class HashRing:
+    """Consistent hash ring mapping keys to nodes.
+
+    Every node is placed on the ring at `replicas` pseudo-random points. A key
+    belongs to the first node point following the hash of the key, so adding
+    or removing a node only moves the keys of the ring segments it gains or
+    loses, about 1/n of all keys.
+    """
+
+    def __init__(
+        self, nodes: Iterable[str] = (), *, replicas: int = DEFAULT_HASH_REPLICAS
+    ) -> None:
+        """Initialize hash ring.
+
+        Parameters
+        ----------
+        nodes : Iterable[str], optional
+            Initial nodes of the ring.
+        replicas : int, optional
+            Number of points per node on the ring, more points spread the keys
+            more evenly. Defaults to 160.
+        """
+        self.replicas = replicas
+        self._hashes: list[int] = []
+        self._nodes: dict[int, str] = {}
+        for node in nodes:
+            self.add(node)
+
+    @staticmethod
+    def hash(key: str) -> int:
+        """Return the position of a key on the ring.
+
+        Uses a stable hash, so keys map to the same node in every process.
+        """
+        return int.from_bytes(blake2b(key.encode(), digest_size=8).digest())
+
+    @property
+    def nodes(self) -> set[str]:
+        """Nodes on the ring."""
+        return set(self._nodes.values())
+
+    def add(self, node: str) -> None:
+        """Add a node to the ring."""
+        for replica in range(self.replicas):
+            point = self.hash(f"{node}#{replica}")
+            if point not in self._nodes:
+                self._nodes[point] = node
+                insort(self._hashes, point)
+
+    def remove(self, node: str) -> None:
+        """Remove a node from the ring."""
+        self._nodes = {point: n for point, n in self._nodes.items() if n != node}
+        self._hashes = sorted(self._nodes)
+
+    def get(self, key: str) -> str:
+        """Return the node a key belongs to.
+
+        Raises
+        ------
+        LookupError
+            If the ring has no nodes.
+        """
+        if not self._hashes:
+            msg = "Hash ring has no nodes"
+            raise LookupError(msg)
+        index = bisect(self._hashes, self.hash(key)) % len(self._hashes)
+        return self._nodes[self._hashes[index]]
+
+
+class NtfyPool:
+    """Pool of ntfy clients sharding topics across several servers.
+
+    Topics are assigned to servers by consistent hashing, so publishing to and
+    subscribing to a topic always use the same server, and adding or removing
+    a server only moves the topics of that server. All clients share one
+    aiohttp ClientSession and its connection pool.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        urls: Iterable[str],
+        session: ClientSession | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        token: str | None = None,
+        *,
+        replicas: int = DEFAULT_HASH_REPLICAS,
+        pool_limit: int = DEFAULT_POOL_LIMIT,
+        pool_limit_per_host: int = 0,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int | None = DEFAULT_DNS_CACHE_TTL,
+        ssl: SSLContext | bool = True,
+        timeout: ClientTimeout | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize client pool.
+
+        Parameters
+        ----------
+        urls : Iterable[str]
+            Base URLs of the ntfy servers.
+        session : ClientSession, optional
+            An existing aiohttp ClientSession shared by all clients. If not
+            provided, a new session will be created.
+        replicas : int, optional
+            Number of points per server on the hash ring, defaults to 160.
+        pool_limit, pool_limit_per_host, keepalive_timeout, dns_cache_ttl, ssl, timeout
+            Options of the shared connection pool, see `Ntfy`. They are ignored
+            if `session` is provided.
+        **kwargs
+            Options passed to each `Ntfy` client. Stateful objects such as a
+            `RateLimiter` or `CircuitBreaker` would be shared by all servers and
+            should not be passed here.
+        """
+        self._credentials = (username, password, token)
+        self._kwargs = kwargs
+        self._close_session = session is None
+        self._session = (
+            session
+            if session is not None
+            else create_session(
+                pool_limit=pool_limit,
+                pool_limit_per_host=pool_limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                dns_cache_ttl=dns_cache_ttl,
+                ssl=ssl,
+                timeout=timeout,
+            )
+        )
+        self._ring = HashRing(replicas=replicas)
+        self.clients: dict[str, Ntfy] = {}
+        for url in urls:
+            self.add_server(url)
+
+    def add_server(self, url: str) -> Ntfy:
+        """Add a server to the pool.
+
+        Parameters
+        ----------
+        url : str
+            Base URL of the ntfy server.
+
+        Returns
+        -------
+        Ntfy
+            The client of the server.
+        """
+        if (client := self.clients.get(url)) is None:
+            client = Ntfy(url, self._session, *self._credentials, **self._kwargs)
+            self.clients[url] = client
+            self._ring.add(url)
+        return client
+
+    async def remove_server(self, url: str) -> None:
+        """Remove a server from the pool.
+
+        Queued messages of the server's client are published before it is
+        removed; its topics move to the remaining servers.
+
+        Parameters
+        ----------
+        url : str
+            Base URL of the ntfy server.
+        """
+        self._ring.remove(url)
+        if (client := self.clients.pop(url, None)) is not None:
+            await client.__aexit__(None, None, None)
+
+    def client(self, topic: str) -> Ntfy:
+        """Return the client of the server a topic is assigned to.
+
+        Raises
+        ------
+        LookupError
+            If the pool has no servers.
+        """
+        return self.clients[self._ring.get(topic)]
+
+    def shard(self, topics: Iterable[str]) -> dict[Ntfy, list[str]]:
+        """Group topics by the client of the server they are assigned to."""
+        shards: dict[Ntfy, list[str]] = {}
+        for topic in topics:
+            shards.setdefault(self.client(topic), []).append(topic)
+        return shards
+
+    async def publish(
+        self, message: Message, attachment: AttachmentData | None = None
+    ) -> Notification:
+        """Publish a message on the server of its topic.
+
+        See `Ntfy.publish`.
+        """
+        return await self.client(message.topic).publish(message, attachment)
+
+    async def enqueue(
+        self, message: Message, attachment: AttachmentData | None = None
+    ) -> bool:
+        """Queue a message to be published on the server of its topic.
+
+        See `Ntfy.enqueue`.
+        """
+        return await self.client(message.topic).enqueue(message, attachment)
+
+    async def clear(self, topic: str, sequence_id: str) -> Notification:
+        """Clear a notification on the server of its topic.
+
+        See `Ntfy.clear`.
+        """
+        return await self.client(topic).clear(topic, sequence_id)
+
+    async def delete(self, topic: str, sequence_id: str) -> Notification:
+        """Delete a notification on the server of its topic.
+
+        See `Ntfy.delete`.
+        """
+        return await self.client(topic).delete(topic, sequence_id)
+
+    async def subscribe(  # noqa: PLR0913
+        self,
+        topics: list[str],
+        callback: Callable[[Notification], Awaitable[None] | None],
+        title: str | None = None,
+        message: str | None = None,
+        tags: list[str] | None = None,
+        priority: list[int] | None = None,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = False,
+        on_error: Callable[[Exception, Notification], None] | None = None,
+        reconnect: RetryPolicy | None = None,
+        transport: Transport = Transport.WEBSOCKET,
+        dedup: Deduplicator | None = None,
+    ) -> None:
+        """Subscribe to topics on the servers they are assigned to.
+
+        One subscription is opened per server. If any subscription fails, the
+        others are cancelled and the error is raised. Pass `dedup` to receive
+        every message only once across the servers. See `Ntfy.subscribe`.
+        """
+        tasks = [
+            asyncio.create_task(
+                client.subscribe(
+                    shard,
+                    callback,
+                    title,
+                    message,
+                    tags,
+                    priority,
+                    max_concurrency=max_concurrency,
+                    ordered=ordered,
+                    on_error=on_error,
+                    reconnect=reconnect,
+                    transport=transport,
+                    dedup=dedup,
+                )
+            )
+            for client, shard in self.shard(topics).items()
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def flush(self) -> None:
+        """Wait until the queued messages of all servers have been published."""
+        await asyncio.gather(*(client.flush() for client in self.clients.values()))
+
+    async def close(self) -> None:
+        """Close all clients and the shared session."""
+        await asyncio.gather(
+            *(client.__aexit__(None, None, None) for client in self.clients.values())
+        )
+        if not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> Self:
+        """Async enter.
+
+        Returns
+        -------
+        Self
+            The client pool instance.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Async exit.
+
+        Closes all clients, and the shared session if it was created by the pool.
+
+        Parameters
+        ----------
+        *exc_info : object
+            Exception information.
+        """
+        if self._close_session:
+            await self.close()
+        else:
+            await asyncio.gather(
+                *(client.__aexit__(*exc_info) for client in self.clients.values())
+            )
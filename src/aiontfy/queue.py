@@ -0,0 +1,237 @@
+"""Background publish queue for aiontfy."""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+import logging
+
+from .const import DEFAULT_PRIORITY_WEIGHTS, DEFAULT_QUEUE_WORKERS
+from .exceptions import NtfyQueueFullError
+from .types import AttachmentData, Message, Priority, QueueFullPolicy
+
+_LOGGER = logging.getLogger(__name__)
+
+_Item = tuple[Message, AttachmentData | None]
+
+
+def _priority(message: Message) -> int:
+    """Return the priority lane of a message."""
+    return message.priority if message.priority is not None else Priority.DEFAULT
+
+
+class _Lanes:
+    """One FIFO lane per priority with weighted fair dequeuing.
+
+    Lanes are served by smooth weighted round-robin: on every pop each
+    non-empty lane earns its weight in credit, the lane with the most credit is
+    served and pays the total weight of the non-empty lanes. With the default
+    weights a max priority message is served 16 times as often as a min
+    priority one, while lower lanes still make progress.
+    """
+
+    def __init__(self, weights: Mapping[int, int]) -> None:
+        """Initialize lanes with a weight per priority."""
+        self._weights = dict(weights)
+        self._lanes: dict[int, deque[_Item]] = {
+            priority: deque() for priority in sorted(weights)
+        }
+        self._credit = dict.fromkeys(weights, 0)
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of messages in all lanes."""
+        return self._size
+
+    def append(self, item: _Item) -> None:
+        """Append a message to the lane of its priority."""
+        self._lanes[_priority(item[0])].append(item)
+        self._size += 1
+
+    def popleft(self) -> _Item:
+        """Pop the oldest message of the lane with the most credit."""
+        active = [priority for priority, lane in self._lanes.items() if lane]
+        for priority in active:
+            self._credit[priority] += self._weights[priority]
+        served = max(reversed(active), key=self._credit.__getitem__)
+        self._credit[served] -= sum(self._weights[priority] for priority in active)
+        self._size -= 1
+        item = self._lanes[served].popleft()
+        if not self._lanes[served]:
+            self._credit[served] = 0
+        return item
+
+    def shed(self, priority: int) -> bool:
+        """Drop the oldest message of the lowest lane below `priority`."""
+        for lane_priority, lane in self._lanes.items():
+            if lane_priority >= priority:
+                break
+            if lane:
+                lane.popleft()
+                self._size -= 1
+                return True
+        return False
+
+
+class _PriorityQueue(asyncio.Queue[_Item]):
+    """Asyncio queue storing messages in priority lanes."""
+
+    def __init__(self, maxsize: int, weights: Mapping[int, int]) -> None:
+        """Initialize queue with a weight per priority lane."""
+        self._weights = weights
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:  # noqa: ARG002
+        """Create the lanes."""
+        self._queue = _Lanes(self._weights)
+
+    def _put(self, item: _Item) -> None:
+        """Add a message to its lane."""
+        self._queue.append(item)
+
+    def _get(self) -> _Item:
+        """Take the next message by weighted fair scheduling."""
+        return self._queue.popleft()
+
+    def shed(self, priority: int) -> bool:
+        """Drop a queued message of lower priority to make room."""
+        if not self._queue.shed(priority):
+            return False
+        self.task_done()
+        return True
+
+
+class PublishQueue:
+    """Queue of messages published in the background by worker tasks.
+
+    Messages are kept in one lane per priority, so urgent messages do not wait
+    behind a backlog of low priority messages. Messages without a priority use
+    the lane of `Priority.DEFAULT`.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[Message, AttachmentData | None], Awaitable[object]],
+        *,
+        maxsize: int = 0,
+        workers: int = DEFAULT_QUEUE_WORKERS,
+        policy: QueueFullPolicy = QueueFullPolicy.BLOCK,
+        weights: Mapping[int, int] = DEFAULT_PRIORITY_WEIGHTS,
+    ) -> None:
+        """Initialize publish queue.
+
+        Parameters
+        ----------
+        publish : Callable[[Message, AttachmentData | None], Awaitable[object]]
+            Coroutine function used by the workers to publish a message.
+        maxsize : int, optional
+            Maximum number of queued messages, 0 means unbounded. Defaults to 0.
+        workers : int, optional
+            Number of worker tasks draining the queue, defaults to 4.
+        policy : QueueFullPolicy, optional
+            Behavior when the queue is full, defaults to `QueueFullPolicy.BLOCK`.
+            With `QueueFullPolicy.SHED` the oldest message of the lowest priority
+            lane is dropped to make room for a message of higher priority.
+        weights : Mapping[int, int], optional
+            Share of the workers each priority lane gets while several lanes
+            have messages, defaults to doubling per priority from 1 for
+            `Priority.MIN` to 16 for `Priority.MAX`.
+
+        Raises
+        ------
+        ValueError
+            If `workers` or a weight is less than 1.
+        """
+        if workers < 1:
+            msg = "workers must be at least 1"
+            raise ValueError(msg)
+        if any(weight < 1 for weight in weights.values()):
+            msg = "weights must be at least 1"
+            raise ValueError(msg)
+
+        self._publish = publish
+        self._queue = _PriorityQueue(maxsize, {**DEFAULT_PRIORITY_WEIGHTS, **weights})
+        self._num_workers = workers
+        self._policy = policy
+        self._workers: list[asyncio.Task[None]] = []
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Return the number of queued messages."""
+        return self._queue.qsize()
+
+    async def put(
+        self, message: Message, attachment: AttachmentData | None = None
+    ) -> bool:
+        """Add a message to the queue.
+
+        Parameters
+        ----------
+        message : Message
+            The message to be published.
+        attachment : AttachmentData, optional
+            An attachment to upload with the message.
+
+        Returns
+        -------
+        bool
+            True if the message was queued, False if it was dropped. With
+            `QueueFullPolicy.SHED`, a queued message of lower priority may have
+            been dropped instead.
+
+        Raises
+        ------
+        NtfyQueueFullError
+            If the queue is full and the policy is `QueueFullPolicy.RAISE`.
+        """
+        self._start()
+
+        if self._policy is QueueFullPolicy.BLOCK:
+            await self._queue.put((message, attachment))
+            return True
+        try:
+            self._queue.put_nowait((message, attachment))
+        except asyncio.QueueFull as e:
+            if self._policy is QueueFullPolicy.RAISE:
+                raise NtfyQueueFullError from e
+            self.dropped += 1
+            if self._policy is QueueFullPolicy.SHED and self._queue.shed(
+                _priority(message)
+            ):
+                self._queue.put_nowait((message, attachment))
+                return True
+            return False
+        return True
+
+    async def join(self) -> None:
+        """Wait until all queued messages have been published."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Publish all queued messages and stop the worker tasks."""
+        await self.join()
+
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def _start(self) -> None:
+        """Start the worker tasks that are not running."""
+        self._workers = [task for task in self._workers if not task.done()]
+        self._workers.extend(
+            asyncio.create_task(self._worker())
+            for _ in range(self._num_workers - len(self._workers))
+        )
+
+    async def _worker(self) -> None:
+        """Publish messages from the queue."""
+        while True:
+            message, attachment = await self._queue.get()
+            try:
+                await self._publish(message, attachment)
+            except Exception:
+                _LOGGER.exception(
+                    "Failed to publish queued message to topic %s", message.topic
+                )
+            finally:
+                self._queue.task_done()
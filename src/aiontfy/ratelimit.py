@@ -0,0 +1,169 @@
+"""Client-side rate limiting for aiontfy."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from .const import (
+    DEFAULT_RATE_LIMIT_BACKOFF,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_RATE_LIMIT_RATE,
+    SECONDS_PER_DAY,
+)
+from .exceptions import NtfyTooManyRequestsError, NtfyTooManyRequestsLimitMessagesError
+
+if TYPE_CHECKING:
+    from .types import Account
+
+
+class TokenBucket:
+    """Token bucket replenishing `rate` tokens per second up to `burst` tokens."""
+
+    def __init__(self, rate: float, burst: float, tokens: float | None = None) -> None:
+        """Initialize token bucket.
+
+        Parameters
+        ----------
+        rate : float
+            Number of tokens added per second.
+        burst : float
+            Maximum number of tokens in the bucket.
+        tokens : float, optional
+            Number of tokens initially available, defaults to `burst`.
+
+        Raises
+        ------
+        ValueError
+            If `rate` or `burst` is not positive.
+        """
+        if rate <= 0 or burst <= 0:
+            msg = "rate and burst must be positive"
+            raise ValueError(msg)
+
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst if tokens is None else min(tokens, burst)
+        self._updated = monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens replenished since the last update."""
+        now = monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        """Return the number of seconds until a token is available."""
+        self._refill()
+
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        """Take a token from the bucket."""
+        self.tokens -= 1
+
+    def drain(self) -> None:
+        """Remove all tokens from the bucket."""
+        self._refill()
+        self.tokens = 0
+
+
+class RateLimiter:
+    """Client-side rate limiter for ntfy requests.
+
+    Requests are limited by a token bucket, and publishes additionally by a
+    message bucket once it has been seeded from the account limits. Requests
+    exceeding the limits wait locally instead of being rejected by the server.
+    When the server answers with 429 Too Many Requests anyway, the request rate
+    is reduced and slowly recovers with every successful request.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE_LIMIT_RATE,
+        burst: int = DEFAULT_RATE_LIMIT_BURST,
+        *,
+        backoff: float = DEFAULT_RATE_LIMIT_BACKOFF,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Parameters
+        ----------
+        rate : float, optional
+            Number of requests per second, defaults to 0.2 (ntfy server default).
+        burst : int, optional
+            Number of requests that can be sent at once, defaults to 60
+            (ntfy server default).
+        backoff : float, optional
+            Factor the request rate is multiplied with after a 429 response,
+            defaults to 0.5.
+        """
+        self.requests = TokenBucket(rate, burst)
+        self.messages: TokenBucket | None = None
+        self._rate = rate
+        self._backoff = backoff
+        self._lock = asyncio.Lock()
+
+    def update_from_account(self, account: Account) -> None:
+        """Seed the message bucket from the account limits and stats.
+
+        ntfy replenishes the daily message quota continuously, so the bucket
+        refills at `limits.messages` per day and starts with the remaining
+        messages of the account.
+
+        Parameters
+        ----------
+        account : Account
+            The account information returned by `Ntfy.account`.
+        """
+        if account.limits is None or account.limits.messages <= 0:
+            return
+
+        self.messages = TokenBucket(
+            account.limits.messages / SECONDS_PER_DAY,
+            account.limits.messages,
+            account.stats.messages_remaining,
+        )
+
+    async def acquire(self, *, message: bool = False) -> None:
+        """Wait until a request can be sent.
+
+        Parameters
+        ----------
+        message : bool, optional
+            Whether the request publishes a message and counts against the
+            message quota, defaults to False.
+        """
+        async with self._lock:
+            while delay := max(  # noqa: ASYNC110
+                self.requests.delay(),
+                self.messages.delay() if message and self.messages else 0.0,
+            ):
+                await asyncio.sleep(delay)
+
+            self.requests.consume()
+            if message and self.messages:
+                self.messages.consume()
+
+    def success(self) -> None:
+        """Recover the request rate after a successful request."""
+        self.requests.rate = min(self._rate, self.requests.rate + self._rate / 10)
+
+    def rate_limited(self, error: NtfyTooManyRequestsError) -> None:
+        """Slow down after the server rejected a request with 429.
+
+        Parameters
+        ----------
+        error : NtfyTooManyRequestsError
+            The error raised for the rejected request.
+        """
+        if (
+            isinstance(error, NtfyTooManyRequestsLimitMessagesError)
+            and self.messages is not None
+        ):
+            self.messages.drain()
+            return
+
+        self.requests.drain()
+        self.requests.rate *= self._backoff
@@ -0,0 +1,197 @@
+"""Retry policy and circuit breaker for aiontfy."""
+
+from dataclasses import dataclass
+from enum import StrEnum
+import random
+from time import monotonic
+
+from .const import (
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_RESET_TIMEOUT,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_MAX_BACKOFF,
+)
+from .exceptions import (
+    NtfyCircuitOpenError,
+    NtfyConnectionError,
+    NtfyInternalServerError,
+    NtfyTimeoutError,
+)
+
+TRANSIENT_ERRORS: tuple[type[Exception], ...] = (
+    NtfyConnectionError,
+    NtfyTimeoutError,
+    NtfyInternalServerError,
+)
+REPLAYABLE_BODIES = (bytes, bytearray, memoryview)
+
+
+@dataclass(kw_only=True, frozen=True)
+class RetryPolicy:
+    """Retry policy for failed requests.
+
+    Attributes
+    ----------
+    max_attempts : int, optional
+        Maximum number of attempts including the first one, defaults to 3.
+    retry_on : tuple[type[Exception], ...], optional
+        Exceptions that are retried, defaults to connection errors, timeouts
+        and 500 Internal Server Errors.
+    methods : frozenset[str], optional
+        HTTP methods that are retried. Defaults to the idempotent methods GET,
+        HEAD, OPTIONS, PUT and DELETE; add POST to also retry published messages.
+    backoff : float, optional
+        Delay in seconds before the first retry, doubled on every further retry.
+        Defaults to 0.5.
+    max_backoff : float, optional
+        Maximum delay in seconds between retries, defaults to 10.
+    jitter : float, optional
+        Fraction of the delay that is randomized, 1.0 means full jitter.
+        Defaults to 1.0.
+    deadline : float or None, optional
+        Overall time in seconds for all attempts of a request, defaults to None.
+    """
+
+    max_attempts: int = DEFAULT_RETRY_ATTEMPTS
+    retry_on: tuple[type[Exception], ...] = TRANSIENT_ERRORS
+    methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    backoff: float = DEFAULT_RETRY_BACKOFF
+    max_backoff: float = DEFAULT_RETRY_MAX_BACKOFF
+    jitter: float = 1.0
+    deadline: float | None = None
+
+    def is_retryable(self, method: str, data: object = None) -> bool:
+        """Check if a request can be retried.
+
+        Requests with a streamed body are never retried, because the body
+        cannot be sent again.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method of the request.
+        data : object, optional
+            Request body.
+
+        Returns
+        -------
+        bool
+            True if the request can be retried.
+        """
+        return method in self.methods and (
+            data is None or isinstance(data, REPLAYABLE_BODIES)
+        )
+
+    def delay(self, attempt: int) -> float:
+        """Return the delay before the next attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of the attempt that failed, starting at 1.
+
+        Returns
+        -------
+        float
+            Delay in seconds.
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())  # noqa: S311
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker failing fast while the server is unhealthy.
+
+    After `failure_threshold` consecutive transient failures the circuit opens
+    and requests fail immediately with `NtfyCircuitOpenError`. Once
+    `reset_timeout` has passed, a single trial request is let through; the
+    circuit closes if it succeeds and opens again if it fails.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_CIRCUIT_RESET_TIMEOUT,
+        *,
+        failure_on: tuple[type[Exception], ...] = TRANSIENT_ERRORS,
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Parameters
+        ----------
+        failure_threshold : int, optional
+            Number of consecutive failures that open the circuit, defaults to 5.
+        reset_timeout : float, optional
+            Seconds the circuit stays open before a trial request, defaults to 30.
+        failure_on : tuple[type[Exception], ...], optional
+            Exceptions counted as failures, defaults to connection errors,
+            timeouts and 500 Internal Server Errors.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_on = failure_on
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+
+    def before_request(self) -> None:
+        """Check if a request may be sent.
+
+        Raises
+        ------
+        NtfyCircuitOpenError
+            If the circuit is open or a trial request is already in flight.
+        """
+        if self.state is CircuitState.CLOSED:
+            return
+        if (
+            self.state is CircuitState.OPEN
+            and monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self.state = CircuitState.HALF_OPEN
+            return
+        raise NtfyCircuitOpenError
+
+    def record_success(self) -> None:
+        """Record a request the server responded to."""
+        self.failures = 0
+        self.state = CircuitState.CLOSED
+
+    def record_cancelled(self) -> None:
+        """Record a request that ended without a response, e.g. cancelled.
+
+        Such a trial request opens the circuit again, otherwise the circuit
+        would stay half-open and reject all further requests.
+        """
+        if self.state is CircuitState.HALF_OPEN:
+            self.state = CircuitState.OPEN
+            self._opened_at = monotonic()
+
+    def record_failure(self, error: Exception) -> None:
+        """Record a failed request.
+
+        Parameters
+        ----------
+        error : Exception
+            The exception raised for the request.
+        """
+        if not isinstance(error, self.failure_on):
+            self.record_success()
+            return
+
+        self.failures += 1
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            self.state = CircuitState.OPEN
+            self._opened_at = monotonic()
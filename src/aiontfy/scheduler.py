@@ -0,0 +1,309 @@
+"""Scheduler for one-off and recurring publishes for aiontfy."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
+import heapq
+import itertools
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from .const import DEFAULT_MAX_CONCURRENCY
+
+if TYPE_CHECKING:
+    from .types import Message
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ScheduledPublish:
+    """Handle of a scheduled publish.
+
+    Attributes
+    ----------
+    message : Message
+        The message to be published.
+    interval : float or None
+        Seconds between runs, None for a one-off publish.
+    jitter : float
+        Maximum random delay in seconds added to every run.
+    next_run : float or None
+        Event loop time of the next run, None if no run is scheduled.
+    runs : int
+        Number of times the message was published.
+    skipped : int
+        Number of runs skipped because the previous run was still in progress.
+    """
+
+    def __init__(
+        self,
+        message: Message,
+        interval: float | None,
+        jitter: float,
+        *,
+        cancel: Callable[..., None],
+        reschedule: Callable[..., None],
+    ) -> None:
+        """Initialize scheduled publish.
+
+        Use `Scheduler.schedule` to create scheduled publishes.
+        """
+        self.message = message
+        self.interval = interval
+        self.jitter = jitter
+        self.next_run: float | None = None
+        self.runs = 0
+        self.skipped = 0
+        self._cancel = cancel
+        self._reschedule = reschedule
+
+    @property
+    def cancelled(self) -> bool:
+        """Return True if no further run is scheduled."""
+        return self.next_run is None
+
+    def cancel(self) -> None:
+        """Cancel all future runs. A run in progress is not interrupted."""
+        self._cancel(self)
+
+    def reschedule(self, delay: float, interval: float | None = None) -> None:
+        """Move the next run, optionally changing the interval.
+
+        Parameters
+        ----------
+        delay : float
+            Seconds from now until the next run.
+        interval : float, optional
+            New interval between runs, defaults to the current interval.
+        """
+        self._reschedule(self, delay, interval)
+
+
+_Entry = tuple[float, int, float, ScheduledPublish]
+
+
+class Scheduler:
+    """Run one-off and recurring publishes from a single timer.
+
+    Scheduled runs are kept in a heap and one timer handle is armed for the
+    earliest run, so every schedule costs one heap entry instead of a sleeping
+    task. Cancelled and rescheduled runs are removed lazily when they reach the
+    top of the heap, or when more than half of the heap is stale.
+
+    A run is skipped if the previous run of the same schedule is still in
+    progress, and at most `max_concurrency` publishes run at the same time; due
+    runs beyond that stay in the heap until a running publish finishes.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[Message], Awaitable[object]],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize scheduler.
+
+        Parameters
+        ----------
+        publish : Callable[[Message], Awaitable[object]]
+            Coroutine function publishing a message.
+        max_concurrency : int, optional
+            Maximum number of publishes running at the same time, defaults to 10.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is less than 1.
+        """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+
+        self._publish = publish
+        self._max_concurrency = max_concurrency
+        self._heap: list[_Entry] = []
+        self._entries: dict[ScheduledPublish, _Entry] = {}
+        self._running: dict[ScheduledPublish, asyncio.Task[None]] = {}
+        self._counter = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        """Return the number of scheduled publishes."""
+        return len(self._entries)
+
+    def schedule(
+        self,
+        message: Message,
+        *,
+        delay: float = 0.0,
+        interval: float | None = None,
+        jitter: float = 0.0,
+    ) -> ScheduledPublish:
+        """Schedule a message to be published.
+
+        Parameters
+        ----------
+        message : Message
+            The message to be published.
+        delay : float, optional
+            Seconds until the first run, defaults to 0.
+        interval : float, optional
+            Seconds between runs of a recurring publish. If not set, the message
+            is published once.
+        jitter : float, optional
+            Maximum random delay in seconds added to every run, to spread
+            publishes scheduled for the same time. Defaults to 0.
+
+        Returns
+        -------
+        ScheduledPublish
+            Handle to cancel or reschedule the publish.
+
+        Raises
+        ------
+        ValueError
+            If `interval` is not positive or `jitter` is negative.
+        """
+        if jitter < 0:
+            msg = "jitter must not be negative"
+            raise ValueError(msg)
+
+        job = ScheduledPublish(
+            message, None, jitter, cancel=self.cancel, reschedule=self.reschedule
+        )
+        self.reschedule(job, delay, interval)
+        return job
+
+    def reschedule(
+        self, job: ScheduledPublish, delay: float, interval: float | None = None
+    ) -> None:
+        """Move the next run of a scheduled publish.
+
+        Parameters
+        ----------
+        job : ScheduledPublish
+            The scheduled publish.
+        delay : float
+            Seconds from now until the next run.
+        interval : float, optional
+            New interval between runs, defaults to the current interval.
+
+        Raises
+        ------
+        ValueError
+            If `interval` is not positive.
+        """
+        if interval is not None:
+            if interval <= 0:
+                msg = "interval must be positive"
+                raise ValueError(msg)
+            job.interval = interval
+
+        self._push(job, asyncio.get_running_loop().time() + delay)
+
+    def cancel(self, job: ScheduledPublish) -> None:
+        """Cancel all future runs of a scheduled publish.
+
+        Parameters
+        ----------
+        job : ScheduledPublish
+            The scheduled publish.
+        """
+        if self._entries.pop(job, None) is not None:
+            job.next_run = None
+            self._compact()
+
+    async def close(self) -> None:
+        """Cancel all scheduled publishes and wait for running ones."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for job in list(self._entries):
+            self.cancel(job)
+
+        await asyncio.gather(*self._running.values(), return_exceptions=True)
+
+    def _push(self, job: ScheduledPublish, base: float) -> None:
+        """Schedule the next run of a job at `base` plus jitter."""
+        job.next_run = base + random.uniform(0, job.jitter)  # noqa: S311
+        entry = (job.next_run, next(self._counter), base, job)
+        replaced = self._entries.get(job) is not None
+        self._entries[job] = entry
+        heapq.heappush(self._heap, entry)
+        if replaced:
+            self._compact()
+
+        if self._heap[0] is entry:
+            self._arm()
+
+    def _compact(self) -> None:
+        """Drop stale entries once more than half of the heap is stale."""
+        if len(self._heap) > 2 * len(self._entries):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def _arm(self) -> None:
+        """Arm the timer for the earliest run unless all slots are taken."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = (
+            asyncio.get_running_loop().call_at(self._heap[0][0], self._run_due)
+            if self._heap and len(self._running) < self._max_concurrency
+            else None
+        )
+
+    def _run_due(self) -> None:
+        """Start all runs that are due and arm the timer for the next one."""
+        self._timer = None
+        now = asyncio.get_running_loop().time()
+
+        while self._heap and self._heap[0][0] <= now:
+            entry = self._heap[0]
+            _, _, base, job = entry
+            if self._entries.get(job) is not entry:
+                heapq.heappop(self._heap)
+                continue
+            if job not in self._running and len(self._running) >= (
+                self._max_concurrency
+            ):
+                break
+            heapq.heappop(self._heap)
+            del self._entries[job]
+
+            if job in self._running:
+                job.skipped += 1
+            else:
+                task = asyncio.create_task(self._run(job))
+                self._running[job] = task
+                task.add_done_callback(partial(self._finished, job))
+
+            if job.interval is None:
+                job.next_run = None
+            else:
+                next_base = max(base + job.interval, now)
+                job.next_run = next_base + random.uniform(0, job.jitter)  # noqa: S311
+                entry = (job.next_run, next(self._counter), next_base, job)
+                self._entries[job] = entry
+                heapq.heappush(self._heap, entry)
+
+        self._arm()
+
+    def _finished(self, job: ScheduledPublish, _: asyncio.Task[None]) -> None:
+        """Forget the finished run of a job and start waiting runs."""
+        del self._running[job]
+        if self._timer is None:
+            self._arm()
+
+    async def _run(self, job: ScheduledPublish) -> None:
+        """Publish the message of a job."""
+        job.runs += 1
+        try:
+            await self._publish(job.message)
+        except Exception:
+            _LOGGER.exception(
+                "Failed to publish scheduled message to topic %s",
+                job.message.topic,
+            )
@@ -0,0 +1,352 @@
+"""Multiplexed subscriptions with dynamic topics for aiontfy."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from functools import partial
+import inspect
+import logging
+from time import time
+from typing import TYPE_CHECKING, Self
+
+from .const import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_SUBSCRIPTION_BATCH_DELAY,
+    DEFAULT_TOPICS_PER_CONNECTION,
+)
+from .dispatch import Dispatcher
+from .types import Event, Notification, Transport
+
+if TYPE_CHECKING:
+    from .dedup import Deduplicator
+    from .ntfy import Ntfy
+    from .retry import RetryPolicy
+
+_LOGGER = logging.getLogger(__name__)
+
+Handler = Callable[[Notification], Awaitable[None] | None]
+
+
+@dataclass(eq=False)
+class _Connection:
+    """Websocket connection subscribed to a group of topics."""
+
+    topics: set[str] = field(default_factory=set)
+    task: asyncio.Task[None] | None = None
+    since: str | None = None
+
+
+class SubscriptionManager:
+    """Subscribe to many topics over a few multiplexed websocket connections.
+
+    Topics are grouped into connections of at most `topics_per_connection`
+    topics and received notifications are routed to the handlers of their
+    topic. Topics can be added and removed at any time; changes made within
+    `batch_delay` are applied together, so that every affected connection is
+    reconnected only once. Removed topics are taken out of their connections
+    and added topics fill the free space of reconnected connections first, so
+    that unaffected connections stay open. Handlers run outside of the
+    connections, so reconnecting does not interrupt running handlers.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        ntfy: Ntfy,
+        *,
+        topics_per_connection: int = DEFAULT_TOPICS_PER_CONNECTION,
+        batch_delay: float = DEFAULT_SUBSCRIPTION_BATCH_DELAY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = False,
+        on_error: Callable[[Exception, Notification], None] | None = None,
+        reconnect: RetryPolicy | None = None,
+        transport: Transport = Transport.WEBSOCKET,
+        dedup: Deduplicator | None = None,
+    ) -> None:
+        """Initialize subscription manager.
+
+        Parameters
+        ----------
+        ntfy : Ntfy
+            The client used for the subscriptions.
+        topics_per_connection : int, optional
+            Maximum number of topics subscribed over one connection, defaults
+            to 50.
+        batch_delay : float, optional
+            Seconds to collect topic changes before reconnecting, defaults to 0.5.
+        max_concurrency : int, optional
+            Maximum number of coroutine handlers running at once, defaults
+            to 10.
+        ordered : bool, optional
+            Handle notifications of the same topic one after another in the
+            order they were received. Defaults to False.
+        on_error : Callable[[Exception, Notification], None], optional
+            Called with the exception and the notification if a handler
+            raises. Defaults to logging the exception.
+        reconnect : RetryPolicy, optional
+            Reconnect policy of the connections, see `Ntfy.subscribe`.
+            Defaults to None.
+        transport : Transport, optional
+            Transport of the connections, see `Ntfy.subscribe`. Defaults to
+            `Transport.WEBSOCKET`.
+        dedup : Deduplicator, optional
+            Skip notifications whose ID was already received on any of the
+            connections, see `Ntfy.subscribe`. Defaults to None.
+        """
+        if topics_per_connection < 1:
+            msg = "topics_per_connection must be at least 1"
+            raise ValueError(msg)
+
+        self._ntfy = ntfy
+        self._topics_per_connection = topics_per_connection
+        self._batch_delay = batch_delay
+        self._on_error = on_error
+        self._dispatcher = Dispatcher(
+            self._route, max_concurrency=max_concurrency, ordered=ordered
+        )
+        self._reconnect = reconnect
+        self._transport = transport
+        self._dedup = dedup
+        self._handlers: dict[str, list[Handler]] = {}
+        self._connections: dict[str, _Connection] = {}
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self.reconnects = 0
+
+    @property
+    def topics(self) -> set[str]:
+        """Topics with at least one handler."""
+        return set(self._handlers)
+
+    @property
+    def connections(self) -> list[set[str]]:
+        """Topics of the open connections."""
+        return [
+            set(connection.topics)
+            for connection in dict.fromkeys(self._connections.values())
+        ]
+
+    def add(self, topic: str, handler: Handler) -> None:
+        """Add a handler for the notifications of a topic.
+
+        The topic is subscribed once the pending changes are applied.
+
+        Parameters
+        ----------
+        topic : str
+            The topic name.
+        handler : Callable[[Notification], Awaitable[None] | None]
+            Function or coroutine function called for every notification of
+            the topic.
+        """
+        self._handlers.setdefault(topic, []).append(handler)
+        if topic not in self._connections:
+            self._schedule_flush()
+
+    def remove(self, topic: str, handler: Handler | None = None) -> None:
+        """Remove a handler, or all handlers, of a topic.
+
+        The topic is unsubscribed once the pending changes are applied if no
+        handlers are left.
+
+        Parameters
+        ----------
+        topic : str
+            The topic name.
+        handler : Callable[[Notification], Awaitable[None] | None], optional
+            The handler to remove, defaults to all handlers of the topic.
+        """
+        handlers = self._handlers.get(topic, [])
+        if handler is not None and handler in handlers:
+            handlers.remove(handler)
+        if handler is None or not handlers:
+            self._handlers.pop(topic, None)
+            if topic in self._connections:
+                self._schedule_flush()
+
+    async def flush(self) -> None:
+        """Apply pending topic changes immediately.
+
+        Raises
+        ------
+        NtfyForbiddenAccessError
+            If the client is not authorized to subscribe to an added topic. The
+            handlers of the added topics are removed.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        async with self._lock:
+            added = self._handlers.keys() - self._connections.keys()
+            removed = self._connections.keys() - self._handlers.keys()
+
+            if added:
+                try:
+                    await self._ntfy.can_subscribe(sorted(added))
+                except Exception:
+                    for topic in added:
+                        self._handlers.pop(topic, None)
+                    raise
+
+            changed: dict[_Connection, None] = {}
+            for topic in removed:
+                connection = self._connections.pop(topic)
+                connection.topics.discard(topic)
+                changed[connection] = None
+
+            candidates = [*changed, *dict.fromkeys(self._connections.values())]
+            for topic in sorted(added):
+                target = next(
+                    (
+                        c
+                        for c in candidates
+                        if len(c.topics) < self._topics_per_connection
+                    ),
+                    None,
+                )
+                if target is None:
+                    target = _Connection()
+                    candidates.append(target)
+                target.topics.add(topic)
+                self._connections[topic] = target
+                changed[target] = None
+
+            for connection in changed:
+                self._connect(connection)
+
+    async def close(self) -> None:
+        """Close all connections, cancel running handlers and discard pending changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        tasks = [
+            connection.task
+            for connection in dict.fromkeys(self._connections.values())
+            if connection.task is not None
+        ]
+        if self._flush_task is not None:
+            tasks.append(self._flush_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._connections.clear()
+        self._dispatcher.cancel()
+        await self._dispatcher.join()
+
+    async def __aenter__(self) -> Self:
+        """Async enter.
+
+        Returns
+        -------
+        Self
+            The subscription manager instance.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Async exit.
+
+        Closes all connections.
+        """
+        await self.close()
+
+    def _schedule_flush(self) -> None:
+        """Apply pending changes once the batch delay has passed."""
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._batch_delay, self._start_flush
+            )
+
+    def _start_flush(self) -> None:
+        """Start applying pending changes in the background."""
+        self._timer = None
+        self._flush_task = asyncio.create_task(self._background_flush())
+
+    async def _background_flush(self) -> None:
+        """Apply pending changes and log errors."""
+        try:
+            await self.flush()
+        except Exception:
+            _LOGGER.exception("Error updating subscriptions")
+
+    def _connect(self, connection: _Connection) -> None:
+        """(Re)connect a connection with its current topics.
+
+        Reconnects resume after the last message received over the
+        connection, or from when it was first opened, so that no messages are
+        lost while reconnecting.
+        """
+        if connection.task is not None:
+            connection.task.cancel()
+            self.reconnects += 1
+        if not connection.topics:
+            connection.task = None
+            return
+
+        since = connection.since
+        if since is None:
+            connection.since = str(int(time()))
+        connection.task = asyncio.create_task(
+            self._ntfy.subscribe(
+                sorted(connection.topics),
+                partial(self._receive, connection),
+                max_concurrency=1,
+                reconnect=self._reconnect,
+                transport=self._transport,
+                dedup=self._dedup,
+                since=since,
+                check=False,
+            )
+        )
+        connection.task.add_done_callback(partial(self._connection_done, connection))
+
+    def _connection_done(
+        self, connection: _Connection, task: asyncio.Task[None]
+    ) -> None:
+        """Reconnect a failed or closed connection after the batch delay."""
+        if task.cancelled() or connection.task is not task:
+            return
+        if (error := task.exception()) is not None:
+            _LOGGER.error("Subscription failed: %r", error, exc_info=error)
+        else:
+            _LOGGER.debug("Subscription to %s closed", connection.topics)
+
+        connection.task = None
+        asyncio.get_running_loop().call_later(
+            self._batch_delay, self._restart, connection
+        )
+
+    def _restart(self, connection: _Connection) -> None:
+        """Reconnect a connection unless it was reconnected or closed."""
+        if connection.task is None and any(
+            self._connections.get(topic) is connection for topic in connection.topics
+        ):
+            self._connect(connection)
+
+    async def _receive(
+        self, connection: _Connection, notification: Notification
+    ) -> None:
+        """Dispatch a received notification and remember it for reconnects.
+
+        Notifications are received one at a time, so a notification that was
+        not dispatched before the connection is cancelled is received again
+        after reconnecting.
+        """
+        await self._dispatcher.dispatch(notification)
+        if notification.event is Event.MESSAGE:
+            connection.since = notification.id
+
+    async def _route(self, notification: Notification) -> None:
+        """Pass a notification to the handlers of its topic."""
+        for handler in list(self._handlers.get(notification.topic, ())):
+            try:
+                if inspect.isawaitable(result := handler(notification)):
+                    await result
+            except Exception as e:
+                if self._on_error is None:
+                    _LOGGER.exception("Error handling notification %s", notification.id)
+                else:
+                    self._on_error(e, notification)
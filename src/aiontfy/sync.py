@@ -0,0 +1,192 @@
+"""Synchronous ntfy client backed by a background event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine, Iterable
+from concurrent.futures import Future
+from datetime import datetime
+import threading
+from typing import TYPE_CHECKING, Any, Self
+
+from .ntfy import Ntfy
+
+if TYPE_CHECKING:
+    from .exceptions import NtfyException
+    from .types import (
+        Account,
+        AccountTokenResponse,
+        AttachmentData,
+        Everyone,
+        Message,
+        Notification,
+        Stats,
+        Version,
+    )
+
+
+class SyncNtfy:
+    """Blocking ntfy client for synchronous code.
+
+    Runs one event loop in a daemon thread and one `Ntfy` client with a
+    persistent session on it, so calls from synchronous code reuse the
+    connection pool instead of paying for a new event loop and session each
+    time. All methods are thread-safe and block until the request finished.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        username: str | None = None,
+        password: str | None = None,
+        token: str | None = None,
+        *,
+        timeout: float | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize synchronous Ntfy client.
+
+        Parameters
+        ----------
+        url : str
+            The base URL for the Ntfy service.
+        timeout : float, optional
+            Seconds to wait for a call before raising `TimeoutError`, defaults
+            to waiting for the client's own timeouts.
+        **kwargs
+            Options passed to the `Ntfy` client.
+        """
+        self._timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="aiontfy-sync", daemon=True
+        )
+        self._thread.start()
+        self._ntfy: Ntfy = self._call(
+            self._create(
+                url, username=username, password=password, token=token, **kwargs
+            )
+        )
+
+    @staticmethod
+    async def _create(*args: Any, **kwargs: Any) -> Ntfy:  # noqa: ANN401
+        """Create the client on the event loop thread."""
+        return Ntfy(*args, **kwargs)
+
+    async def _shutdown(self) -> None:
+        """Close the client and cancel the tasks left on the event loop."""
+        try:
+            await self._ntfy.close()
+        finally:
+            current = asyncio.current_task()
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._loop.shutdown_asyncgens()
+
+    def _call[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the event loop thread and wait for its result."""
+        future: Future[T] = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(self._timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def publish(
+        self, message: Message, attachment: AttachmentData | None = None
+    ) -> Notification:
+        """Publish a message to an ntfy topic. See `Ntfy.publish`."""
+        return self._call(self._ntfy.publish(message, attachment))
+
+    def publish_many(
+        self,
+        messages: Iterable[Message],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[Notification | NtfyException]:
+        """Publish many messages concurrently. See `Ntfy.publish_many`."""
+        return self._call(self._ntfy.publish_many(messages, **kwargs))
+
+    def enqueue(
+        self, message: Message, attachment: AttachmentData | None = None
+    ) -> bool:
+        """Queue a message to be published in the background. See `Ntfy.enqueue`."""
+        return self._call(self._ntfy.enqueue(message, attachment))
+
+    def flush(self) -> None:
+        """Wait until all queued messages have been published."""
+        self._call(self._ntfy.flush())
+
+    def clear(self, topic: str, sequence_id: str) -> Notification:
+        """Clear a notification. See `Ntfy.clear`."""
+        return self._call(self._ntfy.clear(topic, sequence_id))
+
+    def delete(self, topic: str, sequence_id: str) -> Notification:
+        """Delete a notification. See `Ntfy.delete`."""
+        return self._call(self._ntfy.delete(topic, sequence_id))
+
+    def can_subscribe(self, topics: list[str]) -> bool:
+        """Check if the client can subscribe to topics. See `Ntfy.can_subscribe`."""
+        return self._call(self._ntfy.can_subscribe(topics))
+
+    def stats(self) -> Stats:
+        """Get message statistics. See `Ntfy.stats`."""
+        return self._call(self._ntfy.stats())
+
+    def account(self) -> Account:
+        """Get account information. See `Ntfy.account`."""
+        return self._call(self._ntfy.account())
+
+    def generate_token(
+        self, label: str | None = None, expires: datetime | None = None
+    ) -> AccountTokenResponse:
+        """Generate a token for the account. See `Ntfy.generate_token`."""
+        return self._call(self._ntfy.generate_token(label, expires))
+
+    def reservation(self, topic: str, everyone: Everyone) -> bool:
+        """Reserve a topic. See `Ntfy.reservation`."""
+        return self._call(self._ntfy.reservation(topic, everyone))
+
+    def delete_reservation(self, topic: str, *, delete_messages: bool = False) -> bool:
+        """Delete a topic reservation. See `Ntfy.delete_reservation`."""
+        return self._call(
+            self._ntfy.delete_reservation(topic, delete_messages=delete_messages)
+        )
+
+    def version(self) -> Version:
+        """Get server version (admin-only). See `Ntfy.version`."""
+        return self._call(self._ntfy.version())
+
+    def close(self) -> None:
+        """Publish queued messages, close the session and stop the loop thread."""
+        if self._loop.is_closed():
+            return
+        try:
+            self._call(self._shutdown())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self) -> Self:
+        """Enter.
+
+        Returns
+        -------
+        Self
+            The SyncNtfy client instance.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Exit.
+
+        Publishes queued messages and closes the client.
+
+        Parameters
+        ----------
+        *exc_info : object
+            Exception information.
+        """
+        self.close()
@@ -0,0 +1,78 @@
+"""Precompiled message templates for aiontfy."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from .types import Message
+
+VARIABLE_FIELDS = ("message", "title", "tags")
+
+
+class MessageTemplate:
+    """A message with pre-serialized fixed fields.
+
+    The template message is validated and serialized once. Rendering only
+    encodes the variable fields `message`, `title` and `tags` and merges them
+    into the already encoded JSON payload.
+
+    Parameters
+    ----------
+    message : Message
+        The message providing the topic and all fixed fields. Its `message`,
+        `title` and `tags` are used as defaults for rendering.
+
+    Examples
+    --------
+    >>> template = MessageTemplate(Message(topic="alerts", priority=4))
+    >>> await ntfy.publish_template(template, message="Disk full", tags=["warning"])
+    """
+
+    __slots__ = ("_defaults", "_fixed", "topic")
+
+    def __init__(self, message: Message) -> None:
+        """Initialize message template."""
+        data = message.to_dict()
+
+        self.topic = message.topic
+        self._defaults = {key: data.pop(key) for key in VARIABLE_FIELDS}
+        self._fixed = b"," + orjson.dumps(data)[1:]
+
+    def render(
+        self,
+        *,
+        message: str | None = None,
+        title: str | None = None,
+        tags: list[str] | None = None,
+    ) -> bytes:
+        """Render the JSON payload of a message.
+
+        Parameters
+        ----------
+        message : str, optional
+            Message body, defaults to the message body of the template.
+        title : str, optional
+            Message title, defaults to the title of the template.
+        tags : list[str], optional
+            List of tags, defaults to the tags of the template.
+
+        Returns
+        -------
+        bytes
+            The JSON encoded message.
+        """
+        defaults = self._defaults
+
+        return (
+            orjson.dumps(
+                {
+                    "message": defaults["message"] if message is None else message,
+                    "title": defaults["title"] if title is None else title,
+                    "tags": defaults["tags"] if tags is None else tags,
+                }
+            )[:-1]
+            + self._fixed
+        )
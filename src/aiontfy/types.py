@@ -1,15 +1,50 @@
 """Type definitions for aiontfy."""
 
-from dataclasses import dataclass, field
+from collections.abc import AsyncIterable
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
 from enum import IntEnum, StrEnum
+from functools import cached_property
+from mmap import mmap
+from os import PathLike
+from typing import Any, BinaryIO, Self
 
 from mashumaro import field_options
 from mashumaro.mixins.orjson import DataClassORJSONMixin
+import orjson
 from yarl import URL
 
 from .const import MAX_PRIORITY, MIN_PRIORITY
 
+AttachmentData = (
+    bytes
+    | bytearray
+    | memoryview
+    | mmap
+    | str
+    | PathLike[str]
+    | BinaryIO
+    | AsyncIterable[bytes]
+)
+"""Attachment contents, a file path or a source the contents are streamed from."""
+
+X_HEADERS = {
+    "message": "X-Message",
+    "title": "X-Title",
+    "tags": "X-Tags",
+    "priority": "X-Priority",
+    "actions": "X-Actions",
+    "click": "X-Click",
+    "attach": "X-Attach",
+    "markdown": "X-Markdown",
+    "icon": "X-Icon",
+    "filename": "X-Filename",
+    "delay": "X-Delay",
+    "email": "X-Email",
+    "call": "X-Call",
+    "sequence_id": "X-Sequence-ID",
+}
+
 
 class DeleteAfter(IntEnum):
     """Delete after periods."""
@@ -44,6 +79,22 @@ class Sound(StrEnum):
     BEEP = "beep"
 
 
+class QueueFullPolicy(StrEnum):
+    """Behavior when the publish queue is full."""
+
+    BLOCK = "block"
+    DROP = "drop"
+    RAISE = "raise"
+    SHED = "shed"
+
+
+class Transport(StrEnum):
+    """Transport of subscriptions."""
+
+    WEBSOCKET = "ws"
+    HTTP = "json"
+
+
 class Everyone(StrEnum):
     """Everyone access."""
 
@@ -53,8 +104,58 @@ class Everyone(StrEnum):
     READ_WRITE = "read-write"
 
 
+class _ActionHeaderMixin:
+    """Serialization of ntfy actions for the X-Actions header."""
+
+    def to_x_header(self) -> str:
+        """Serialize the action in the format of the X-Actions header.
+
+        The fields are formatted once per action and reused, so messages sharing
+        the same action objects do not format them again. The `headers` and
+        `extras` dicts can still be changed in place, so they are formatted on
+        every call.
+        """
+        if (header := self._x_header) is not None:
+            return header
+        params: list[str] = []
+        for key, param in self._x_header_params:
+            if param is not None:
+                params.append(param)
+            else:
+                params.extend(
+                    f"{key}.{subkey}={subvalue!r}"
+                    for subkey, subvalue in getattr(self, key).items()
+                )
+        return ", ".join(params)
+
+    @cached_property
+    def _x_header(self) -> str | None:
+        """Cached X-Actions header serialization, None if it contains dicts."""
+        params = [param for _, param in self._x_header_params]
+        if None in params:
+            return None
+        return ", ".join(param for param in params if param is not None)
+
+    @cached_property
+    def _x_header_params(self) -> list[tuple[str, str | None]]:
+        """Cached formatted fields, None for dicts formatted on every call."""
+        params: list[tuple[str, str | None]] = []
+        for action_field in fields(self):  # type: ignore[arg-type]
+            key = action_field.name
+            value = getattr(self, key)
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                params.append((key, f"{key}={int(value)}"))
+            elif isinstance(value, dict):
+                params.append((key, None))
+            else:
+                params.append((key, f"{key}={str(value)!r}"))
+        return params
+
+
 @dataclass(kw_only=True, frozen=True)
-class HttpAction(DataClassORJSONMixin):
+class HttpAction(_ActionHeaderMixin, DataClassORJSONMixin):
     """An Http ntfy action.
 
     Attributes
@@ -83,7 +184,7 @@ class HttpAction(DataClassORJSONMixin):
 
 
 @dataclass(kw_only=True, frozen=True)
-class BroadcastAction(DataClassORJSONMixin):
+class BroadcastAction(_ActionHeaderMixin, DataClassORJSONMixin):
     """A broadcast ntfy action.
 
     Attributes
@@ -106,7 +207,7 @@ class BroadcastAction(DataClassORJSONMixin):
 
 
 @dataclass(kw_only=True, frozen=True)
-class ViewAction(DataClassORJSONMixin):
+class ViewAction(_ActionHeaderMixin, DataClassORJSONMixin):
     """A view ntfy action.
 
     Attributes
@@ -126,7 +227,7 @@ class ViewAction(DataClassORJSONMixin):
 
 
 @dataclass(kw_only=True, frozen=True)
-class CopyAction(DataClassORJSONMixin):
+class CopyAction(_ActionHeaderMixin, DataClassORJSONMixin):
     """A copy ntfy action.
 
     Attributes
@@ -225,53 +326,33 @@ class Message(DataClassORJSONMixin):
             raise ValueError(msg)
 
     def to_x_headers(self) -> dict[str, str]:
-        """Serialize the dataclass as a dict with X- keys (e.g., X-Message, X-Title)."""
-        mapping = {
-            "message": "X-Message",
-            "title": "X-Title",
-            "tags": "X-Tags",
-            "priority": "X-Priority",
-            "actions": "X-Actions",
-            "click": "X-Click",
-            "attach": "X-Attach",
-            "markdown": "X-Markdown",
-            "icon": "X-Icon",
-            "filename": "X-Filename",
-            "delay": "X-Delay",
-            "email": "X-Email",
-            "call": "X-Call",
-            "sequence_id": "X-Sequence-ID",
-        }
-        data = self.to_dict()
+        """Serialize the dataclass as a dict with X- keys (e.g., X-Message, X-Title).
 
+        The headers of the immutable fields are computed once per message and
+        cached. The `tags` and `actions` lists can still be changed in place, so
+        they are joined on every call, reusing the cached format of each action.
+        """
+        result = dict(self._x_headers)
+        if self.tags:
+            result[X_HEADERS["tags"]] = ",".join(self.tags)
+        if self.actions:
+            result[X_HEADERS["actions"]] = "; ".join(
+                action.to_x_header() for action in self.actions
+            )
+        return result
+
+    @cached_property
+    def _x_headers(self) -> dict[str, str]:
+        """Cached X- headers serialization of the immutable fields."""
         result = {}
-        for key, value in data.items():
-            if value is None or value == [] or key not in mapping:
+        for key, header in X_HEADERS.items():
+            value = getattr(self, key)
+            if value is None or isinstance(value, list):
                 continue
-            if key == "actions":
-                actions = []
-                for action in value:
-                    params = []
-                    for action_key, action_value in action.items():
-                        if action_value is None:
-                            continue
-                        if isinstance(action_value, bool):
-                            params.append(f"{action_key}={int(action_value)}")
-                        elif isinstance(action_value, dict):
-                            params.extend(
-                                f"{action_key}.{subkey}={subvalue!r}"
-                                for subkey, subvalue in action_value.items()
-                            )
-                        else:
-                            params.append(f"{action_key}={str(action_value)!r}")
-                    actions.append(", ".join(params))
-                result[mapping[key]] = "; ".join(actions)
-            elif isinstance(value, list):
-                result[mapping[key]] = ",".join(v for v in value)
-            elif isinstance(value, bool):
-                result[mapping[key]] = str(int(value))
+            if isinstance(value, bool):
+                result[header] = str(int(value))
             else:
-                result[mapping[key]] = (
+                result[header] = (
                     str(value)
                     .replace("\\", "\\\\")
                     .replace("\r", "\\r")
@@ -339,6 +420,145 @@ class Notification(DataClassORJSONMixin):
     sequence_id: str | None = None
 
 
+@dataclass(kw_only=True, frozen=True)
+class _Actions(DataClassORJSONMixin):
+    """Notification actions, decoded on their own by `LazyNotification`."""
+
+    actions: list[ViewAction | BroadcastAction | HttpAction] = field(
+        default_factory=list
+    )
+
+
+class LazyNotification:
+    """A notification decoding its fields on first access.
+
+    Wraps the decoded JSON object of a notification and only builds datetimes,
+    URLs, enums, actions and the attachment when a field is read, so consumers
+    reading just a few fields like `topic` and `message` skip most of the
+    deserialization. Decoded fields are cached. It has the same attributes as
+    `Notification` and compares equal to the eagerly decoded notification.
+    """
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initialize lazy notification.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The decoded JSON object of the notification.
+        """
+        self._data = data
+
+    @classmethod
+    def from_json(cls, data: str | bytes | bytearray) -> Self:
+        """Wrap a notification JSON document without decoding its fields."""
+        return cls(orjson.loads(data))
+
+    def to_notification(self) -> Notification:
+        """Decode all fields into a `Notification`."""
+        return Notification.from_dict(self._data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the notification like `Notification.to_dict`."""
+        return self.to_notification().to_dict()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field by field with a notification or lazy notification."""
+        if not isinstance(other, Notification | LazyNotification):
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name)
+            for f in fields(Notification)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return the representation of the undecoded notification."""
+        return f"{type(self).__name__}({self._data!r})"
+
+    @cached_property
+    def id(self) -> str:
+        """Message ID."""
+        return self._data["id"]
+
+    @cached_property
+    def time(self) -> datetime:
+        """Time the message was published."""
+        return timestamp(self._data["time"])
+
+    @cached_property
+    def expires(self) -> datetime | None:
+        """Time the message will be deleted."""
+        value = self._data.get("expires")
+        return timestamp(value) if value is not None else None
+
+    @cached_property
+    def event(self) -> Event:
+        """Message type."""
+        return Event(self._data["event"])
+
+    @cached_property
+    def topic(self) -> str:
+        """Topic the message was published to."""
+        return self._data["topic"]
+
+    @cached_property
+    def message(self) -> str | None:
+        """Message body."""
+        return self._data.get("message")
+
+    @cached_property
+    def title(self) -> str | None:
+        """Message title."""
+        return self._data.get("title")
+
+    @cached_property
+    def tags(self) -> list[str]:
+        """List of tags."""
+        return self._data.get("tags") or []
+
+    @cached_property
+    def priority(self) -> Priority | None:
+        """Message priority."""
+        value = self._data.get("priority")
+        return Priority(value) if value is not None else None
+
+    @cached_property
+    def click(self) -> URL | None:
+        """URL opened when the notification is clicked."""
+        value = self._data.get("click")
+        return URL(value) if value is not None else None
+
+    @cached_property
+    def icon(self) -> URL | None:
+        """URL of the notification icon."""
+        value = self._data.get("icon")
+        return URL(value) if value is not None else None
+
+    @cached_property
+    def actions(self) -> list[ViewAction | BroadcastAction | HttpAction]:
+        """Action buttons."""
+        value = self._data.get("actions")
+        return _Actions.from_dict({"actions": value}).actions if value else []
+
+    @cached_property
+    def attachment(self) -> Attachment | None:
+        """Details about an attachment."""
+        value = self._data.get("attachment")
+        return Attachment.from_dict(value) if value is not None else None
+
+    @cached_property
+    def content_type(self) -> str | None:
+        """Content type of the message body."""
+        return self._data.get("content_type")
+
+    @cached_property
+    def sequence_id(self) -> str | None:
+        """Sequence ID for updating or deleting the notification."""
+        return self._data.get("sequence_id")
+
+
 @dataclass(kw_only=True, frozen=True)
 class Stats(DataClassORJSONMixin):
     """Stats response.
@@ -5,7 +5,7 @@ from functools import lru_cache
 import pathlib
 from unittest.mock import AsyncMock, MagicMock
 
-from aiohttp import ClientResponse, ClientSession, WSMsgType
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, WSMsgType
 from aiohttp.web_ws import WebSocketResponse
 import pytest
 
@@ -20,6 +20,7 @@ MSG_DELETE = """{"id": "h6Y2hKA5sy0U", "time": 1743184726, "expires": 1743227926
 def mock_session() -> Generator[AsyncMock]:
     """Mock aiohttp ClientSession."""
     mock_session = AsyncMock(spec=ClientSession)
+    mock_session.timeout = ClientTimeout(total=300, sock_connect=30)
     mock_response = AsyncMock(spec=ClientResponse, status=200)
 
     mock_session.request.return_value.__aenter__.return_value = mock_response
@@ -0,0 +1,144 @@
+"""Tests for publishing messages with attachments."""
+
+from collections.abc import AsyncIterator
+import io
+import mmap
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from yarl import URL
+
+from aiontfy import Message, Ntfy
+
+from .conftest import MSG
+
+
+async def test_publish_attachment_bytes(mock_session: AsyncMock) -> None:
+    """Test publishing a message with an attachment."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    message = Message(topic="mytopic", title="Test", filename="file.txt")
+    ntfy = Ntfy("http://example.com", mock_session)
+
+    await ntfy.publish(message, b"attachment")
+
+    mock_session.request.assert_called_once_with(
+        "PUT",
+        URL("http://example.com/mytopic"),
+        headers={"X-Title": "Test", "X-Markdown": "0", "X-Filename": "file.txt"},
+        data=b"attachment",
+    )
+
+
+async def test_publish_attachment_path(mock_session: AsyncMock, tmp_path: Path) -> None:
+    """Test publishing an attachment from a file path streams the file."""
+
+    file = tmp_path / "log.txt"
+    file.write_bytes(b"attachment")
+    bodies = []
+
+    def request(*args: object, **kwargs: object) -> AsyncMock:
+        data = kwargs["data"]
+        assert isinstance(data, io.BufferedReader)
+        bodies.append(data.read())
+        return mock_session.request.return_value
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    mock_session.request.side_effect = request
+
+    ntfy = Ntfy("http://example.com", mock_session)
+
+    await ntfy.publish(Message(topic="mytopic"), file)
+
+    assert bodies == [b"attachment"]
+    assert mock_session.request.call_args.kwargs["headers"]["X-Filename"] == "log.txt"
+    assert mock_session.request.call_args.kwargs["data"].closed
+
+
+async def test_publish_attachment_str_path(
+    mock_session: AsyncMock, tmp_path: Path
+) -> None:
+    """Test a plain string is treated as file path, not as contents."""
+
+    file = tmp_path / "log.txt"
+    file.write_bytes(b"attachment")
+    bodies = []
+
+    def request(*args: object, **kwargs: object) -> AsyncMock:
+        data = kwargs["data"]
+        assert isinstance(data, io.BufferedReader)
+        bodies.append(data.read())
+        return mock_session.request.return_value
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    mock_session.request.side_effect = request
+
+    ntfy = Ntfy("http://example.com", mock_session)
+
+    await ntfy.publish(Message(topic="mytopic"), str(file))
+
+    assert bodies == [b"attachment"]
+    assert mock_session.request.call_args.kwargs["headers"]["X-Filename"] == "log.txt"
+
+
+async def test_publish_attachment_path_keeps_filename(
+    mock_session: AsyncMock, tmp_path: Path
+) -> None:
+    """Test the filename of the message takes precedence over the file name."""
+
+    file = tmp_path / "log.txt"
+    file.write_bytes(b"attachment")
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    ntfy = Ntfy("http://example.com", mock_session)
+
+    await ntfy.publish(Message(topic="mytopic", filename="bundle.txt"), file)
+
+    assert (
+        mock_session.request.call_args.kwargs["headers"]["X-Filename"] == "bundle.txt"
+    )
+
+
+async def test_publish_attachment_mmap(mock_session: AsyncMock, tmp_path: Path) -> None:
+    """Test publishing a memory-mapped attachment."""
+
+    file = tmp_path / "log.txt"
+    file.write_bytes(b"attachment")
+    bodies = []
+
+    def request(*args: object, **kwargs: object) -> AsyncMock:
+        data = kwargs["data"]
+        assert isinstance(data, memoryview)
+        bodies.append(data.tobytes())
+        return mock_session.request.return_value
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    mock_session.request.side_effect = request
+
+    ntfy = Ntfy("http://example.com", mock_session)
+
+    with (
+        file.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        await ntfy.publish(Message(topic="mytopic"), mapped)
+
+    assert bodies == [b"attachment"]
+
+
+async def test_publish_attachment_async_iterable(mock_session: AsyncMock) -> None:
+    """Test publishing an attachment from an async iterable."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b"attach"
+        yield b"ment"
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    ntfy = Ntfy("http://example.com", mock_session)
+    body = chunks()
+
+    await ntfy.publish(Message(topic="mytopic"), body)
+
+    assert mock_session.request.call_args.kwargs["data"] is body
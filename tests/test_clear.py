@@ -43,3 +43,15 @@ async def test_clear_message(mock_session: AsyncMock) -> None:
         "PUT",
         URL("http://example.com/mytopic/Mc3otamDNcpJ/clear"),
     )
+
+
+async def test_clear_without_parsing(mock_session: AsyncMock) -> None:
+    """Test clearing a message without parsing the response."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = (
+        MSG_CLEAR
+    )
+    ntfy = Ntfy("http://example.com", mock_session)
+
+    assert await ntfy.clear("mytopic", "Mc3otamDNcpJ", parse=False) is None
+    mock_session.request.return_value.__aenter__.return_value.text.assert_awaited_once()
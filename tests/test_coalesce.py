@@ -0,0 +1,186 @@
+"""Tests for publish coalescing."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from aiohttp import ClientError
+import pytest
+
+from aiontfy import Message, Notification, Ntfy
+from aiontfy.exceptions import NtfyConnectionError
+
+from .conftest import MSG
+
+
+async def test_coalesce_identical_messages(mock_session: AsyncMock) -> None:
+    """Test identical messages within the window are collapsed."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    ntfy = Ntfy("http://example.com", mock_session, coalesce_window=0.01)
+
+    results = await asyncio.gather(
+        *(
+            ntfy.publish(Message(topic="mytopic", message="Disk full"))
+            for _ in range(5)
+        ),
+        ntfy.publish(Message(topic="mytopic", message="Disk ok")),
+        ntfy.publish(Message(topic="other", message="Disk full")),
+    )
+
+    assert mock_session.request.call_count == 4
+    assert all(isinstance(result, Notification) for result in results)
+    assert results[0] == results[4]
+
+
+async def test_coalesce_sequence_id(mock_session: AsyncMock) -> None:
+    """Test messages with the same sequence ID are collapsed into the latest."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    ntfy = Ntfy("http://example.com", mock_session, coalesce_window=0.01)
+
+    await asyncio.gather(
+        ntfy.publish(Message(topic="mytopic", message="1", sequence_id="seq")),
+        ntfy.publish(Message(topic="mytopic", message="2", sequence_id="seq")),
+    )
+
+    assert [
+        call.kwargs["json"]["message"] for call in mock_session.request.call_args_list
+    ] == ["1", "2"]
+
+
+async def test_coalesce_count(mock_session: AsyncMock) -> None:
+    """Test the number of collapsed messages is added to the body."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        coalesce_window=0.01,
+        coalesce_count=True,
+    )
+
+    await asyncio.gather(
+        *(ntfy.publish(Message(topic="mytopic", message="Disk full")) for _ in range(4))
+    )
+
+    assert [
+        call.kwargs["json"]["message"] for call in mock_session.request.call_args_list
+    ] == ["Disk full", "Disk full (3x)"]
+
+
+async def test_coalesce_error(mock_session: AsyncMock) -> None:
+    """Test all publishers receive the error of the collapsed message."""
+
+    mock_session.request.side_effect = ClientError
+    ntfy = Ntfy("http://example.com", mock_session, coalesce_window=0.01)
+
+    results = await asyncio.gather(
+        *(ntfy.publish(Message(topic="mytopic")) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert mock_session.request.call_count == 2
+    assert all(isinstance(result, NtfyConnectionError) for result in results)
+
+
+async def test_coalesce_close(mock_session: AsyncMock) -> None:
+    """Test closing the client publishes pending messages immediately."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    ntfy = Ntfy("http://example.com", mock_session, coalesce_window=3600)
+
+    await ntfy.publish(Message(topic="mytopic"))
+    task = asyncio.create_task(ntfy.publish(Message(topic="mytopic")))
+    await asyncio.sleep(0)
+    await ntfy.close()
+
+    assert isinstance(await asyncio.wait_for(task, 1), Notification)
+    assert mock_session.request.call_count == 2
+
+
+async def test_coalesce_first_message_immediately(mock_session: AsyncMock) -> None:
+    """Test messages are not delayed unless they repeat within the window."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    ntfy = Ntfy("http://example.com", mock_session, coalesce_window=3600)
+
+    results = await asyncio.wait_for(
+        ntfy.publish_many(
+            [Message(topic="mytopic", message=str(i)) for i in range(20)],
+            max_concurrency=2,
+        ),
+        1,
+    )
+
+    assert all(isinstance(result, Notification) for result in results)
+    assert mock_session.request.call_count == 20
+    await ntfy.close()
+
+
+async def test_coalesce_not_attachments(mock_session: AsyncMock) -> None:
+    """Test messages with attachments are not collapsed."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    ntfy = Ntfy("http://example.com", mock_session, coalesce_window=3600)
+
+    await ntfy.publish(Message(topic="mytopic"), b"attachment")
+
+    mock_session.request.assert_called_once()
+
+
+@pytest.mark.parametrize("count", [1, 2])
+async def test_coalesce_stats(mock_session: AsyncMock, count: int) -> None:
+    """Test counters of published and collapsed messages."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    ntfy = Ntfy("http://example.com", mock_session, coalesce_window=0.01)
+
+    await asyncio.gather(
+        *(ntfy.publish(Message(topic="mytopic")) for _ in range(count))
+    )
+
+    assert ntfy._coalescer is not None
+    assert ntfy._coalescer.published == count
+    assert ntfy._coalescer.collapsed == count - 1
+
+
+async def test_coalesce_max_count(mock_session: AsyncMock) -> None:
+    """Test collapsed messages are published once the batch is full."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        coalesce_window=3600,
+        coalesce_max_count=2,
+    )
+
+    await asyncio.wait_for(
+        asyncio.gather(*(ntfy.publish(Message(topic="mytopic")) for _ in range(3))),
+        1,
+    )
+
+    assert mock_session.request.call_count == 2
+    with pytest.raises(ValueError, match="max_count"):
+        Ntfy(
+            "http://example.com", mock_session, coalesce_window=1, coalesce_max_count=0
+        )
+
+
+async def test_coalesce_error_without_publishers(mock_session: AsyncMock) -> None:
+    """Test the error is retrieved if all publishers were cancelled."""
+
+    mock_session.request.side_effect = ClientError
+    ntfy = Ntfy("http://example.com", mock_session, coalesce_window=0.01)
+
+    with pytest.raises(NtfyConnectionError):
+        await ntfy.publish(Message(topic="mytopic"))
+    task = asyncio.create_task(ntfy.publish(Message(topic="mytopic")))
+    await asyncio.sleep(0)
+    assert ntfy._coalescer is not None
+    (pending,) = ntfy._coalescer._pending.values()
+    task.cancel()
+    await ntfy.close()
+
+    assert not pending.future._log_traceback
+    assert isinstance(pending.future.exception(), NtfyConnectionError)
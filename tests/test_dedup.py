@@ -0,0 +1,82 @@
+"""Tests for message ID deduplication."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohttp import WSMsgType
+import orjson
+import pytest
+
+from aiontfy import Deduplicator, Ntfy
+
+from .conftest import MSG
+
+
+def test_deduplicator() -> None:
+    """Test duplicates are detected within the size limit."""
+
+    dedup = Deduplicator(2)
+
+    assert not dedup.seen("a")
+    assert not dedup.seen("b")
+    assert dedup.seen("a")
+    assert not dedup.seen("c")
+    assert not dedup.seen("a")
+    assert dedup.seen("c")
+
+    assert len(dedup) == 2
+    assert (dedup.hits, dedup.misses) == (2, 4)
+    assert dedup.hit_rate == pytest.approx(1 / 3)
+
+    dedup.clear()
+    assert len(dedup) == 0
+    assert dedup.hit_rate == 0.0
+
+
+def test_deduplicator_ttl() -> None:
+    """Test IDs are forgotten after the time to live."""
+
+    dedup = Deduplicator(ttl=10)
+
+    with patch("aiontfy.dedup.monotonic", return_value=0):
+        assert not dedup.seen("a")
+    with patch("aiontfy.dedup.monotonic", return_value=5):
+        assert not dedup.seen("b")
+        assert dedup.seen("a")
+    with patch("aiontfy.dedup.monotonic", return_value=10):
+        assert not dedup.seen("a")
+        assert dedup.seen("b")
+    assert len(dedup) == 2
+
+
+def test_deduplicator_invalid_size() -> None:
+    """Test the size must be positive."""
+
+    with pytest.raises(ValueError, match="size"):
+        Deduplicator(0)
+
+
+async def test_subscribe_dedup(mock_ws: AsyncMock) -> None:
+    """Test duplicates are skipped across subscriptions sharing a deduplicator."""
+
+    keepalive = orjson.dumps({**orjson.loads(MSG), "event": "keepalive"}).decode()
+    ws = mock_ws.ws_connect.return_value.__aenter__.return_value
+    ws.__aiter__.return_value = [
+        MagicMock(type=WSMsgType.TEXT, data=MSG),
+        MagicMock(type=WSMsgType.TEXT, data=MSG),
+        MagicMock(type=WSMsgType.TEXT, data=keepalive),
+        MagicMock(type=WSMsgType.CLOSED),
+    ]
+    callback = MagicMock()
+    dedup = Deduplicator()
+    ntfy = Ntfy("https://example.com", mock_ws, topics_per_connection=1)
+
+    await ntfy.subscribe(["test1", "test2"], callback, dedup=dedup)
+    await ntfy.subscribe(["test1"], callback, dedup=dedup)
+
+    assert [call.args[0].event for call in callback.call_args_list] == [
+        "message",
+        "keepalive",
+        "keepalive",
+        "keepalive",
+    ]
+    assert (dedup.hits, dedup.misses) == (5, 1)
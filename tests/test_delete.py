@@ -43,3 +43,15 @@ async def test_delete_message(mock_session: AsyncMock) -> None:
         "DELETE",
         URL("http://example.com/mytopic/Mc3otamDNcpJ"),
     )
+
+
+async def test_delete_without_parsing(mock_session: AsyncMock) -> None:
+    """Test deleting a message without parsing the response."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = (
+        MSG_DELETE
+    )
+    ntfy = Ntfy("http://example.com", mock_session)
+
+    assert await ntfy.delete("mytopic", "Mc3otamDNcpJ", parse=False) is None
+    mock_session.request.return_value.__aenter__.return_value.text.assert_awaited_once()
@@ -0,0 +1,166 @@
+"""Tests for dispatching notifications to async callbacks."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import WSMsgType
+import orjson
+import pytest
+
+from aiontfy import Dispatcher, Notification, Ntfy
+
+from .conftest import MSG
+
+
+@pytest.fixture
+def mock_ws_topics(mock_ws: AsyncMock) -> AsyncMock:
+    """Mock a websocket connection receiving messages of two topics."""
+
+    ws = mock_ws.ws_connect.return_value.__aenter__.return_value
+    ws.__aiter__.return_value = [
+        MagicMock(
+            type=WSMsgType.TEXT,
+            data=orjson.dumps(
+                {**orjson.loads(MSG), "topic": topic, "message": str(i)}
+            ).decode(),
+        )
+        for i, topic in enumerate(["a", "b", "a", "b", "a", "b"])
+    ] + [MagicMock(type=WSMsgType.CLOSED)]
+    return mock_ws
+
+
+async def test_subscribe_async_callback(mock_ws_topics: AsyncMock) -> None:
+    """Test coroutine callbacks run concurrently up to the limit."""
+
+    running = 0
+    max_running = 0
+    handled = []
+
+    async def callback(notification: Notification) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        handled.append(notification.message)
+        running -= 1
+
+    ntfy = Ntfy("https://example.com", mock_ws_topics)
+
+    await ntfy.subscribe(["a", "b"], callback, max_concurrency=2)
+
+    assert sorted(handled) == ["0", "1", "2", "3", "4", "5"]
+    assert max_running == 2
+
+
+async def test_subscribe_ordered(mock_ws_topics: AsyncMock) -> None:
+    """Test notifications of the same topic are handled in order."""
+
+    handled: dict[str, list[str]] = {"a": [], "b": []}
+
+    async def callback(notification: Notification) -> None:
+        # earlier notifications take longer
+        await asyncio.sleep(0.01 * (6 - int(notification.message or 0)))
+        handled[notification.topic].append(notification.message or "")
+
+    ntfy = Ntfy("https://example.com", mock_ws_topics)
+
+    await ntfy.subscribe(["a", "b"], callback, ordered=True)
+
+    assert handled == {"a": ["0", "2", "4"], "b": ["1", "3", "5"]}
+
+
+@pytest.mark.parametrize("sync", [True, False])
+async def test_subscribe_callback_error(
+    mock_ws_topics: AsyncMock, *, sync: bool
+) -> None:
+    """Test callback exceptions are reported and do not end the subscription."""
+
+    handled = []
+    errors = []
+
+    def handle(notification: Notification) -> None:
+        if notification.topic == "a":
+            raise ValueError(notification.message)
+        handled.append(notification.message)
+
+    async def async_handle(notification: Notification) -> None:
+        handle(notification)
+
+    ntfy = Ntfy("https://example.com", mock_ws_topics)
+
+    await ntfy.subscribe(
+        ["a", "b"],
+        handle if sync else async_handle,
+        on_error=lambda e, n: errors.append((str(e), n.topic)),
+    )
+
+    assert sorted(handled) == ["1", "3", "5"]
+    assert sorted(errors) == [("0", "a"), ("2", "a"), ("4", "a")]
+
+
+async def test_subscribe_callback_error_logged(
+    mock_ws: AsyncMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test callback exceptions are logged by default."""
+
+    async def callback(notification: Notification) -> None:
+        raise ValueError
+
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    await ntfy.subscribe(["test1"], callback)
+
+    assert "Error handling notification h6Y2hKA5sy0U" in caplog.text
+
+
+async def test_subscribe_cancel_callbacks(mock_ws: AsyncMock) -> None:
+    """Test running callbacks are cancelled with the subscription."""
+
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def callback(notification: Notification) -> None:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    ntfy = Ntfy("https://example.com", mock_ws)
+    task = asyncio.create_task(ntfy.subscribe(["test1"], callback))
+
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+async def test_dispatcher_invalid_concurrency() -> None:
+    """Test the concurrency limit must be positive."""
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        Dispatcher(MagicMock(), max_concurrency=0)
+
+
+async def test_subscribe_callback_returning_awaitable(mock_ws: AsyncMock) -> None:
+    """Test awaitables returned by plain callables are awaited."""
+
+    handled = []
+
+    class Handler:
+        async def __call__(self, notification: Notification) -> None:
+            await asyncio.sleep(0)
+            handled.append(notification.id)
+
+    async def handle(notification: Notification) -> None:
+        handled.append(notification.topic)
+
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    await ntfy.subscribe(["test1"], Handler())
+    await ntfy.subscribe(["test1"], lambda n: handle(n))  # noqa: PLW0108
+
+    assert handled == ["h6Y2hKA5sy0U", "test1"]
@@ -0,0 +1,90 @@
+"""Tests for the multi-process publish engine."""
+
+import pickle
+from unittest.mock import patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from aiontfy import Message, Notification, PublishEngine, engine
+from aiontfy.exceptions import NtfyBadRequestTopicInvalidError
+
+from .conftest import MSG
+
+
+async def handle_publish(request: web.Request) -> web.Response:
+    """Answer like ntfy, rejecting messages to an invalid topic."""
+    payload = await request.json()
+    if payload["topic"] == "invalid":
+        return web.json_response(
+            {"code": 40009, "http": 400, "error": "invalid topic"}, status=400
+        )
+    return web.Response(text=MSG, content_type="application/json")
+
+
+async def test_publish_engine() -> None:
+    """Test messages are published by worker processes in order."""
+
+    app = web.Application()
+    app.router.add_post("/", handle_publish)
+    messages = [Message(topic="mytopic", message=str(i)) for i in range(9)]
+    messages[4] = Message(topic="invalid")
+
+    async with (
+        TestServer(app) as server,
+        PublishEngine(
+            str(server.make_url("/")), processes=2, chunk_size=2
+        ) as publish_engine,
+    ):
+        results = await publish_engine.publish_many(messages)
+
+    assert len(results) == 9
+    assert isinstance(results[4], NtfyBadRequestTopicInvalidError)
+    assert all(
+        isinstance(result, Notification)
+        for index, result in enumerate(results)
+        if index != 4
+    )
+    assert publish_engine.published == 8
+    assert publish_engine.failed == 1
+    assert sum(publish_engine.per_process.values()) == 9
+
+
+def test_worker_closes_client() -> None:
+    """Test the client of a worker process is closed when the process exits."""
+
+    with patch("aiontfy.engine.atexit.register") as register:
+        engine._init_worker("http://example.com", {})
+
+    assert engine._worker is not None
+    loop, ntfy = engine._worker
+    register.assert_called_once_with(engine._close_worker)
+
+    engine._close_worker()
+
+    assert engine._worker is None
+    assert ntfy._session.closed
+    assert loop.is_closed()
+
+
+def test_publish_engine_chunk_size() -> None:
+    """Test the chunk size must be positive."""
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        PublishEngine("http://example.com", chunk_size=0)
+
+
+def test_http_error_pickle() -> None:
+    """Test HTTP errors can be passed between processes."""
+
+    error = NtfyBadRequestTopicInvalidError(40009, 400, "invalid topic", "link")
+    restored = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+    assert type(restored) is NtfyBadRequestTopicInvalidError
+    assert (restored.code, restored.http, restored.error, restored.link) == (
+        40009,
+        400,
+        "invalid topic",
+        "link",
+    )
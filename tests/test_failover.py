@@ -0,0 +1,146 @@
+"""Tests for multi-server failover."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from aiohttp import ClientError
+import pytest
+from yarl import URL
+
+from aiontfy import Message, Ntfy
+from aiontfy.exceptions import NtfyConnectionError
+
+from .conftest import MSG
+
+
+@pytest.fixture
+def servers(mock_session: AsyncMock) -> dict[str, bool]:
+    """Mock a primary and a fallback server that can be taken down."""
+
+    up = {"primary.example.com": False, "fallback.example.com": True}
+    health = AsyncMock()
+    health.__aenter__.return_value.status = 200
+    health.__aenter__.return_value.text.return_value = '{"healthy":true}'
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    def request(method: str, url: URL, **kwargs: object) -> AsyncMock:
+        if not up[url.host or ""]:
+            raise ClientError
+        if url.path == "/v1/health":
+            return health
+        return mock_session.request.return_value
+
+    mock_session.request.side_effect = request
+    return up
+
+
+async def test_failover(mock_session: AsyncMock, servers: dict[str, bool]) -> None:
+    """Test requests fail over to the next server."""
+
+    ntfy = Ntfy(
+        "https://primary.example.com/ntfy",
+        mock_session,
+        fallback_urls=["https://fallback.example.com"],
+    )
+
+    await ntfy.clear("my topic", "Mc3otamDNcpJ")
+
+    assert [call.args[1] for call in mock_session.request.call_args_list] == [
+        URL("https://primary.example.com/ntfy/my%20topic/Mc3otamDNcpJ/clear"),
+        URL("https://fallback.example.com/my%20topic/Mc3otamDNcpJ/clear"),
+    ]
+    assert ntfy.url == URL("https://fallback.example.com")
+
+    await ntfy.publish(Message(topic="mytopic"))
+    assert mock_session.request.call_args.args[1] == URL("https://fallback.example.com")
+    await ntfy.close()
+
+
+async def test_failover_all_servers_down(
+    mock_session: AsyncMock, servers: dict[str, bool]
+) -> None:
+    """Test the error is raised when all servers are down."""
+
+    servers["fallback.example.com"] = False
+    ntfy = Ntfy(
+        "https://primary.example.com",
+        mock_session,
+        fallback_urls=["https://fallback.example.com"],
+    )
+
+    with pytest.raises(NtfyConnectionError):
+        await ntfy.stats()
+
+    assert mock_session.request.call_count == 2
+    await ntfy.close()
+
+
+async def test_failover_restore_primary(
+    mock_session: AsyncMock, servers: dict[str, bool]
+) -> None:
+    """Test the primary server is restored once it is healthy."""
+
+    ntfy = Ntfy(
+        "https://primary.example.com",
+        mock_session,
+        fallback_urls=["https://fallback.example.com"],
+        health_check_interval=0.01,
+    )
+
+    await ntfy.publish(Message(topic="mytopic"))
+    assert ntfy.url == URL("https://fallback.example.com")
+
+    await asyncio.sleep(0.03)
+    assert ntfy.url == URL("https://fallback.example.com")
+
+    servers["primary.example.com"] = True
+    assert ntfy._health_check is not None
+    await asyncio.wait_for(ntfy._health_check, 1)
+
+    assert ntfy.url == URL("https://primary.example.com")
+    mock_session.request.assert_any_call(
+        "GET", URL("https://primary.example.com/v1/health")
+    )
+    await ntfy.close()
+
+
+async def test_no_failover_for_streamed_attachments(
+    mock_session: AsyncMock, servers: dict[str, bool]
+) -> None:
+    """Test streamed attachments are not sent to the fallback server."""
+
+    async def chunks():  # noqa: ANN202
+        yield b"attachment"
+
+    ntfy = Ntfy(
+        "https://primary.example.com",
+        mock_session,
+        fallback_urls=["https://fallback.example.com"],
+    )
+
+    with pytest.raises(NtfyConnectionError):
+        await ntfy.publish(Message(topic="mytopic"), chunks())
+
+    mock_session.request.assert_called_once()
+    await ntfy.close()
+
+
+async def test_close_awaits_health_check(
+    mock_session: AsyncMock, servers: dict[str, bool]
+) -> None:
+    """Test closing the client stops the health check."""
+
+    ntfy = Ntfy(
+        "https://primary.example.com",
+        mock_session,
+        fallback_urls=["https://fallback.example.com"],
+    )
+
+    await ntfy.publish(Message(topic="mytopic"))
+    health_check = ntfy._health_check
+    assert health_check is not None
+
+    await ntfy.close()
+
+    assert health_check.cancelled()
+    assert ntfy._health_check is None
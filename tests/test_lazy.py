@@ -0,0 +1,81 @@
+"""Tests for lazily decoded notifications."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+from aiontfy import LazyNotification, Notification, Ntfy
+
+from .conftest import MSG, MSG_2, MSG_CLEAR
+
+MSG_FULL = orjson.dumps(
+    {
+        **orjson.loads(MSG),
+        "actions": [
+            {"action": "view", "label": "Open", "url": "https://example.com/"},
+            {"action": "broadcast", "label": "Take picture", "clear": True},
+        ],
+        "attachment": {
+            "name": "image.jpg",
+            "url": "https://example.com/file/image.jpg",
+            "type": "image/jpeg",
+            "size": 1024,
+            "expires": 1743227926,
+        },
+        "content_type": "text/markdown",
+    }
+)
+
+
+@pytest.mark.parametrize("data", [MSG, MSG_2, MSG_CLEAR, MSG_FULL])
+def test_lazy_notification_equals_notification(data: str | bytes) -> None:
+    """Test lazy notifications decode fields like Notification."""
+
+    lazy = LazyNotification.from_json(data)
+    notification = Notification.from_json(data)
+
+    assert lazy == notification
+    assert notification == lazy
+    assert lazy.to_notification() == notification
+    assert lazy.to_dict() == notification.to_dict()
+
+
+def test_lazy_notification_decodes_on_access() -> None:
+    """Test fields are only decoded when read and then cached."""
+
+    lazy = LazyNotification.from_json(MSG_FULL)
+
+    assert lazy.topic == "test1"
+    assert lazy.message == "Hello"
+    assert set(vars(lazy)) == {"_data", "topic", "message"}
+
+    assert lazy.click is lazy.click
+    assert lazy.attachment is not None
+    assert lazy.attachment.size == 1024
+    assert [action.label for action in lazy.actions] == ["Open", "Take picture"]
+
+
+def test_lazy_notification_not_equal() -> None:
+    """Test comparison with different notifications and other types."""
+
+    lazy = LazyNotification.from_json(MSG)
+
+    assert lazy != LazyNotification.from_json(MSG_2)
+    assert lazy != Notification.from_json(MSG_CLEAR)
+    assert lazy != "test1"
+    assert repr(lazy).startswith("LazyNotification({'id': 'h6Y2hKA5sy0U'")
+
+
+async def test_subscribe_lazy(mock_ws: AsyncMock) -> None:
+    """Test subscribing with lazily decoded notifications."""
+
+    callback = MagicMock()
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    await ntfy.subscribe(["test1"], callback, lazy=True)
+
+    callback.assert_called_once()
+    notification = callback.call_args.args[0]
+    assert isinstance(notification, LazyNotification)
+    assert notification == Notification.from_json(MSG)
@@ -0,0 +1,194 @@
+"""Tests for the durable outbox."""
+
+import asyncio
+from pathlib import Path
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohttp import ClientError
+import pytest
+from yarl import URL
+
+from aiontfy import Message, MessageTemplate, Notification, Ntfy, Outbox
+from aiontfy.exceptions import NtfyBadRequestError, NtfyConnectionError
+
+from .conftest import MSG
+
+
+async def test_outbox_group_commit(tmp_path: Path) -> None:
+    """Test concurrently added messages are committed together."""
+
+    async with Outbox(tmp_path / "outbox.db") as outbox:
+        ids = await asyncio.gather(
+            *(outbox.add(Message(topic="mytopic", message=str(i))) for i in range(100))
+        )
+
+        assert sorted(ids) == list(range(1, 101))
+        assert outbox.commits == 1
+
+
+async def test_outbox_persistence(tmp_path: Path) -> None:
+    """Test messages not marked done are kept across restarts."""
+
+    async with Outbox(tmp_path / "outbox.db") as outbox:
+        first = await outbox.add(Message(topic="mytopic", message="first"))
+        await outbox.add(Message(topic="mytopic", message="second"))
+        outbox.done(first)
+
+    async with Outbox(tmp_path / "outbox.db") as outbox:
+        assert await outbox.pending() == [
+            (2, Message(topic="mytopic", message="second"))
+        ]
+
+
+async def test_publish_outbox(mock_session: AsyncMock, tmp_path: Path) -> None:
+    """Test published messages are removed from the outbox."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    async with Outbox(tmp_path / "outbox.db") as outbox:
+        ntfy = Ntfy("http://example.com", mock_session, outbox=outbox)
+
+        await ntfy.publish(Message(topic="mytopic"))
+        await ntfy.close()
+
+        assert await outbox.pending() == []
+
+
+async def test_publish_outbox_rejected(mock_session: AsyncMock, tmp_path: Path) -> None:
+    """Test messages rejected by the server are removed from the outbox."""
+
+    mock_session.request.return_value.__aenter__.return_value.status = 400
+    mock_session.request.return_value.__aenter__.return_value.json.return_value = {
+        "code": 40000,
+        "http": 400,
+        "error": "bad request",
+    }
+    async with Outbox(tmp_path / "outbox.db") as outbox:
+        ntfy = Ntfy("http://example.com", mock_session, outbox=outbox)
+
+        with pytest.raises(NtfyBadRequestError):
+            await ntfy.publish(Message(topic="mytopic"))
+        await ntfy.close()
+
+        assert await outbox.pending() == []
+
+
+async def test_publish_outbox_replay(mock_session: AsyncMock, tmp_path: Path) -> None:
+    """Test undelivered messages are published again on the next start."""
+
+    mock_session.request.side_effect = ClientError
+    async with Outbox(tmp_path / "outbox.db") as outbox:
+        ntfy = Ntfy("http://example.com", mock_session, outbox=outbox)
+        with pytest.raises(NtfyConnectionError):
+            await ntfy.publish(Message(topic="mytopic", message="Hello"))
+        await ntfy.close()
+
+    mock_session.request.side_effect = None
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    async with (
+        Outbox(tmp_path / "outbox.db") as outbox,
+        Ntfy("http://example.com", mock_session, outbox=outbox),
+    ):
+        assert await outbox.pending() == []
+
+    mock_session.request.assert_called_with(
+        "POST",
+        URL("http://example.com"),
+        json=Message(topic="mytopic", message="Hello").to_dict(),
+    )
+
+
+async def test_replay_without_outbox(mock_session: AsyncMock) -> None:
+    """Test replay does nothing without an outbox."""
+
+    assert await Ntfy("http://example.com", mock_session).replay() == []
+
+
+async def test_replay_skips_in_flight(mock_session: AsyncMock, tmp_path: Path) -> None:
+    """Test replay does not publish messages that are still being published."""
+
+    sent = asyncio.Event()
+
+    async def send(*args: object) -> MagicMock:
+        sent.set()
+        await asyncio.Event().wait()
+        return MagicMock()
+
+    mock_session.request.return_value.__aenter__.side_effect = send
+    async with Outbox(tmp_path / "outbox.db") as outbox:
+        ntfy = Ntfy("http://example.com", mock_session, outbox=outbox)
+        task = asyncio.create_task(ntfy.publish(Message(topic="mytopic")))
+        await sent.wait()
+
+        assert await ntfy.replay() == []
+        assert mock_session.request.call_count == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await ntfy.close()
+
+
+async def test_replay_transient_error(mock_session: AsyncMock, tmp_path: Path) -> None:
+    """Test messages that failed with a transient error can be replayed."""
+
+    mock_session.request.side_effect = ClientError
+    async with Outbox(tmp_path / "outbox.db") as outbox:
+        ntfy = Ntfy("http://example.com", mock_session, outbox=outbox)
+        with pytest.raises(NtfyConnectionError):
+            await ntfy.publish(Message(topic="mytopic", message="Hello"))
+
+        results = await ntfy.replay()
+        assert len(results) == 1
+        assert isinstance(results[0], NtfyConnectionError)
+
+        mock_session.request.side_effect = None
+        mock_session.request.return_value.__aenter__.return_value.text.return_value = (
+            MSG
+        )
+        assert [type(result) for result in await ntfy.replay()] == [Notification]
+        await ntfy.close()
+
+        assert await outbox.pending() == []
+
+
+async def test_outbox_failed_removal(tmp_path: Path) -> None:
+    """Test removals of a failed batch are retried with the next batch."""
+
+    async with Outbox(tmp_path / "outbox.db") as outbox:
+        first = await outbox.add(Message(topic="mytopic", message="first"))
+        with patch.object(outbox, "_write", side_effect=sqlite3.OperationalError):
+            outbox.done(first)
+            await outbox.flush()
+
+        assert first in outbox._in_flight
+        await outbox.add(Message(topic="mytopic", message="second"))
+
+        assert first not in outbox._in_flight
+        assert await outbox.pending() == [
+            (2, Message(topic="mytopic", message="second"))
+        ]
+
+
+async def test_publish_template_outbox(mock_session: AsyncMock, tmp_path: Path) -> None:
+    """Test template publishes are stored in the outbox until delivered."""
+
+    mock_session.request.side_effect = ClientError
+    template = MessageTemplate(Message(topic="mytopic", priority=4))
+    async with Outbox(tmp_path / "outbox.db") as outbox:
+        ntfy = Ntfy("http://example.com", mock_session, outbox=outbox)
+        with pytest.raises(NtfyConnectionError):
+            await ntfy.publish_template(template, message="Disk full")
+
+        assert await outbox.pending() == [
+            (1, Message(topic="mytopic", message="Disk full", priority=4))
+        ]
+
+        mock_session.request.side_effect = None
+        mock_session.request.return_value.__aenter__.return_value.text.return_value = (
+            MSG
+        )
+        await ntfy.publish_template(template, message="Disk ok")
+        await ntfy.close()
+
+        assert len(await outbox.pending()) == 1
@@ -0,0 +1,132 @@
+"""Tests for polling and HTTP streaming subscriptions."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import ClientTimeout
+import pytest
+from yarl import URL
+
+from aiontfy import LazyNotification, Notification, Ntfy, Transport
+from aiontfy.exceptions import NtfyForbiddenAccessError
+from aiontfy.helpers import iter_lines
+
+from .conftest import MSG, MSG_2
+
+
+def respond(mock_session: AsyncMock, *chunks: bytes) -> None:
+    """Mock a streamed response body."""
+
+    async def iter_any() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    response = mock_session.request.return_value.__aenter__.return_value
+    response.content = MagicMock()
+    response.content.iter_any = iter_any
+
+
+async def test_iter_lines() -> None:
+    """Test lines split across chunks are reassembled."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in (b'{"a":', b'1}\n{"b"', b":2}\r\n\n", b'{"c":3}'):
+            yield chunk
+
+    assert [line async for line in iter_lines(chunks())] == [
+        b'{"a":1}',
+        b'{"b":2}',
+        b'{"c":3}',
+    ]
+
+
+async def test_poll(mock_session: AsyncMock) -> None:
+    """Test polling cached messages."""
+
+    data = f"{MSG}\n{MSG_2}\n".encode()
+    respond(mock_session, data[:100], data[100:400], data[400:])
+    ntfy = Ntfy("https://example.com", mock_session)
+
+    notifications = [
+        n
+        async for n in ntfy.poll(
+            ["test1", "test2"],
+            since=datetime(2025, 3, 28, 17, 58, 46, tzinfo=UTC),
+            tags=["octopus"],
+        )
+    ]
+
+    assert notifications == [Notification.from_json(MSG), Notification.from_json(MSG_2)]
+    mock_session.request.assert_called_once_with(
+        "GET",
+        URL("https://example.com/test1,test2/json"),
+        params={"tags": "octopus", "poll": "1", "since": "1743184726"},
+        headers=None,
+        timeout=ClientTimeout(sock_connect=30, sock_read=90),
+    )
+
+
+async def test_poll_lazy(mock_session: AsyncMock) -> None:
+    """Test polling lazily decoded messages."""
+
+    respond(mock_session, MSG.encode())
+    ntfy = Ntfy("https://example.com", mock_session)
+
+    notifications = [n async for n in ntfy.poll(["test1"], since="10m", lazy=True)]
+
+    assert isinstance(notifications[0], LazyNotification)
+    assert notifications == [Notification.from_json(MSG)]
+    assert mock_session.request.call_args.kwargs["params"] == {
+        "poll": "1",
+        "since": "10m",
+    }
+
+
+async def test_poll_forbidden(mock_session: AsyncMock) -> None:
+    """Test polling a topic without access."""
+
+    mock_session.request.return_value.__aenter__.return_value.status = 403
+    mock_session.request.return_value.__aenter__.return_value.json.return_value = {
+        "code": 40301,
+        "http": 403,
+        "error": "forbidden",
+    }
+    ntfy = Ntfy("https://example.com", mock_session)
+
+    with pytest.raises(NtfyForbiddenAccessError):
+        async for _ in ntfy.poll(["test1"]):
+            pass
+
+
+async def test_subscribe_http(mock_session: AsyncMock) -> None:
+    """Test subscribing over a streamed HTTP response."""
+
+    open_event = '{"id":"x","time":1743184726,"event":"open","topic":"test1"}'
+    respond(mock_session, f"{open_event}\n{MSG}\n".encode())
+    callback = MagicMock()
+    ntfy = Ntfy("https://example.com", mock_session)
+
+    await ntfy.subscribe(["test1"], callback, transport=Transport.HTTP)
+
+    assert callback.call_count == 2
+    callback.assert_called_with(Notification.from_json(MSG))
+    assert mock_session.request.call_args.args == (
+        "GET",
+        URL("https://example.com/test1/json"),
+    )
+    mock_session.ws_connect.assert_not_called()
+
+
+async def test_subscribe_http_timeout(mock_session: AsyncMock) -> None:
+    """Test the stream keeps the configured timeout without a total timeout."""
+
+    mock_session.timeout = ClientTimeout(total=10, sock_connect=2, sock_read=120)
+    respond(mock_session, f"{MSG}\n".encode())
+    ntfy = Ntfy("https://example.com", mock_session)
+
+    await ntfy.subscribe(["test1"], MagicMock(), transport=Transport.HTTP)
+
+    assert mock_session.request.call_args.kwargs["timeout"] == ClientTimeout(
+        sock_connect=2, sock_read=120
+    )
@@ -0,0 +1,117 @@
+"""Tests for the topic-sharded client pool."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from yarl import URL
+
+from aiontfy import HashRing, Message, NtfyPool
+
+from .conftest import MSG
+
+SERVERS = [
+    "https://ntfy1.example.com",
+    "https://ntfy2.example.com",
+    "https://ntfy3.example.com",
+]
+TOPICS = [f"topic{i}" for i in range(1000)]
+
+
+def test_hash_ring_distribution() -> None:
+    """Test keys are spread evenly across nodes."""
+
+    ring = HashRing(SERVERS)
+    counts = dict.fromkeys(SERVERS, 0)
+    for topic in TOPICS:
+        counts[ring.get(topic)] += 1
+
+    assert all(200 < count < 470 for count in counts.values())
+
+
+def test_hash_ring_minimal_rebalance() -> None:
+    """Test adding and removing a node only moves the keys of that node."""
+
+    ring = HashRing(SERVERS)
+    before = {topic: ring.get(topic) for topic in TOPICS}
+
+    ring.add("https://ntfy4.example.com")
+    after = {topic: ring.get(topic) for topic in TOPICS}
+    moved = [topic for topic in TOPICS if before[topic] != after[topic]]
+
+    assert all(after[topic] == "https://ntfy4.example.com" for topic in moved)
+    assert 150 < len(moved) < 350
+
+    ring.remove("https://ntfy4.example.com")
+    assert {topic: ring.get(topic) for topic in TOPICS} == before
+    assert ring.nodes == set(SERVERS)
+
+
+def test_hash_ring_empty() -> None:
+    """Test an empty ring raises LookupError."""
+
+    with pytest.raises(LookupError):
+        HashRing().get("mytopic")
+
+
+async def test_pool_publish_and_subscribe(mock_ws: AsyncMock) -> None:
+    """Test publish and subscribe of a topic use the same server."""
+
+    mock_ws.request.return_value.__aenter__.return_value.text.return_value = MSG
+    pool = NtfyPool(SERVERS, mock_ws)
+    server = URL(HashRing(SERVERS).get("mytopic"))
+
+    await pool.publish(Message(topic="mytopic"))
+    mock_ws.request.assert_called_once()
+    assert mock_ws.request.call_args.args[:2] == ("POST", server)
+
+    await pool.subscribe(["mytopic"], MagicMock())
+    mock_ws.ws_connect.assert_called_once()
+    assert mock_ws.ws_connect.call_args.args[0] == (
+        server.with_scheme("wss") / "mytopic/ws"
+    )
+
+    assert {client._session for client in pool.clients.values()} == {mock_ws}
+    await pool.close()
+
+
+async def test_pool_subscribe_sharded(mock_ws: AsyncMock) -> None:
+    """Test one subscription is opened per server."""
+
+    pool = NtfyPool(SERVERS, mock_ws)
+    topics = TOPICS[:20]
+
+    await pool.subscribe(topics, MagicMock())
+
+    shards = pool.shard(topics)
+    assert mock_ws.ws_connect.call_count == len(shards)
+    subscribed = {
+        topic
+        for call in mock_ws.ws_connect.call_args_list
+        for topic in call.args[0].parts[1].split(",")
+    }
+    assert subscribed == set(topics)
+
+
+async def test_pool_add_remove_server(mock_session: AsyncMock) -> None:
+    """Test servers can be added and removed."""
+
+    pool = NtfyPool(SERVERS[:2], mock_session)
+
+    client = pool.add_server(SERVERS[2])
+    assert pool.add_server(SERVERS[2]) is client
+    assert set(pool.clients) == set(SERVERS)
+
+    await pool.remove_server(SERVERS[2])
+    assert set(pool.clients) == set(SERVERS[:2])
+    assert all(pool.client(topic) is not client for topic in TOPICS)
+    mock_session.close.assert_not_called()
+
+
+async def test_pool_owns_session() -> None:
+    """Test the pool creates and closes one shared session."""
+
+    async with NtfyPool(SERVERS) as pool:
+        sessions = {client._session for client in pool.clients.values()}
+        assert len(sessions) == 1
+
+    assert sessions.pop().closed
@@ -1,6 +1,6 @@
 """Tests for aiontfy."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 from yarl import URL
 
@@ -111,3 +111,16 @@ async def test_publish_bearer_auth(mock_session: AsyncMock) -> None:
             "sequence_id": None,
         },
     )
+
+
+async def test_publish_without_parsing(mock_session: AsyncMock) -> None:
+    """Test the response is read but not parsed when parse is False."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    ntfy = Ntfy("http://example.com", mock_session)
+
+    with patch("aiontfy.ntfy.Notification.from_json") as mock_from_json:
+        assert await ntfy.publish(Message(topic="mytopic"), parse=False) is None
+
+    mock_from_json.assert_not_called()
+    mock_session.request.return_value.__aenter__.return_value.text.assert_awaited_once()
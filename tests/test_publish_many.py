@@ -0,0 +1,83 @@
+"""Tests for publish_many and publish_as_completed methods."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from aiohttp import ClientError
+import pytest
+
+from aiontfy import Message, Notification, Ntfy
+from aiontfy.exceptions import NtfyConnectionError
+
+from .conftest import MSG
+
+
+async def test_publish_many(mock_session: AsyncMock) -> None:
+    """Test publishing many messages returns results in input order."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    mock_session.request.side_effect = [
+        mock_session.request.return_value,
+        ClientError,
+        mock_session.request.return_value,
+    ]
+
+    ntfy = Ntfy("http://example.com", mock_session)
+    messages = [Message(topic="mytopic", message=str(i)) for i in range(3)]
+
+    results = await ntfy.publish_many(messages, max_concurrency=1)
+
+    assert mock_session.request.call_count == 3
+    assert isinstance(results[0], Notification)
+    assert isinstance(results[1], NtfyConnectionError)
+    assert isinstance(results[2], Notification)
+
+
+async def test_publish_many_max_concurrency() -> None:
+    """Test the number of requests in flight is bounded."""
+
+    in_flight = 0
+    peak = 0
+
+    async def publish(message: Message) -> Message:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return message
+
+    ntfy = Ntfy("http://example.com", AsyncMock())
+    ntfy.publish = publish  # type: ignore[method-assign]
+    messages = [Message(topic="mytopic", message=str(i)) for i in range(20)]
+
+    results = await ntfy.publish_many(messages, max_concurrency=3)
+
+    assert results == messages
+    assert peak == 3
+
+
+async def test_publish_as_completed(mock_session: AsyncMock) -> None:
+    """Test streaming results as they finish."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    ntfy = Ntfy("http://example.com", mock_session)
+    messages = [Message(topic="mytopic", message=str(i)) for i in range(5)]
+
+    results = [
+        result
+        async for result in ntfy.publish_as_completed(messages, max_concurrency=2)
+    ]
+
+    assert sorted(index for index, _ in results) == [0, 1, 2, 3, 4]
+    assert all(isinstance(notification, Notification) for _, notification in results)
+
+
+async def test_publish_many_invalid_concurrency(mock_session: AsyncMock) -> None:
+    """Test max_concurrency must be positive."""
+
+    ntfy = Ntfy("http://example.com", mock_session)
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        await ntfy.publish_many([Message(topic="mytopic")], max_concurrency=0)
@@ -0,0 +1,194 @@
+"""Tests for the background publish queue."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from aiohttp import ClientError
+import pytest
+
+from aiontfy import Message, Ntfy, QueueFullPolicy
+from aiontfy.exceptions import NtfyQueueFullError
+
+from .conftest import MSG
+
+
+async def test_enqueue_and_flush(mock_session: AsyncMock) -> None:
+    """Test queued messages are published in the background."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    ntfy = Ntfy("http://example.com", mock_session, queue_workers=2)
+
+    for i in range(5):
+        assert await ntfy.enqueue(Message(topic="mytopic", message=str(i)))
+
+    await ntfy.flush()
+
+    assert mock_session.request.call_count == 5
+    await ntfy.close()
+
+
+async def test_enqueue_drop(mock_session: AsyncMock) -> None:
+    """Test messages are dropped when the queue is full."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        queue_maxsize=1,
+        queue_policy=QueueFullPolicy.DROP,
+    )
+
+    assert await ntfy.enqueue(Message(topic="mytopic", message="1"))
+    assert not await ntfy.enqueue(Message(topic="mytopic", message="2"))
+
+    await ntfy.close()
+    assert mock_session.request.call_count == 1
+
+
+async def test_enqueue_raise(mock_session: AsyncMock) -> None:
+    """Test exception is raised when the queue is full."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        queue_maxsize=1,
+        queue_policy=QueueFullPolicy.RAISE,
+    )
+
+    await ntfy.enqueue(Message(topic="mytopic", message="1"))
+    with pytest.raises(NtfyQueueFullError):
+        await ntfy.enqueue(Message(topic="mytopic", message="2"))
+
+    await ntfy.close()
+
+
+async def test_aexit_drains_queue(mock_session: AsyncMock) -> None:
+    """Test leaving the context manager publishes queued messages."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    async with Ntfy("http://example.com", mock_session) as ntfy:
+        await ntfy.enqueue(Message(topic="mytopic"))
+        await ntfy.enqueue(Message(topic="mytopic"))
+
+    assert mock_session.request.call_count == 2
+
+
+async def test_enqueue_publish_error(
+    mock_session: AsyncMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test failed publishes are logged and do not stop the workers."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    mock_session.request.side_effect = [ClientError, mock_session.request.return_value]
+
+    ntfy = Ntfy("http://example.com", mock_session, queue_workers=1)
+
+    await ntfy.enqueue(Message(topic="mytopic"))
+    await ntfy.enqueue(Message(topic="mytopic"))
+    await ntfy.flush()
+
+    assert mock_session.request.call_count == 2
+    assert "Failed to publish queued message to topic mytopic" in caplog.text
+    await ntfy.close()
+
+
+async def test_enqueue_unexpected_error(mock_session: AsyncMock) -> None:
+    """Test unexpected errors do not stop the workers."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    mock_session.request.side_effect = [TypeError, mock_session.request.return_value]
+
+    ntfy = Ntfy("http://example.com", mock_session, queue_workers=1)
+
+    await ntfy.enqueue(Message(topic="mytopic"))
+    await ntfy.enqueue(Message(topic="mytopic"))
+    await asyncio.wait_for(ntfy.flush(), 1)
+
+    assert mock_session.request.call_count == 2
+    await asyncio.wait_for(ntfy.close(), 1)
+
+
+async def test_enqueue_restarts_workers(mock_session: AsyncMock) -> None:
+    """Test finished workers are replaced."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    ntfy = Ntfy("http://example.com", mock_session, queue_workers=2)
+
+    await ntfy.enqueue(Message(topic="mytopic"))
+    ntfy._publish_queue._workers[0].cancel()
+    await asyncio.sleep(0)
+    await ntfy.enqueue(Message(topic="mytopic"))
+
+    assert len(ntfy._publish_queue._workers) == 2
+    assert not any(task.done() for task in ntfy._publish_queue._workers)
+    await asyncio.wait_for(ntfy.close(), 1)
+
+
+async def test_enqueue_priority_lanes(mock_session: AsyncMock) -> None:
+    """Test higher priority messages are published first."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        queue_workers=1,
+        queue_weights={1: 1, 5: 3},
+    )
+
+    for i in range(4):
+        await ntfy.enqueue(Message(topic="mytopic", message=f"min{i}", priority=1))
+    for i in range(4):
+        await ntfy.enqueue(Message(topic="mytopic", message=f"max{i}", priority=5))
+    await ntfy.close()
+
+    published = [
+        call.kwargs["json"]["message"] for call in mock_session.request.call_args_list
+    ]
+    assert published == [
+        "max0",
+        "max1",
+        "min0",
+        "max2",
+        "max3",
+        "min1",
+        "min2",
+        "min3",
+    ]
+
+
+async def test_enqueue_shed(mock_session: AsyncMock) -> None:
+    """Test the lowest priority messages are shed when the queue is full."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        queue_maxsize=2,
+        queue_policy=QueueFullPolicy.SHED,
+    )
+
+    assert await ntfy.enqueue(Message(topic="mytopic", message="low", priority=2))
+    assert await ntfy.enqueue(Message(topic="mytopic", message="default"))
+    assert await ntfy.enqueue(Message(topic="mytopic", message="max", priority=5))
+    assert not await ntfy.enqueue(Message(topic="mytopic", message="min", priority=1))
+    assert ntfy._publish_queue.dropped == 2
+
+    await ntfy.close()
+    published = [
+        call.kwargs["json"]["message"] for call in mock_session.request.call_args_list
+    ]
+    assert published == ["max", "default"]
+
+
+async def test_queue_invalid_weights() -> None:
+    """Test weights must be positive."""
+
+    with pytest.raises(ValueError, match="weights"):
+        Ntfy("http://example.com", queue_weights={1: 0})
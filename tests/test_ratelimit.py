@@ -0,0 +1,144 @@
+"""Tests for the client-side rate limiter."""
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiontfy import Account, Message, Ntfy, RateLimiter
+from aiontfy.exceptions import (
+    NtfyTooManyRequestsLimitMessagesError,
+    NtfyTooManyRequestsLimitRequestsError,
+)
+
+from .conftest import MSG, load_fixture
+
+
+class FakeClock:
+    """Fake monotonic clock advanced by sleeping."""
+
+    def __init__(self) -> None:
+        """Initialize clock."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        """Return current time."""
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        """Advance time."""
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock() -> Generator[FakeClock]:
+    """Patch the clock of the rate limiter."""
+    clock = FakeClock()
+    with (
+        patch("aiontfy.ratelimit.monotonic", clock.monotonic),
+        patch("aiontfy.ratelimit.asyncio.sleep", clock.sleep),
+    ):
+        yield clock
+
+
+async def test_rate_limiter_burst(clock: FakeClock) -> None:
+    """Test requests wait once the burst is used up."""
+
+    limiter = RateLimiter(rate=2, burst=3)
+
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+    assert clock.now == 1.0
+
+
+async def test_rate_limiter_account(clock: FakeClock) -> None:
+    """Test the message bucket is seeded from the account."""
+
+    limiter = RateLimiter(rate=100, burst=100)
+    limiter.update_from_account(Account.from_json(load_fixture("account.json")))
+
+    assert limiter.messages is not None
+    assert limiter.messages.burst == 5000
+    assert limiter.messages.tokens == 4990
+
+    limiter.messages.tokens = 1
+    await limiter.acquire(message=True)
+    await limiter.acquire()
+    assert clock.sleeps == []
+
+    await limiter.acquire(message=True)
+    assert clock.sleeps == [86400 / 5000]
+
+
+async def test_rate_limiter_too_many_requests(clock: FakeClock) -> None:
+    """Test the request rate is reduced after 429 and recovers."""
+
+    limiter = RateLimiter(rate=2, burst=10)
+
+    limiter.rate_limited(NtfyTooManyRequestsLimitRequestsError(42901, 429, "limit"))
+    assert limiter.requests.rate == 1
+    assert limiter.requests.tokens == 0
+
+    await limiter.acquire()
+    assert clock.sleeps == [1.0]
+
+    for _ in range(20):
+        limiter.success()
+    assert limiter.requests.rate == 2
+
+
+async def test_rate_limiter_message_quota(clock: FakeClock) -> None:
+    """Test the message quota is emptied after a message limit error."""
+
+    limiter = RateLimiter()
+    limiter.update_from_account(Account.from_json(load_fixture("account.json")))
+
+    limiter.rate_limited(NtfyTooManyRequestsLimitMessagesError(42908, 429, "limit"))
+
+    assert limiter.messages is not None
+    assert limiter.messages.tokens == 0
+    assert limiter.requests.rate == 0.2
+
+
+async def test_ntfy_rate_limiter(mock_session: AsyncMock, clock: FakeClock) -> None:
+    """Test the Ntfy client applies the rate limiter."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = (
+        load_fixture("account.json")
+    )
+    limiter = RateLimiter(rate=1, burst=1)
+    ntfy = Ntfy("http://example.com", mock_session, rate_limiter=limiter)
+
+    await ntfy.account()
+    assert limiter.messages is not None
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    await ntfy.publish(Message(topic="mytopic"))
+
+    assert clock.sleeps == [1.0]
+    assert limiter.messages.tokens == pytest.approx(4989 + 5000 / 86400)
+
+
+async def test_ntfy_rate_limited_response(
+    mock_session: AsyncMock, clock: FakeClock
+) -> None:
+    """Test the Ntfy client slows down after a 429 response."""
+
+    mock_session.request.return_value.__aenter__.return_value.status = 429
+    mock_session.request.return_value.__aenter__.return_value.json.return_value = {
+        "code": 42901,
+        "http": 429,
+        "error": "limit reached: too many requests",
+    }
+    limiter = RateLimiter(rate=1, burst=10)
+    ntfy = Ntfy("http://example.com", mock_session, rate_limiter=limiter)
+
+    with pytest.raises(NtfyTooManyRequestsLimitRequestsError):
+        await ntfy.publish(Message(topic="mytopic"))
+
+    assert limiter.requests.rate == 0.5
+    assert limiter.requests.tokens == 0
@@ -0,0 +1,110 @@
+"""Tests for auto-reconnecting subscriptions."""
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohttp import ClientError, WSMsgType
+import orjson
+import pytest
+
+from aiontfy import Notification, Ntfy, RetryPolicy
+from aiontfy.exceptions import NtfyConnectionError
+
+from .conftest import MSG
+
+
+def text(event: str = "message", **kwargs: str) -> MagicMock:
+    """Create a websocket text message."""
+    data = {**orjson.loads(MSG), "event": event, **kwargs}
+    return MagicMock(type=WSMsgType.TEXT, data=orjson.dumps(data).decode())
+
+
+def connection(*messages: MagicMock) -> AsyncMock:
+    """Mock a websocket connection receiving messages and closing."""
+    ws = AsyncMock()
+    ws.__aiter__.return_value = [*messages, MagicMock(type=WSMsgType.CLOSED)]
+    context = AsyncMock()
+    context.__aenter__.return_value = ws
+    return context
+
+
+@pytest.fixture
+def mock_sleep() -> Generator[AsyncMock]:
+    """Patch sleeping between reconnects."""
+    with (
+        patch("aiontfy.ntfy.asyncio.sleep") as mock_sleep,
+        patch("aiontfy.ntfy.time", return_value=1743184726),
+    ):
+        yield mock_sleep
+
+
+async def test_reconnect_since_last_message(
+    mock_ws: AsyncMock, mock_sleep: AsyncMock
+) -> None:
+    """Test reconnecting resumes after the last message and skips duplicates."""
+
+    mock_ws.ws_connect.side_effect = [
+        connection(text("open", id="open1"), text(id="a"), text(id="b")),
+        ClientError,
+        connection(text(id="b"), text(id="c"), text("keepalive", id="ka")),
+        connection(),
+        ClientError,
+    ]
+    received: list[Notification] = []
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    with pytest.raises(NtfyConnectionError):
+        await ntfy.subscribe(
+            ["test1"],
+            received.append,
+            reconnect=RetryPolicy(backoff=1, jitter=0),
+        )
+
+    assert [n.id for n in received] == ["open1", "a", "b", "c", "ka"]
+    assert [call.kwargs["params"] for call in mock_ws.ws_connect.call_args_list] == [
+        {},
+        {"since": "b"},
+        {"since": "b"},
+        {"since": "c"},
+        {"since": "c"},
+    ]
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2, 1, 2]
+
+
+async def test_reconnect_before_first_message(
+    mock_ws: AsyncMock, mock_sleep: AsyncMock
+) -> None:
+    """Test reconnecting before any message resumes from the subscription start."""
+
+    mock_ws.ws_connect.side_effect = [
+        ClientError,
+        connection(text(id="a")),
+        ClientError,
+    ]
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    with pytest.raises(NtfyConnectionError):
+        await ntfy.subscribe(
+            ["test1"], MagicMock(), reconnect=RetryPolicy(max_attempts=2)
+        )
+
+    assert mock_ws.ws_connect.call_args_list[1].kwargs["params"] == {
+        "since": "1743184726"
+    }
+
+
+async def test_stream_reconnect(mock_ws: AsyncMock, mock_sleep: AsyncMock) -> None:
+    """Test streams reconnect as well."""
+
+    mock_ws.ws_connect.side_effect = [
+        connection(text(id="a")),
+        connection(text(id="a"), text(id="b")),
+        ClientError,
+    ]
+    ntfy = Ntfy("https://example.com", mock_ws)
+    stream = ntfy.stream(["test1"], reconnect=RetryPolicy(max_attempts=1))
+
+    assert (await anext(stream)).id == "a"
+    assert (await anext(stream)).id == "b"
+    with pytest.raises(NtfyConnectionError):
+        await anext(stream)
@@ -0,0 +1,257 @@
+"""Tests for the retry policy and circuit breaker."""
+
+import asyncio
+from collections.abc import Generator
+from unittest.mock import AsyncMock, patch
+
+from aiohttp import ClientError
+import pytest
+
+from aiontfy import (
+    CircuitBreaker,
+    CircuitState,
+    Message,
+    Ntfy,
+    RateLimiter,
+    RetryPolicy,
+)
+from aiontfy.exceptions import (
+    NtfyCircuitOpenError,
+    NtfyConnectionError,
+    NtfyForbiddenAccessError,
+    NtfyTimeoutError,
+)
+
+from .conftest import MSG
+
+
+@pytest.fixture
+def mock_sleep() -> Generator[AsyncMock]:
+    """Patch sleeping between retries."""
+    with patch("aiontfy.ntfy.asyncio.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+async def test_retry(mock_session: AsyncMock, mock_sleep: AsyncMock) -> None:
+    """Test transient errors are retried with backoff."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    mock_session.request.side_effect = [
+        ClientError,
+        TimeoutError,
+        mock_session.request.return_value,
+    ]
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        retry_policy=RetryPolicy(backoff=1, jitter=0),
+    )
+
+    await ntfy.clear("mytopic", "Mc3otamDNcpJ")
+
+    assert mock_session.request.call_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2]
+
+
+async def test_retry_max_attempts(
+    mock_session: AsyncMock, mock_sleep: AsyncMock
+) -> None:
+    """Test the last error is raised when all attempts failed."""
+
+    mock_session.request.side_effect = ClientError
+    ntfy = Ntfy(
+        "http://example.com", mock_session, retry_policy=RetryPolicy(max_attempts=4)
+    )
+
+    with pytest.raises(NtfyConnectionError):
+        await ntfy.stats()
+
+    assert mock_session.request.call_count == 4
+    assert mock_sleep.call_count == 3
+
+
+async def test_retry_method_not_retryable(
+    mock_session: AsyncMock, mock_sleep: AsyncMock
+) -> None:
+    """Test POST requests are not retried by default."""
+
+    mock_session.request.side_effect = ClientError
+    ntfy = Ntfy("http://example.com", mock_session, retry_policy=RetryPolicy())
+
+    with pytest.raises(NtfyConnectionError):
+        await ntfy.publish(Message(topic="mytopic"))
+
+    assert mock_session.request.call_count == 1
+
+
+async def test_retry_publish(mock_session: AsyncMock, mock_sleep: AsyncMock) -> None:
+    """Test publishing is retried when POST is a retryable method."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    mock_session.request.side_effect = [ClientError, mock_session.request.return_value]
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        retry_policy=RetryPolicy(methods=frozenset({"POST"})),
+    )
+
+    await ntfy.publish(Message(topic="mytopic"))
+
+    assert mock_session.request.call_count == 2
+
+
+async def test_retry_not_on_client_errors(
+    mock_session: AsyncMock, mock_sleep: AsyncMock
+) -> None:
+    """Test non-transient errors are not retried."""
+
+    mock_session.request.return_value.__aenter__.return_value.status = 403
+    mock_session.request.return_value.__aenter__.return_value.json.return_value = {
+        "code": 40301,
+        "http": 403,
+        "error": "forbidden",
+    }
+    ntfy = Ntfy("http://example.com", mock_session, retry_policy=RetryPolicy())
+
+    with pytest.raises(NtfyForbiddenAccessError):
+        await ntfy.stats()
+
+    assert mock_session.request.call_count == 1
+
+
+async def test_retry_deadline(mock_session: AsyncMock, mock_sleep: AsyncMock) -> None:
+    """Test no retry is attempted past the deadline."""
+
+    mock_session.request.side_effect = ClientError
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        retry_policy=RetryPolicy(backoff=5, jitter=0, deadline=1),
+    )
+
+    with pytest.raises(NtfyConnectionError):
+        await ntfy.stats()
+
+    assert mock_session.request.call_count == 1
+
+
+async def test_retry_deadline_timeout(mock_session: AsyncMock) -> None:
+    """Test an attempt is cancelled when the deadline is reached."""
+
+    async def hang() -> None:
+        await asyncio.Event().wait()
+
+    mock_session.request.return_value.__aenter__.side_effect = hang
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        retry_policy=RetryPolicy(deadline=0.01),
+    )
+
+    with pytest.raises(NtfyTimeoutError):
+        await ntfy.stats()
+
+
+async def test_circuit_breaker(mock_session: AsyncMock) -> None:
+    """Test the circuit opens after consecutive failures and recovers."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    ntfy = Ntfy("http://example.com", mock_session, circuit_breaker=breaker)
+
+    mock_session.request.side_effect = ClientError
+    with patch("aiontfy.retry.monotonic", return_value=0):
+        for _ in range(2):
+            with pytest.raises(NtfyConnectionError):
+                await ntfy.clear("mytopic", "Mc3otamDNcpJ")
+
+        assert breaker.state is CircuitState.OPEN
+
+        with pytest.raises(NtfyCircuitOpenError):
+            await ntfy.clear("mytopic", "Mc3otamDNcpJ")
+    assert mock_session.request.call_count == 2
+
+    mock_session.request.side_effect = None
+    with patch("aiontfy.retry.monotonic", return_value=30):
+        await ntfy.clear("mytopic", "Mc3otamDNcpJ")
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.failures == 0
+
+
+async def test_circuit_breaker_half_open_failure() -> None:
+    """Test a failed trial request opens the circuit again."""
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+
+    with patch("aiontfy.retry.monotonic", return_value=0):
+        breaker.record_failure(NtfyTimeoutError())
+    assert breaker.state is CircuitState.OPEN
+
+    with patch("aiontfy.retry.monotonic", return_value=31):
+        breaker.before_request()
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        with pytest.raises(NtfyCircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_failure(NtfyTimeoutError())
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(NtfyCircuitOpenError):
+            breaker.before_request()
+
+
+async def test_circuit_breaker_trial_cancelled(mock_session: AsyncMock) -> None:
+    """Test a cancelled trial request opens the circuit again."""
+
+    async def hang() -> None:
+        await asyncio.Event().wait()
+
+    mock_session.request.return_value.__aenter__.side_effect = hang
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        retry_policy=RetryPolicy(deadline=0.01),
+        circuit_breaker=breaker,
+    )
+
+    with patch("aiontfy.retry.monotonic", return_value=0):
+        breaker.record_failure(NtfyTimeoutError())
+    with patch("aiontfy.retry.monotonic", return_value=30):
+        with pytest.raises(NtfyTimeoutError):
+            await ntfy.stats()
+
+        assert breaker.state is CircuitState.OPEN
+
+
+async def test_circuit_breaker_trial_cancelled_rate_limited(
+    mock_session: AsyncMock,
+) -> None:
+    """Test a trial request cancelled while rate limited opens the circuit again."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = (
+        """{"messages":18,"messages_rate":0.007407407407407408}"""
+    )
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    ntfy = Ntfy(
+        "http://example.com",
+        mock_session,
+        rate_limiter=RateLimiter(rate=0.001, burst=1),
+        circuit_breaker=breaker,
+    )
+    await ntfy.stats()
+
+    with patch("aiontfy.retry.monotonic", return_value=0):
+        breaker.record_failure(NtfyTimeoutError())
+    with patch("aiontfy.retry.monotonic", return_value=30):
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await ntfy.stats()
+
+        assert breaker.state is CircuitState.OPEN
+    with patch("aiontfy.retry.monotonic", return_value=60):
+        breaker.before_request()
+        assert breaker.state is CircuitState.HALF_OPEN
+
+    assert mock_session.request.call_count == 1
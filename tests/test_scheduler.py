@@ -0,0 +1,194 @@
+"""Tests for the publish scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from aiohttp import ClientError
+import pytest
+
+from aiontfy import Message, Ntfy, Scheduler
+
+from .conftest import MSG
+
+
+async def test_schedule_once() -> None:
+    """Test a one-off publish runs once after the delay."""
+
+    publish = AsyncMock()
+    scheduler = Scheduler(publish)
+
+    job = scheduler.schedule(Message(topic="mytopic"), delay=0.01)
+    assert len(scheduler) == 1
+    assert not job.cancelled
+
+    await asyncio.sleep(0.05)
+
+    publish.assert_awaited_once_with(Message(topic="mytopic"))
+    assert job.runs == 1
+    assert job.cancelled
+    assert len(scheduler) == 0
+    await scheduler.close()
+
+
+async def test_schedule_recurring() -> None:
+    """Test a recurring publish runs until it is cancelled."""
+
+    publish = AsyncMock()
+    scheduler = Scheduler(publish)
+
+    job = scheduler.schedule(Message(topic="mytopic"), interval=0.01, jitter=0.001)
+    await asyncio.sleep(0.055)
+    job.cancel()
+    runs = job.runs
+    await asyncio.sleep(0.03)
+
+    assert 4 <= runs <= 6
+    assert job.runs == runs
+    assert publish.await_count == runs
+    await scheduler.close()
+
+
+async def test_schedule_reschedule() -> None:
+    """Test a scheduled publish can be moved."""
+
+    publish = AsyncMock()
+    scheduler = Scheduler(publish)
+
+    job = scheduler.schedule(Message(topic="mytopic"), delay=10)
+    job.reschedule(0.01)
+    await asyncio.sleep(0.05)
+    assert job.runs == 1
+
+    job.reschedule(0, interval=10)
+    await asyncio.sleep(0.01)
+    assert job.runs == 2
+    assert job.next_run is not None
+    assert len(scheduler) == 1
+
+    await scheduler.close()
+    assert job.cancelled
+
+
+async def test_schedule_bounded_concurrency() -> None:
+    """Test concurrent runs are limited and due runs wait for a free slot."""
+
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def publish(message: Message) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+
+    scheduler = Scheduler(publish, max_concurrency=2)
+    jobs = [
+        scheduler.schedule(Message(topic=f"topic{i}"), interval=0.01) for i in range(5)
+    ]
+    await asyncio.sleep(0.035)
+
+    assert peak == 2
+    assert all(job.runs == 0 for job in jobs[2:])
+
+    release.set()
+    await asyncio.sleep(0.005)
+
+    assert peak == 2
+    assert all(job.runs >= 1 for job in jobs)
+    await scheduler.close()
+
+
+async def test_schedule_skips_overlapping() -> None:
+    """Test runs are skipped while the previous run is in progress."""
+
+    release = asyncio.Event()
+
+    async def publish(message: Message) -> None:
+        await release.wait()
+
+    scheduler = Scheduler(publish)
+    job = scheduler.schedule(Message(topic="mytopic"), interval=0.01)
+    await asyncio.sleep(0.035)
+    release.set()
+    await asyncio.sleep(0)
+
+    assert job.runs == 1
+    assert job.skipped >= 2
+    await scheduler.close()
+
+
+async def test_schedule_compacts_cancelled() -> None:
+    """Test cancelled schedules do not accumulate in the heap."""
+
+    scheduler = Scheduler(AsyncMock())
+    jobs = [scheduler.schedule(Message(topic="mytopic"), delay=60) for _ in range(100)]
+    for job in jobs[:90]:
+        job.cancel()
+
+    assert len(scheduler) == 10
+    assert len(scheduler._heap) <= 20
+    await scheduler.close()
+
+
+async def test_schedule_compacts_rescheduled() -> None:
+    """Test rescheduled runs do not accumulate in the heap."""
+
+    scheduler = Scheduler(AsyncMock())
+    job = scheduler.schedule(Message(topic="mytopic"), delay=60)
+    for delay in range(100):
+        job.reschedule(delay)
+
+    assert len(scheduler) == 1
+    assert len(scheduler._heap) <= 2
+    await scheduler.close()
+
+
+async def test_schedule_unexpected_error(caplog: pytest.LogCaptureFixture) -> None:
+    """Test unexpected publish errors are logged and do not stop the schedule."""
+
+    publish = AsyncMock(side_effect=ValueError)
+    scheduler = Scheduler(publish)
+
+    job = scheduler.schedule(Message(topic="mytopic"), interval=0.01)
+    await asyncio.sleep(0.025)
+
+    assert job.runs >= 2
+    assert "Failed to publish scheduled message to topic mytopic" in caplog.text
+    await scheduler.close()
+
+
+async def test_schedule_invalid() -> None:
+    """Test invalid arguments are rejected."""
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        Scheduler(AsyncMock(), max_concurrency=0)
+
+    scheduler = Scheduler(AsyncMock())
+    with pytest.raises(ValueError, match="interval"):
+        scheduler.schedule(Message(topic="mytopic"), interval=0)
+    with pytest.raises(ValueError, match="jitter"):
+        scheduler.schedule(Message(topic="mytopic"), jitter=-1)
+
+
+async def test_ntfy_schedule(
+    mock_session: AsyncMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the client publishes scheduled messages and logs errors."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+    mock_session.request.side_effect = [
+        mock_session.request.return_value,
+        ClientError,
+    ]
+    ntfy = Ntfy("http://example.com", mock_session)
+
+    job = ntfy.schedule(Message(topic="mytopic"), interval=0.01)
+    await asyncio.sleep(0.015)
+    await ntfy.close()
+
+    assert job.runs == 2
+    assert job.cancelled
+    assert mock_session.request.call_count == 2
+    assert "Failed to publish scheduled message to topic mytopic" in caplog.text
@@ -0,0 +1,68 @@
+"""Tests for the session created by the client."""
+
+import ssl
+from unittest.mock import AsyncMock, patch
+
+from aiohttp import ClientTimeout, TCPConnector
+
+from aiontfy import Ntfy
+
+
+async def test_session_defaults() -> None:
+    """Test the client creates a session with default settings."""
+
+    async with Ntfy("http://example.com") as ntfy:
+        connector = ntfy._session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector.limit == 100
+        assert connector.limit_per_host == 0
+        assert ntfy._session.headers["User-Agent"].startswith("aiontfy/")
+
+    assert ntfy._session.closed
+
+
+async def test_aexit_shuts_down_once() -> None:
+    """Test leaving the context shuts the client down only once."""
+
+    with patch.object(Ntfy, "_shutdown", autospec=True) as mock_shutdown:
+        async with Ntfy("http://example.com") as ntfy:
+            pass
+
+    mock_shutdown.assert_awaited_once_with(ntfy)
+    assert ntfy._session.closed
+
+
+async def test_aexit_shared_session(mock_session: AsyncMock) -> None:
+    """Test leaving the context keeps a session passed by the caller open."""
+
+    with patch.object(Ntfy, "_shutdown", autospec=True) as mock_shutdown:
+        async with Ntfy("http://example.com", mock_session) as ntfy:
+            pass
+
+    mock_shutdown.assert_awaited_once_with(ntfy)
+    mock_session.close.assert_not_called()
+
+
+async def test_session_pool_options() -> None:
+    """Test connection pool options are applied to the session."""
+
+    context = ssl.create_default_context()
+    timeout = ClientTimeout(total=10)
+
+    async with Ntfy(
+        "http://example.com",
+        pool_limit=20,
+        pool_limit_per_host=5,
+        keepalive_timeout=60,
+        dns_cache_ttl=300,
+        ssl=context,
+        timeout=timeout,
+    ) as ntfy:
+        connector = ntfy._session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector.limit == 20
+        assert connector.limit_per_host == 5
+        assert connector._keepalive_timeout == 60
+        assert connector._ssl is context
+        assert connector.use_dns_cache
+        assert ntfy._session.timeout == timeout
@@ -0,0 +1,89 @@
+"""Tests for sharding subscriptions across connections."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import ClientError
+import pytest
+from yarl import URL
+
+from aiontfy import Notification, Ntfy
+from aiontfy.exceptions import NtfyConnectionError
+from aiontfy.helpers import shard_topics
+
+from .conftest import MSG
+
+
+def test_shard_topics() -> None:
+    """Test topics are split by count and length."""
+
+    topics = ["a", "bb", "ccc", "dddd", "ü"]
+
+    assert shard_topics(topics, max_topics=2, max_length=100) == [
+        ["a", "bb"],
+        ["ccc", "dddd"],
+        ["ü"],
+    ]
+    assert shard_topics(topics, max_topics=10, max_length=8) == [
+        ["a", "bb", "ccc"],
+        ["dddd"],
+        ["ü"],
+    ]
+    assert shard_topics(["toolong"], max_topics=10, max_length=3) == [["toolong"]]
+    assert shard_topics([], max_topics=10, max_length=3) == []
+
+
+async def test_subscribe_sharded(mock_ws: AsyncMock) -> None:
+    """Test large topic lists are split across connections and merged."""
+
+    callback = MagicMock()
+    ntfy = Ntfy("https://example.com", mock_ws, topics_per_connection=2)
+
+    await ntfy.subscribe(["a", "b", "c", "d", "e"], callback)
+
+    assert [call.args[1] for call in mock_ws.request.call_args_list] == [
+        URL("https://example.com/a,b/auth"),
+        URL("https://example.com/c,d/auth"),
+        URL("https://example.com/e/auth"),
+    ]
+    assert [call.args[0] for call in mock_ws.ws_connect.call_args_list] == [
+        URL("wss://example.com/a,b/ws"),
+        URL("wss://example.com/c,d/ws"),
+        URL("wss://example.com/e/ws"),
+    ]
+    assert callback.call_args_list == [((Notification.from_json(MSG),),)] * 3
+
+
+async def test_subscribe_url_length(mock_ws: AsyncMock) -> None:
+    """Test topics are split to keep URLs within the length budget."""
+
+    topics = [f"topic{i:03}" for i in range(100)]
+    ntfy = Ntfy("https://example.com", mock_ws, max_url_length=100)
+
+    await ntfy.subscribe(topics, MagicMock())
+
+    urls = [call.args[0] for call in mock_ws.ws_connect.call_args_list]
+    assert len(urls) == 13
+    assert all(len(str(url)) <= 100 for url in urls)
+    assert [t for url in urls for t in url.parts[1].split(",")] == topics
+
+
+async def test_stream_sharded_error(mock_ws: AsyncMock) -> None:
+    """Test the stream fails if one of the connections fails."""
+
+    mock_ws.ws_connect.side_effect = [mock_ws.ws_connect.return_value, ClientError]
+    ntfy = Ntfy("https://example.com", mock_ws, topics_per_connection=1)
+
+    with pytest.raises(NtfyConnectionError):
+        async for _ in ntfy.stream(["a", "b"]):
+            pass
+
+
+async def test_subscribe_sharded_unexpected_error(mock_ws: AsyncMock) -> None:
+    """Test errors other than NtfyException of a shard end the subscription."""
+
+    mock_ws.ws_connect.side_effect = [mock_ws.ws_connect.return_value, KeyError]
+    ntfy = Ntfy("https://example.com", mock_ws, topics_per_connection=1)
+
+    with pytest.raises(KeyError):
+        await asyncio.wait_for(ntfy.subscribe(["a", "b"], MagicMock()), 1)
@@ -0,0 +1,129 @@
+"""Tests for stream method."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import ClientError, WSMsgType
+import orjson
+import pytest
+from yarl import URL
+
+from aiontfy import LazyNotification, Notification, Ntfy, QueueFullPolicy
+from aiontfy.exceptions import NtfyConnectionError, NtfyQueueFullError
+
+from .conftest import MSG
+
+
+@pytest.fixture
+def mock_ws_messages(mock_ws: AsyncMock) -> AsyncMock:
+    """Mock a websocket connection receiving several messages."""
+
+    ws = mock_ws.ws_connect.return_value.__aenter__.return_value
+    ws.__aiter__.return_value = [
+        MagicMock(
+            type=WSMsgType.TEXT,
+            data=orjson.dumps({**orjson.loads(MSG), "message": str(i)}).decode(),
+        )
+        for i in range(5)
+    ] + [MagicMock(type=WSMsgType.CLOSED)]
+    return mock_ws
+
+
+async def test_stream(mock_ws: AsyncMock) -> None:
+    """Test iterating over notifications."""
+
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    notifications = [n async for n in ntfy.stream(["test1"], tags=["octopus"])]
+
+    mock_ws.ws_connect.assert_called_once_with(
+        URL("wss://example.com/test1/ws"), params={"tags": "octopus"}, headers=None
+    )
+    assert notifications == [Notification.from_json(MSG)]
+
+
+async def test_stream_lazy(mock_ws: AsyncMock) -> None:
+    """Test iterating over lazily decoded notifications."""
+
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    notifications = [n async for n in ntfy.stream(["test1"], lazy=True)]
+
+    assert isinstance(notifications[0], LazyNotification)
+    assert notifications == [Notification.from_json(MSG)]
+
+
+async def test_stream_block(mock_ws_messages: AsyncMock) -> None:
+    """Test a full buffer blocks reading until the consumer catches up."""
+
+    ntfy = Ntfy("https://example.com", mock_ws_messages)
+
+    messages = [n.message async for n in ntfy.stream(["test1"], buffer_size=1)]
+
+    assert messages == ["0", "1", "2", "3", "4"]
+
+
+@pytest.mark.parametrize(
+    ("overflow", "expected"),
+    [
+        (QueueFullPolicy.DROP, ["0", "1"]),
+        (QueueFullPolicy.SHED, ["3", "4"]),
+    ],
+)
+async def test_stream_overflow(
+    mock_ws_messages: AsyncMock, overflow: QueueFullPolicy, expected: list[str]
+) -> None:
+    """Test notifications are dropped when the buffer is full."""
+
+    ntfy = Ntfy("https://example.com", mock_ws_messages)
+
+    messages = [
+        n.message
+        async for n in ntfy.stream(["test1"], buffer_size=2, overflow=overflow)
+    ]
+
+    assert messages == expected
+
+
+async def test_stream_overflow_raise(mock_ws_messages: AsyncMock) -> None:
+    """Test the stream ends with an error when the buffer overflows."""
+
+    ntfy = Ntfy("https://example.com", mock_ws_messages)
+    stream = ntfy.stream(["test1"], buffer_size=2, overflow=QueueFullPolicy.RAISE)
+
+    assert (await anext(stream)).message == "0"
+    assert (await anext(stream)).message == "1"
+    with pytest.raises(NtfyQueueFullError):
+        await anext(stream)
+
+
+async def test_stream_connection_error(mock_ws: AsyncMock) -> None:
+    """Test errors of the websocket connection are raised to the consumer."""
+
+    mock_ws.ws_connect.side_effect = ClientError
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    with pytest.raises(NtfyConnectionError):
+        async for _ in ntfy.stream(["test1"]):
+            pass
+
+
+async def test_stream_invalid_buffer_size(mock_ws: AsyncMock) -> None:
+    """Test the buffer size must be positive."""
+
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    with pytest.raises(ValueError, match="buffer_size"):
+        async for _ in ntfy.stream(["test1"], buffer_size=0):
+            pass
+
+
+async def test_stream_parse_error(mock_ws: AsyncMock) -> None:
+    """Test errors other than NtfyException are raised to the consumer."""
+
+    ws = mock_ws.ws_connect.return_value.__aenter__.return_value
+    ws.__aiter__.return_value = [MagicMock(type=WSMsgType.TEXT, data="not json")]
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    with pytest.raises(orjson.JSONDecodeError):
+        await asyncio.wait_for(anext(ntfy.stream(["test1"])), 1)
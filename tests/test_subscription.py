@@ -0,0 +1,253 @@
+"""Tests for the subscription manager."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohttp import ClientError, WSMsgType
+import pytest
+from yarl import URL
+
+from aiontfy import Notification, Ntfy, SubscriptionManager
+from aiontfy.exceptions import NtfyForbiddenAccessError
+
+from .conftest import MSG
+
+
+def subscribed(mock_ws: AsyncMock) -> list[str]:
+    """Return the topics of the opened websocket connections."""
+    return [call.args[0].parts[1] for call in mock_ws.ws_connect.call_args_list]
+
+
+async def test_subscription_manager(mock_ws: AsyncMock) -> None:
+    """Test topics are multiplexed and notifications routed to their handlers."""
+
+    mock_ws.ws_connect.side_effect = [
+        mock_ws.ws_connect.return_value,
+        AsyncMock(),
+        AsyncMock(),
+    ]
+    ntfy = Ntfy("https://example.com", mock_ws)
+    handlers = {topic: MagicMock() for topic in ("a", "b", "c", "d", "test1")}
+    received: list[Notification] = []
+
+    async def async_handler(notification: Notification) -> None:
+        received.append(notification)
+
+    async with SubscriptionManager(ntfy, topics_per_connection=2) as manager:
+        for topic, handler in handlers.items():
+            manager.add(topic, handler)
+        manager.add("test1", async_handler)
+        await manager.flush()
+        await asyncio.sleep(0.01)
+
+        assert manager.topics == {"a", "b", "c", "d", "test1"}
+        assert manager.connections == [{"a", "b"}, {"c", "d"}, {"test1"}]
+
+    mock_ws.request.assert_called_once_with(
+        "GET", URL("https://example.com/a,b,c,d,test1/auth")
+    )
+    assert subscribed(mock_ws) == ["a,b", "c,d", "test1"]
+    handlers["test1"].assert_called_once_with(Notification.from_json(MSG))
+    handlers["a"].assert_not_called()
+    assert received == [Notification.from_json(MSG)]
+
+
+async def test_subscription_manager_batch(mock_ws: AsyncMock) -> None:
+    """Test changes are batched before reconnecting."""
+
+    mock_ws.ws_connect.return_value.__aenter__.side_effect = asyncio.Event().wait
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    async with SubscriptionManager(
+        ntfy, topics_per_connection=3, batch_delay=0.01
+    ) as manager:
+        for topic in ("a", "b", "c", "d"):
+            manager.add(topic, MagicMock())
+        await asyncio.sleep(0.05)
+        assert subscribed(mock_ws) == ["a,b,c", "d"]
+
+        manager.remove("b")
+        manager.add("e", MagicMock())
+        manager.add("f", MagicMock())
+        await asyncio.sleep(0.05)
+
+        assert subscribed(mock_ws) == ["a,b,c", "d", "a,c,e", "d,f"]
+        assert manager.connections == [{"a", "c", "e"}, {"d", "f"}]
+        assert manager.reconnects == 2
+        assert mock_ws.request.call_count == 2
+
+
+async def test_subscription_manager_remove(mock_ws: AsyncMock) -> None:
+    """Test topics are unsubscribed when their last handler is removed."""
+
+    ntfy = Ntfy("https://example.com", mock_ws)
+    handler = MagicMock()
+
+    async with SubscriptionManager(ntfy) as manager:
+        manager.add("a", handler)
+        manager.add("a", MagicMock())
+        manager.add("b", MagicMock())
+        await manager.flush()
+        await asyncio.sleep(0)
+
+        manager.remove("a", handler)
+        await manager.flush()
+        assert manager.connections == [{"a", "b"}]
+
+        manager.remove("a")
+        manager.remove("b")
+        await manager.flush()
+        assert manager.topics == set()
+        assert manager.connections == []
+
+    assert subscribed(mock_ws) == ["a,b"]
+
+
+async def test_subscription_manager_forbidden(mock_ws: AsyncMock) -> None:
+    """Test added topics are dropped if access is denied."""
+
+    mock_ws.request.return_value.__aenter__.return_value.status = 403
+    mock_ws.request.return_value.__aenter__.return_value.json.return_value = {
+        "code": 40301,
+        "http": 403,
+        "error": "forbidden",
+    }
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    async with SubscriptionManager(ntfy) as manager:
+        manager.add("a", MagicMock())
+
+        with pytest.raises(NtfyForbiddenAccessError):
+            await manager.flush()
+
+        assert manager.topics == set()
+    mock_ws.ws_connect.assert_not_called()
+
+
+async def test_subscription_manager_handler_error(mock_ws: AsyncMock) -> None:
+    """Test handler errors are reported and other handlers still run."""
+
+    ntfy = Ntfy("https://example.com", mock_ws)
+    on_error = MagicMock()
+    handler = MagicMock()
+
+    async with SubscriptionManager(ntfy, on_error=on_error) as manager:
+        manager.add("test1", MagicMock(side_effect=ValueError))
+        manager.add("test1", handler)
+        await manager.flush()
+        await asyncio.sleep(0.01)
+
+    handler.assert_called_once()
+    on_error.assert_called_once()
+    assert isinstance(on_error.call_args.args[0], ValueError)
+
+
+async def test_subscription_manager_close(mock_ws: AsyncMock) -> None:
+    """Test closing cancels open connections."""
+
+    mock_ws.ws_connect.return_value.__aenter__.side_effect = asyncio.Event().wait
+    ntfy = Ntfy("https://example.com", mock_ws)
+    manager = SubscriptionManager(ntfy)
+    manager.add("a", MagicMock())
+    await manager.flush()
+    await asyncio.sleep(0)
+
+    await manager.close()
+
+    assert manager.connections == []
+
+
+async def test_subscription_manager_resume(mock_ws: AsyncMock) -> None:
+    """Test reconnects resume after the last received message."""
+
+    mock_ws.ws_connect.side_effect = [
+        mock_ws.ws_connect.return_value,
+        AsyncMock(),
+        AsyncMock(),
+    ]
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    with patch("aiontfy.subscription.time", return_value=1743184726):
+        async with SubscriptionManager(ntfy, batch_delay=0.01) as manager:
+            manager.add("test1", MagicMock())
+            await manager.flush()
+            await asyncio.sleep(0)
+
+            manager.add("b", MagicMock())
+            await manager.flush()
+            await asyncio.sleep(0)
+
+            manager.remove("b")
+            await manager.flush()
+            await asyncio.sleep(0)
+
+    assert [call.kwargs["params"] for call in mock_ws.ws_connect.call_args_list] == [
+        {},
+        {"since": "h6Y2hKA5sy0U"},
+        {"since": "h6Y2hKA5sy0U"},
+    ]
+
+
+async def test_subscription_manager_restart(
+    mock_ws: AsyncMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test failed connections are reconnected."""
+
+    open_connection = MagicMock()
+    open_connection.__aenter__ = AsyncMock(side_effect=asyncio.Event().wait)
+    mock_ws.ws_connect.side_effect = [ClientError, open_connection]
+    ntfy = Ntfy("https://example.com", mock_ws)
+
+    with patch("aiontfy.subscription.time", return_value=1743184726):
+        async with SubscriptionManager(ntfy, batch_delay=0.01) as manager:
+            manager.add("a", MagicMock())
+            await manager.flush()
+            await asyncio.sleep(0.05)
+
+            assert manager.connections == [{"a"}]
+
+    assert "Subscription failed" in caplog.text
+    assert [call.kwargs["params"] for call in mock_ws.ws_connect.call_args_list] == [
+        {},
+        {"since": "1743184726"},
+    ]
+
+
+async def test_subscription_manager_reconnect_keeps_handlers(
+    mock_ws: AsyncMock,
+) -> None:
+    """Test reconnecting for a topic change does not cancel running handlers."""
+
+    async def messages(*, first: bool) -> AsyncIterator[MagicMock]:
+        if first:
+            yield MagicMock(type=WSMsgType.TEXT, data=MSG)
+        await asyncio.Event().wait()
+
+    mock_ws.ws_connect.return_value.__aenter__.side_effect = lambda: MagicMock(
+        __aiter__=lambda _: messages(first=mock_ws.ws_connect.call_count == 1)
+    )
+    ntfy = Ntfy("https://example.com", mock_ws)
+    started = asyncio.Event()
+    release = asyncio.Event()
+    handled: list[Notification] = []
+
+    async def handler(notification: Notification) -> None:
+        started.set()
+        await release.wait()
+        handled.append(notification)
+
+    async with SubscriptionManager(ntfy, batch_delay=60) as manager:
+        manager.add("test1", handler)
+        await manager.flush()
+        await asyncio.wait_for(started.wait(), 1)
+
+        manager.add("b", MagicMock())
+        await manager.flush()
+        await asyncio.sleep(0)
+        assert manager.reconnects == 1
+
+        release.set()
+        await asyncio.sleep(0.01)
+
+    assert handled == [Notification.from_json(MSG)]
@@ -0,0 +1,80 @@
+"""Tests for the synchronous client."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiontfy import Message, SyncNtfy
+from aiontfy.exceptions import NtfyForbiddenAccessError
+
+from .conftest import MSG
+
+
+def test_sync_publish(mock_session: AsyncMock) -> None:
+    """Test publishing from synchronous code on the loop thread."""
+
+    threads: set[str] = set()
+
+    async def text() -> str:
+        threads.add(threading.current_thread().name)
+        return MSG
+
+    mock_session.request.return_value.__aenter__.return_value.text.side_effect = text
+    mock_session.closed = False
+
+    with SyncNtfy("http://example.com", session=mock_session) as ntfy:
+        for _ in range(3):
+            notification = ntfy.publish(Message(topic="mytopic"))
+            assert notification.id == "h6Y2hKA5sy0U"
+
+    assert threads == {"aiontfy-sync"}
+    assert mock_session.request.call_count == 3
+    mock_session.close.assert_awaited_once()
+
+
+def test_sync_stats_and_errors(mock_session: AsyncMock) -> None:
+    """Test responses and exceptions are passed to the caller."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = (
+        """{"messages":18,"messages_rate":0.007407407407407408}"""
+    )
+    ntfy = SyncNtfy("http://example.com", session=mock_session)
+
+    assert ntfy.stats().messages == 18
+
+    mock_session.request.return_value.__aenter__.return_value.status = 403
+    mock_session.request.return_value.__aenter__.return_value.json.return_value = {
+        "code": 40301,
+        "http": 403,
+        "error": "forbidden",
+    }
+    with pytest.raises(NtfyForbiddenAccessError):
+        ntfy.can_subscribe(["mytopic"])
+
+    ntfy.close()
+    ntfy.close()
+
+
+def test_sync_enqueue_flush(mock_session: AsyncMock) -> None:
+    """Test queued messages are published before closing."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    with SyncNtfy("http://example.com", session=mock_session) as ntfy:
+        assert ntfy.enqueue(Message(topic="mytopic"))
+        assert ntfy.enqueue(Message(topic="mytopic"))
+
+    assert mock_session.request.call_count == 2
+
+
+def test_sync_close_cancels_pending_tasks(mock_session: AsyncMock) -> None:
+    """Test tasks left on the event loop are cancelled when closing."""
+
+    ntfy = SyncNtfy("http://example.com", session=mock_session)
+    future = asyncio.run_coroutine_threadsafe(asyncio.sleep(60), ntfy._loop)
+
+    ntfy.close()
+
+    assert future.cancelled()
@@ -0,0 +1,65 @@
+"""Tests for message templates."""
+
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+from yarl import URL
+
+from aiontfy import Message, MessageTemplate, Notification, Ntfy, ViewAction
+
+from .conftest import MSG
+
+
+def test_render_template() -> None:
+    """Test rendering a template gives the same payload as the message."""
+
+    template = MessageTemplate(
+        Message(
+            topic="mytopic",
+            title="Default",
+            priority=4,
+            actions=[ViewAction(label="Open", url=URL("https://example.com/"))],
+        )
+    )
+
+    assert (
+        orjson.loads(template.render(message="Hello", tags=["octopus"]))
+        == Message(
+            topic="mytopic",
+            title="Default",
+            message="Hello",
+            tags=["octopus"],
+            priority=4,
+            actions=[ViewAction(label="Open", url=URL("https://example.com/"))],
+        ).to_dict()
+    )
+
+
+def test_template_validation() -> None:
+    """Test the template message is validated."""
+
+    with pytest.raises(ValueError, match="Priority must be between 1 and 5"):
+        MessageTemplate(Message(topic="mytopic", priority=6))
+
+
+async def test_publish_template(mock_session: AsyncMock) -> None:
+    """Test publishing a message from a template."""
+
+    mock_session.request.return_value.__aenter__.return_value.text.return_value = MSG
+
+    ntfy = Ntfy("http://example.com", mock_session, token="dXNlcjpwYXNz")  # noqa: S106
+    template = MessageTemplate(Message(topic="mytopic", title="Test"))
+
+    notification = await ntfy.publish_template(template, message="Hello")
+
+    assert isinstance(notification, Notification)
+    mock_session.request.assert_called_once_with(
+        "POST",
+        URL("http://example.com"),
+        data=template.render(message="Hello"),
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": "Bearer dXNlcjpwYXNz",
+        },
+    )
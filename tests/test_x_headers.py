@@ -0,0 +1,124 @@
+"""Tests for serializing messages as X- headers."""
+
+from yarl import URL
+
+from aiontfy import BroadcastAction, CopyAction, HttpAction, Message, ViewAction
+
+ACTIONS = [
+    ViewAction(label="Open", url=URL("https://example.com/"), clear=True),
+    HttpAction(
+        label="Close 'door'",
+        url=URL("https://api.example.com/close"),
+        headers={"Authorization": "Bearer x"},
+        body='{"a":1}',
+    ),
+    BroadcastAction(label="Take picture", extras={"cmd": "pic"}),
+    CopyAction(label="Copy", value="123"),
+]
+
+EXPECTED = {
+    "X-Message": "Line1\\nLine2\\\\",
+    "X-Title": "Title",
+    "X-Tags": "a,b",
+    "X-Priority": "4",
+    "X-Actions": "action='view', label='Open', url='https://example.com/', clear=1; action='http', label=\"Close 'door'\", url='https://api.example.com/close', method='POST', headers.Authorization='Bearer x', body='{\"a\":1}', clear=0; action='broadcast', label='Take picture', extras.cmd='pic', clear=0; action='copy', label='Copy', value='123', clear=0",
+    "X-Click": "https://example.com/click",
+    "X-Attach": "https://example.com/file.jpg",
+    "X-Markdown": "1",
+    "X-Icon": "https://example.com/icon.png",
+    "X-Filename": "file.jpg",
+    "X-Delay": "10m",
+    "X-Email": "a@b.c",
+    "X-Call": "+1234",
+    "X-Sequence-ID": "seq",
+}
+
+
+def test_to_x_headers() -> None:
+    """Test serializing a message with all fields as X- headers."""
+
+    message = Message(
+        topic="mytopic",
+        message="Line1\nLine2\\",
+        title="Title",
+        tags=["a", "b"],
+        priority=4,
+        actions=ACTIONS,
+        click=URL("https://example.com/click"),
+        attach=URL("https://example.com/file.jpg"),
+        markdown=True,
+        icon=URL("https://example.com/icon.png"),
+        filename="file.jpg",
+        delay="10m",
+        email="a@b.c",
+        call="+1234",
+        sequence_id="seq",
+    )
+
+    assert message.to_x_headers() == EXPECTED
+
+
+def test_to_x_headers_cached() -> None:
+    """Test headers are cached and callers get a copy."""
+
+    message = Message(topic="mytopic", title="Title", actions=ACTIONS)
+
+    headers = message.to_x_headers()
+    headers["Authorization"] = "Bearer x"
+
+    assert message.to_x_headers() == {
+        "X-Title": "Title",
+        "X-Actions": EXPECTED["X-Actions"],
+        "X-Markdown": "0",
+    }
+    assert message.to_x_headers() is not message.to_x_headers()
+    assert message == Message(topic="mytopic", title="Title", actions=ACTIONS)
+
+
+def test_to_x_headers_list_changes() -> None:
+    """Test changes to tags and actions are reflected in the headers."""
+
+    message = Message(topic="mytopic", tags=["a"])
+    assert message.to_x_headers()["X-Tags"] == "a"
+
+    message.tags.append("b")
+    message.actions.append(ACTIONS[3])
+    headers = message.to_x_headers()
+
+    assert headers["X-Tags"] == "a,b"
+    assert headers["X-Actions"] == "action='copy', label='Copy', value='123', clear=0"
+
+    message.tags.clear()
+    assert "X-Tags" not in message.to_x_headers()
+
+
+def test_action_to_x_header_reused() -> None:
+    """Test formatted actions are reused across messages."""
+
+    Message(topic="mytopic", actions=ACTIONS).to_x_headers()
+
+    assert ACTIONS[0].to_x_header() is ACTIONS[0].to_x_header()
+    assert (
+        ACTIONS[3].to_x_header() == "action='copy', label='Copy', value='123', clear=0"
+    )
+    assert ACTIONS[3].to_dict() == {
+        "action": "copy",
+        "label": "Copy",
+        "value": "123",
+        "clear": False,
+    }
+
+
+def test_action_to_x_header_dict_changes() -> None:
+    """Test changes to action dicts are reflected in the headers."""
+
+    action = HttpAction(
+        label="Open", url=URL("https://example.com/"), headers={"A": "1"}
+    )
+    message = Message(topic="mytopic", actions=[action])
+    assert "headers.A='1'" in message.to_x_headers()["X-Actions"]
+
+    assert action.headers is not None
+    action.headers["A"] = "2"
+
+    assert "headers.A='2'" in message.to_x_headers()["X-Actions"]